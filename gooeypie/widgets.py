@@ -3,11 +3,25 @@ from tkinter import ttk
 from tkinter import scrolledtext
 from tkinter import font
 from functools import partial
+from collections.abc import MutableMapping, Sequence
 from PIL import Image as PILImage, ImageTk
 import platform
+import os
 import datetime
 import calendar
 import re
+import itertools
+import array
+import bisect
+import numbers
+import time
+import csv
+import queue
+import threading
+import random
+import sqlite3
+import logging
+import mmap
 
 if platform.system() == 'Windows':
     OS = 'Windows'
@@ -18,11 +32,532 @@ elif platform.system() == 'Linux':
 else:
     OS = 'Other'
 
+# Bits of the state of a key or mouse event that are set while Control or Alt (Command on a Mac) is held down. Alt is
+# reported differently on Windows, where the Mod1 bit used for Alt elsewhere is set by Num Lock.
+_shift_modifier = 0x0001
+_command_modifiers = 0x0004 | (0x20000 if OS == 'Windows' else 0x0008)
+
 
 class GooeyPieError(Exception):
     pass
 
 
+_digits_pattern = re.compile(r'(\d+)')
+_word_pattern = re.compile(r'\w+')
+_number_pattern = re.compile(r'\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*')
+
+
+def _sort_key(value):
+    """Returns a key used to sort the values in a widget, so that numbers (including numbers stored as strings)
+    are sorted numerically and text is sorted ignoring case, with any numbers in the text sorted in natural order,
+    e.g. 'file2' before 'file10'. Values of different types are grouped rather than causing an error. NaN is sorted
+    after all other numbers, since it cannot be compared with them.
+    """
+    if isinstance(value, str):
+        # Only plain numbers are sorted as numbers, so text like 'nan', 'inf' and '1_000' is sorted as text
+        if _number_pattern.fullmatch(value):
+            return 0, float(value)
+        # Split into alternating text and digits, e.g. 'file10.txt' becomes ['file', 10, '.txt']
+        parts = _digits_pattern.split(value.casefold())
+        parts[1::2] = [int(part) for part in parts[1::2]]
+        return 1, parts
+    if isinstance(value, numbers.Real):
+        # NaN is the only value not equal to itself
+        return (0, value) if value == value else (0, float('inf'), 1)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return 2, value.isoformat()
+    if value is None:
+        return 4, ()
+    return 3, _sort_key(str(value))
+
+
+def _mousewheel_rows(event):
+    """Returns the number of rows to scroll for a mouse wheel event, which is reported differently on each platform"""
+    if event.num in (4, 5):
+        # Linux reports the mouse wheel as button 4 (up) and button 5 (down)
+        return -3 if event.num == 4 else 3
+    if OS == 'Mac':
+        return -event.delta
+    # Windows reports a delta of 120 for each notch of the mouse wheel
+    return -event.delta // 40
+
+
+def _tokens(value):
+    """Returns the words in a value, ignoring case, used to search the data in a Table"""
+    return _word_pattern.findall(str(value).casefold())
+
+
+def _trigrams(text):
+    """Returns the set of three character sequences in some text, used to find the items containing a query"""
+    return {text[start:start + 3] for start in range(len(text) - 2)}
+
+
+def _substring_rank(query, text):
+    """Ranks text that contains the query, or returns None if it does not. Text starting with the query is ranked
+    first, then text with a word starting with the query, then text with the query anywhere else. Lower ranks are
+    better."""
+    position = text.find(query)
+    if position < 0:
+        return None
+    if position == 0:
+        return 0, 0
+    return (1 if not text[position - 1].isalnum() else 2), position
+
+
+def _fuzzy_rank(query, text):
+    """Ranks text that contains all the characters of the query in order, or returns None if it does not. Matching
+    characters that follow each other or start words score highest, and gaps between matching characters reduce the
+    score. Lower ranks are better."""
+    score = 0
+    start = 0
+    previous = -2
+    for char in query:
+        position = text.find(char, start)
+        if position < 0:
+            return None
+        if position == previous + 1:
+            score += 3
+        elif position == 0 or not text[position - 1].isalnum():
+            score += 2
+        score -= min(position - start, 5) / 5
+        previous = position
+        start = position + 1
+    return -score, len(text)
+
+
+def _convert_value(value, column_type):
+    """Converts a value to the given type of a Table column
+
+    Args:
+        value: The value to convert
+        column_type (str): One of 'int', 'float', 'bool', 'date' or 'str', or None to leave the value unchanged
+
+    Raises:
+        ValueError: the value cannot be converted to the type
+    """
+    try:
+        if column_type == 'int':
+            if isinstance(value, float) and not value.is_integer():
+                raise ValueError
+            value = int(value)
+            if not -2 ** 63 <= value < 2 ** 63:
+                raise ValueError
+        elif column_type == 'float':
+            value = float(value)
+        elif column_type == 'bool':
+            if isinstance(value, str):
+                if value.casefold() not in ('true', 'false', 'yes', 'no', '1', '0'):
+                    raise ValueError
+                value = value.casefold() in ('true', 'yes', '1')
+            else:
+                value = bool(value)
+        elif column_type == 'date':
+            if isinstance(value, datetime.datetime):
+                value = value.date()
+            elif isinstance(value, str):
+                value = datetime.date.fromisoformat(value)
+            elif not isinstance(value, datetime.date):
+                raise ValueError
+        elif column_type == 'str':
+            value = str(value)
+    except (ValueError, TypeError):
+        raise ValueError(f'The value {value!r} is not a valid {column_type} value') from None
+    return value
+
+
+_character_widths = {}  # Widths in pixels of the characters measured in each font, by the attributes of the font
+
+
+def _text_width(text_font, widths, text):
+    """Estimates the width in pixels of text in a font by adding up the widths of its characters. Each character is
+    measured by Tk only the first time it is seen in the font.
+
+    Args:
+        text_font (font.Font): The font the text is shown in
+        widths (dict): The widths of the characters already measured in the font, from _character_widths
+        text (str): The text to measure
+    """
+    for character in set(text).difference(widths):
+        widths[character] = text_font.measure(character)
+    return sum(map(widths.__getitem__, text))
+
+
+class _TableRows(MutableMapping):
+    """The data of the rows of a Table by row id. Each row is kept as a list, except that the values in columns of
+    numbers, booleans and dates are stored in compact arrays rather than as a Python object for each value. Rows are
+    returned as new lists, and iterating gives the row ids in the order they were added.
+    """
+    _typecodes = {'int': 'q', 'float': 'd', 'bool': 'b', 'date': 'l'}
+    _decoders = {'bool': bool, 'date': datetime.date.fromordinal}
+    _encoders = {'date': datetime.date.toordinal}
+
+    def __init__(self, column_types):
+        self._rows = {}  # Values of each row by row id, with None in place of the values stored in the arrays
+        self._slots = {}  # Index in the arrays of each row id
+        self._free_slots = []  # Indexes in the arrays that are no longer used
+
+        # (column id, array, decoder, encoder) for each typed column
+        self._typed = [(column_id, array.array(self._typecodes[column_type]), self._decoders.get(column_type),
+                        self._encoders.get(column_type))
+                       for column_id, column_type in enumerate(column_types) if column_type in self._typecodes]
+
+    def __getitem__(self, row_id):
+        row = list(self._rows[row_id])
+        if self._typed:
+            slot = self._slots[row_id]
+            for column_id, column, decode, _ in self._typed:
+                row[column_id] = decode(column[slot]) if decode else column[slot]
+        return row
+
+    def __setitem__(self, row_id, row):
+        if not self._typed:
+            self._rows[row_id] = list(row)
+            return
+
+        slot = self._slots.get(row_id)
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = len(self._typed[0][1])
+                for _, column, _, _ in self._typed:
+                    column.append(0)
+            self._slots[row_id] = slot
+        row = list(row)
+        for column_id, column, _, encode in self._typed:
+            value = row[column_id]
+            column[slot] = encode(value) if encode else value
+            row[column_id] = None
+        self._rows[row_id] = row
+
+    def __delitem__(self, row_id):
+        del self._rows[row_id]
+        if self._typed:
+            self._free_slots.append(self._slots.pop(row_id))
+
+    def __contains__(self, row_id):
+        return row_id in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def clear(self):
+        self._rows.clear()
+        self._slots.clear()
+        self._free_slots.clear()
+        for _, column, _, _ in self._typed:
+            del column[:]
+
+    def column_items(self, column_id):
+        """Returns an iterator of (row id, value) pairs for a single column, without building each row"""
+        for typed_id, column, decode, _ in self._typed:
+            if typed_id == column_id:
+                if decode:
+                    return ((row_id, decode(column[slot])) for row_id, slot in self._slots.items())
+                return ((row_id, column[slot]) for row_id, slot in self._slots.items())
+        return ((row_id, row[column_id]) for row_id, row in self._rows.items())
+
+    def get_rows(self, row_ids):
+        """Returns a list of the rows with the given ids"""
+        if not self._typed:
+            rows = self._rows
+            return [list(rows[row_id]) for row_id in row_ids]
+        return [self[row_id] for row_id in row_ids]
+
+
+class _ArrayRows(MutableMapping):
+    """The data of the rows of a Table created from a NumPy array or pandas DataFrame. The columns of the source are
+    referenced rather than copied, and the id of each of its rows is its index. Values are only converted to Python
+    objects when rows are read, a page at a time. Rows that are added or changed later are stored separately.
+    """
+
+    def __init__(self, columns, column_types):
+        self.columns = columns  # One NumPy array for each column
+        self._count = len(columns[0]) if columns else 0
+        self._removed = set()  # Ids of source rows that have been removed
+        self._changed = {}  # Data of source rows that have been changed
+        self._added = _TableRows(column_types)  # Rows added after the table was created
+
+    @property
+    def unchanged(self):
+        """True if every row in the table is still a row of the source that has not been changed"""
+        return not self._changed and not self._added
+
+    def _in_source(self, row_id):
+        return 0 <= row_id < self._count and row_id not in self._removed
+
+    def __getitem__(self, row_id):
+        if row_id in self._changed:
+            return list(self._changed[row_id])
+        if self._in_source(row_id):
+            return [column[row_id:row_id + 1].tolist()[0] for column in self.columns]
+        return self._added[row_id]
+
+    def __setitem__(self, row_id, row):
+        if self._in_source(row_id):
+            self._changed[row_id] = list(row)
+        else:
+            self._added[row_id] = row
+
+    def __delitem__(self, row_id):
+        if self._in_source(row_id):
+            self._removed.add(row_id)
+            self._changed.pop(row_id, None)
+        else:
+            del self._added[row_id]
+
+    def __contains__(self, row_id):
+        return self._in_source(row_id) or row_id in self._added
+
+    def __iter__(self):
+        source_ids = (row_id for row_id in range(self._count) if row_id not in self._removed)
+        return itertools.chain(source_ids, self._added)
+
+    def __len__(self):
+        return self._count - len(self._removed) + len(self._added)
+
+    def column_items(self, column_id):
+        """Returns an iterator of (row id, value) pairs for a single column, without building each row"""
+        if self.unchanged and not self._removed:
+            return enumerate(self.columns[column_id].tolist())
+        return ((row_id, self[row_id][column_id]) for row_id in self)
+
+    def get_rows(self, row_ids):
+        """Returns a list of the rows with the given ids, converting the values of each column in one step"""
+        row_ids = list(row_ids)
+        if not self.unchanged or not row_ids:
+            return [self[row_id] for row_id in row_ids]
+        columns = [column[row_ids].tolist() for column in self.columns]
+        return [list(row) for row in zip(*columns)]
+
+
+class _ProviderRows(MutableMapping):
+    """The rows of a Table that shows data from a TableDataProvider. The id of each row is its index in the current
+    sort order of the provider. Rows are fetched a page at a time and the most recently used pages are kept. When a
+    page is read, the page after it is fetched in a background thread so that it is ready before it is scrolled to.
+    """
+    page_size = 100  # Number of rows fetched at a time
+    cached_pages = 50  # Number of pages kept
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.refresh()
+
+    def refresh(self):
+        """Forgets the rows fetched so far and counts the rows again, after the sort order or filter has changed"""
+        self._pages = {}  # Rows of each page, with the most recently used page last
+        self._prefetching = set()  # Numbers of the pages being fetched in the background
+        self._prefetched = queue.Queue()  # (page number, rows) pairs fetched in the background, replaced so that any
+        # pages still being fetched for the previous order are ignored
+        self._count = self.provider.count()
+
+    def __getitem__(self, row_id):
+        if row_id not in self:
+            raise KeyError(row_id)
+        return self._page(row_id // self.page_size)[row_id % self.page_size]
+
+    def __setitem__(self, row_id, row):
+        raise GooeyPieError('Rows cannot be changed when the table shows data from a data provider')
+
+    def __delitem__(self, row_id):
+        raise GooeyPieError('Rows cannot be removed when the table shows data from a data provider')
+
+    def __contains__(self, row_id):
+        return type(row_id) == int and 0 <= row_id < self._count
+
+    def __iter__(self):
+        return iter(range(self._count))
+
+    def __len__(self):
+        return self._count
+
+    def column_items(self, column_id):
+        raise GooeyPieError('Columns cannot be indexed when the table shows data from a data provider')
+
+    def get_rows(self, row_ids):
+        """Returns a list of the rows with the given ids, and starts fetching the next page in the background"""
+        row_ids = list(row_ids)
+        rows = [self[row_id] for row_id in row_ids]
+        if row_ids:
+            self._prefetch(row_ids[-1] // self.page_size + 1)
+        return rows
+
+    def _page(self, number):
+        """Returns the rows of a page, fetching them if they are not in the cache"""
+        self._collect_prefetched()
+        rows = self._pages.pop(number, None)
+        if rows is None:
+            rows = self.provider.fetch(number * self.page_size, self.page_size)
+        self._pages[number] = rows
+        if len(self._pages) > self.cached_pages:
+            del self._pages[next(iter(self._pages))]
+        return rows
+
+    def _prefetch(self, number):
+        """Fetches a page in a background thread if it is not already cached or being fetched"""
+        if number * self.page_size >= self._count or number in self._pages or number in self._prefetching:
+            return
+        self._prefetching.add(number)
+        threading.Thread(target=self._fetch_page, args=(number, self._prefetched), daemon=True).start()
+
+    def _fetch_page(self, number, prefetched):
+        """Fetches a page in a background thread. If it cannot be fetched, it is fetched again when it is needed,
+        which raises the error."""
+        try:
+            prefetched.put((number, self.provider.fetch(number * self.page_size, self.page_size)))
+        except Exception:
+            prefetched.put((number, None))
+
+    def _collect_prefetched(self):
+        """Adds the pages fetched in the background to the cache"""
+        while True:
+            try:
+                number, rows = self._prefetched.get_nowait()
+            except queue.Empty:
+                return
+            self._prefetching.discard(number)
+            if rows is not None:
+                self._pages.setdefault(number, rows)
+
+
+def _read_csv(file, header, column_types, chunks, stop, chunk_size=2000):
+    """Reads the rows of a CSV file in a background thread for Table.load_csv(). Rows are put on the chunks queue in
+    lists along with the number of bytes of the file read so far. The end of the file is marked by a position of None,
+    and if the file cannot be read, the rows read before the error and then the exception are put on the queue.
+    """
+    def put(item):
+        # Wait for the table to take earlier chunks, unless loading is cancelled
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    rows = []
+    try:
+        with file:
+            reader = csv.reader(file)
+            if header:
+                next(reader, None)
+            for row in reader:
+                if stop.is_set():
+                    return
+                if not row:
+                    continue  # Skip blank lines
+                if len(row) != len(column_types):
+                    raise ValueError(f'Line {reader.line_num} of the file has {len(row)} values, but the table has '
+                                     f'{len(column_types)} columns')
+                if any(column_types):
+                    try:
+                        row = [_convert_value(value, column_type) for value, column_type in zip(row, column_types)]
+                    except ValueError as error:
+                        raise ValueError(f'Line {reader.line_num} of the file: {error}') from None
+                rows.append(row)
+                if len(rows) == chunk_size:
+                    if not put((rows, file.buffer.tell())):
+                        return
+                    rows = []
+            put((rows, None))
+    except (OSError, ValueError, csv.Error) as error:
+        if not rows or put((rows, 0)):
+            put((error, None))
+
+
+def _write_csv(file, chunks, errors):
+    """Writes lists of rows from the chunks queue to a CSV file in a background thread for Table.save_csv(), until
+    None is received. Any error writing the file is added to the errors list."""
+    try:
+        with file:
+            writer = csv.writer(file)
+            while True:
+                rows = chunks.get()
+                if rows is None:
+                    return
+                writer.writerows(rows)
+    except (OSError, csv.Error) as error:
+        errors.append(error)
+
+
+class _Scrollbars:
+    """Shows and hides the scrollbars of a widget such as a Listbox, Table or Textbox. The content of the widget is
+    gridded in row 0, column 0 of its container, with the vertical scrollbar in column 1 and the horizontal
+    scrollbar in row 1.
+
+    The content reports its view through set_vertical() and set_horizontal(), used as its scroll commands, so a
+    scrollbar set to 'auto' is shown exactly when the content does not fit. The widgets are only regridded when a
+    scrollbar changes between hidden and shown, and any number of changes are combined into one update when the
+    window is next idle, so resizing a window does not recalculate its layout over and over.
+    """
+
+    def __init__(self, container, content, vertical=None, horizontal=None):
+        """
+        Args:
+            container: The container of the content and scrollbars, used to schedule updates
+            content: The widget that is scrolled
+            vertical: The vertical scrollbar, or None
+            horizontal: The horizontal scrollbar, or None
+        """
+        self._container = container
+        self._content = content
+        self._vertical = vertical
+        self._horizontal = horizontal
+        self.vertical_setting = 'auto'  # 'auto', 'visible' or 'hidden'. The horizontal scrollbar is always 'auto'
+        self._needed = [False, False]  # Whether the content does not fit vertically and horizontally
+        self._shown = None  # Whether the vertical and horizontal scrollbars are gridded, or None before the first update
+        self._update_id = None
+        self.update()
+
+    def set_vertical(self, first, last):
+        """Scroll command for the vertical view of the content"""
+        self._vertical.set(first, last)
+        self._set_needed(0, first, last)
+
+    def set_horizontal(self, first, last):
+        """Scroll command for the horizontal view of the content"""
+        self._horizontal.set(first, last)
+        self._set_needed(1, first, last)
+
+    def _set_needed(self, axis, first, last):
+        """Notes whether the content fits along an axis, updating the scrollbars if that has changed"""
+        needed = float(first) > 0 or float(last) < 1
+        if needed != self._needed[axis]:
+            self._needed[axis] = needed
+            self.update()
+
+    def update(self):
+        """Updates the scrollbars when the window is next idle"""
+        if self._update_id is None:
+            self._update_id = self._container.after_idle(self._update)
+
+    def _update(self):
+        """Grids the content and scrollbars if a scrollbar has changed between hidden and shown"""
+        self._update_id = None
+        vertical = self._vertical is not None and \
+            (self.vertical_setting == 'visible' or self.vertical_setting == 'auto' and self._needed[0])
+        horizontal = self._horizontal is not None and self._needed[1]
+        if (vertical, horizontal) == self._shown:
+            return
+        self._shown = (vertical, horizontal)
+
+        self._content.grid(row=0, column=0, sticky='nsew', columnspan=1 if vertical else 2,
+                           rowspan=1 if horizontal else 2)
+        for scrollbar, shown, options in ((self._vertical, vertical, {'row': 0, 'column': 1,
+                                                                      'rowspan': 1 if horizontal else 2}),
+                                          (self._horizontal, horizontal, {'row': 1, 'column': 0,
+                                                                          'columnspan': 1 if vertical else 2})):
+            if scrollbar is None:
+                continue
+            if shown:
+                scrollbar.grid(sticky='nsew', **options)
+            else:
+                scrollbar.grid_remove()
+
+
 class ContainerBase(ttk.Frame, ttk.LabelFrame):
     """Base class for Container and LabelContainer classes - provides functions for layout"""
 
@@ -805,37 +1340,6 @@ class GooeyPieWidget:
         """
         self._event(event_name)
 
-    def _textbox_change_event(self, event_name, key_code):
-        """To implement the change event on the Textbox widget
-
-        For the tkinter.ScrolledText widget, the <KeyRelease> event is bound to this method, which checks if the
-        contents of the widget have changed by interrogating the sentinel StringVar associated with it.
-
-        Note: <KeyRelease> is not exposed as a GooeyPie event, so no clashes are possible with other events.
-        """
-        if self.text != self._sentinel.get():
-            # Only process the event if the key release was a change in content, thus ignoring modifier keys etc
-            self._sentinel.set(self.text)
-            self.text = self._sentinel.get()  # just in case
-            self._event(event_name)
-
-    def _newtextbox_change_event(self, key_code):
-        """This event function is always set when a textbox is created, performing two functions:
-        1. Updates the scrollbar visibility if it is set to 'auto'
-        2. Handles the 'change' event if it has been set by the user
-        """
-
-        # Update the scrollbar if required
-        if self._scrollbar_visibility == 'auto':
-            self._update_scrollbar()
-
-        # If the user has set a change event, process the event
-        if self._events['change']:
-            # But only if the text has actually changed (i.e. ignore modifier keys)
-            if self.text != self._sentinel:
-                self._sentinel = self.text
-                self._event('change')
-
     def _date_change_event(self, event):
         """To implement the change event on the Date widget.
 
@@ -933,8 +1437,7 @@ class GooeyPieWidget:
             # Select event associated with Listboxes, Dropdowns and Tables
             if isinstance(self, Dropdown):
                 self.bind('<<ComboboxSelected>>', partial(self._event, event_name))
-            elif isinstance(self, (Table, Listbox)):
-                self._treeview.bind('<<TreeviewSelect>>', partial(self._event, event_name))
+            # Note: Tables and Listboxes always listen for <<TreeviewSelect>> and dispatch the select event themselves
 
     def remove_event_listener(self, event_name):
         """Removes an event listener from a widget. Has no effect if the event is not currently set.
@@ -990,7 +1493,7 @@ class GooeyPieWidget:
             if isinstance(self, Dropdown):
                 self.unbind('<<ComboboxSelected>>')
             elif isinstance(self, (Table, Listbox)):
-                self._treeview.unbind('<<TreeviewSelect>>')
+                self._events['select'] = None
 
     # All widgets can be enabled and disabled
     @property
@@ -1721,12 +2224,18 @@ class Secret(Input):
 
 class Listbox(Container, GooeyPieWidget):
     """Listbox widget"""
-    def __init__(self, container, items=()):
+    virtual_overscan = 2  # Number of items shown beyond the visible area in virtual mode
+    type_ahead_timeout = 1000  # Time in milliseconds after the last key press that the typed text is forgotten
+    filter_time_budget = 0.01  # Time in seconds spent scoring each batch of items when filtering
+
+    def __init__(self, container, items=(), sorted=False, unique=False):
         """Creates a new Listbox
 
         Args:
             container: The window or container to which the widget will be added
             items (list): Optional, a list of the items in the Listbox.
+            sorted (bool): Optional, keeps the items in sorted order. See the sorted property.
+            unique (bool): Optional, leaves out items that are already in the Listbox. See the unique property.
         """
         Container.__init__(self, container)
 
@@ -1738,22 +2247,78 @@ class Listbox(Container, GooeyPieWidget):
         self._treeview = ttk.Treeview(self, columns=('0',), show='tree', selectmode='browse')
         self._treeview.column('#0', width=0, minwidth=0, stretch=False)
 
-        # Create and configure scrollbar
+        # Create and configure scrollbar, which is added to the parent Container with the treeview when needed
         self._scrollbar = tk.Scrollbar(self, orient='vertical')
         self._scrollbar.config(command=self._treeview.yview)
-        self._treeview.config(yscrollcommand=self._scrollbar.set)
-        self._scrollbar_visible = 'auto'
-
-        # Add to parent Container
-        self._treeview.grid(row=0, column=0, sticky='nsew')
-        self._scrollbar.grid(row=0, column=1, sticky='nsew')
+        self._scrollbars = _Scrollbars(self, self._treeview, vertical=self._scrollbar)
+        self._treeview.config(yscrollcommand=self._scrollbars.set_vertical)
+
+        # The items are also kept in Python so that they can be counted and read without querying the treeview
+        self._item_ids = []  # Ids of the treeview items in order
+        self._item_values = {}  # Item shown by each treeview item
+        self._item_positions = {}  # Index of each item id in self._item_ids, or None until it is next needed
+
+        # Sorted and unique modes. The sort keys of the items are kept in order so that the position of a new item can
+        # be found with a binary search, and the items are kept in a set so that duplicates can be found quickly.
+        self._sorted = bool(sorted)
+        self._unique = bool(unique)
+        self._sort_keys = [] if self._sorted else None
+        self._item_set = set() if self._unique else None
+
+        # Typing while the listbox has focus selects the first item starting with the typed text. The items are found
+        # in a sorted list of (case-folded item, id) pairs, where the id is the treeview item id, or the index of the
+        # item in virtual mode. The list is built when it is first needed and kept up to date where possible.
+        self._prefix_index = None
+        self._typed_text = ''
+        self._typed_time = 0
+
+        # Filtering. Items are scored against the query a batch at a time and the matching items are shown, best match
+        # first. The case-folded text of each item, and the ids of the items containing each trigram (sequence of three
+        # characters), are worked out as items are scored and kept up to date as items change.
+        self._filter = None  # (query, mode) of the current filter
+        self._filter_shown = None  # Ids of the items shown while filtered, or their indexes in virtual mode
+        self._filter_results = None  # (query, mode, matches) of the last completed filter, used to narrow the next
+        self._filter_job = None  # Generator scoring the items against the current filter
+        self._filter_id = None  # Id of the scheduled call to score the next batch of items
+        self._filter_input = None  # (Input, trace id) of the Input set with bind_filter()
+        self._search_text = {}
+        self._trigram_index = {}
+
+        # Virtual mode. The items are kept in a sequence and only the visible items are shown in the treeview, using a
+        # pool of treeview items that are recycled
+        self._virtual = False
+        self._virtual_source = []  # Sequence of all items
+        self._virtual_source_copied = False  # Set when the sequence has been copied to a list that can be changed
+        self._virtual_pool = []  # Treeview items recycled to show the visible items
+        self._virtual_top = 0  # Index of the first visible item
+        self._virtual_selection = set()  # Indexes of the selected items
+        self._virtual_focus = None  # Index of the item most recently clicked on or navigated to with the keyboard
+        self._virtual_click = False  # Set when an item is clicked on without shift or control held down
+
+        # Bindings that are only active in virtual mode, added to the bindtags of the treeview when it is enabled
+        self._virtual_bindtag = f'VirtualListbox{id(self)}'
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self._treeview.bind_class(self._virtual_bindtag, sequence, self._virtual_mousewheel)
+        for sequence in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>'):
+            self._treeview.bind_class(self._virtual_bindtag, sequence, self._virtual_keypress)
+        self._treeview.bind_class(self._virtual_bindtag, '<ButtonPress-1>', self._virtual_mouse_down)
+        self._treeview.bind_class(self._virtual_bindtag, '<Configure>', self._virtual_render)
+
+        # Bindings used by the listbox itself, which do not interfere with any events bound to the treeview
+        self._listbox_bindtag = f'Listbox{id(self)}'
+        self._treeview.bind_class(self._listbox_bindtag, '<KeyPress>', self._type_ahead)
+        bindtags = list(self._treeview.bindtags())
+        bindtags.insert(bindtags.index('Treeview'), self._listbox_bindtag)
+        self._treeview.bindtags(bindtags)
 
         GooeyPieWidget.__init__(self, container)
         self._events['select'] = None
 
+        # The select event is processed by the listbox so that selections can be tracked in virtual mode
+        self._treeview.bind('<<TreeviewSelect>>', self._treeview_select)
+
         # Populate listbox
         self.items = items
-        self._treeview.bind('<Configure>', self._update_scrollbar)
 
     def __str__(self):
         return f"<Listbox widget>"
@@ -1761,46 +2326,17 @@ class Listbox(Container, GooeyPieWidget):
     def __repr__(self):
         return self.__str__()
 
-    def _update_scrollbar(self, _event=None):
-        """Updates the visibility of the scrollbar in response to resize events, changes to the contents
-        of the listbox and changes to the scrollbar setting using the scrollbar property.
-        The _event parameter is needed so it can be used as the 'Configure' callback, which is triggered when the
-        listbox changes size in response to a window resize event.
-        """
-        if self._scrollbar_visible == 'visible':
-            self._show_scrollbar()
-        elif self._scrollbar_visible == 'hidden':
-            self._hide_scrollbar()
-        else:
-            scrollbar_value = self._scrollbar.get()
-            if scrollbar_value == (0.0, 1.0) or scrollbar_value == (0.0, 0.0, 0.0, 0.0):
-                self._hide_scrollbar()
-            else:
-                self._show_scrollbar()
-
-    def _hide_scrollbar(self):
-        """Hides the scrollbar from the listbox"""
-        self._treeview.grid_remove()
-        self._treeview.grid(row=0, column=0, sticky='nsew', columnspan=2)
-        self._scrollbar.grid_remove()
-
-    def _show_scrollbar(self):
-        """Shows the scrollbar on the side of the listbox"""
-        self._treeview.grid_remove()
-        self._treeview.grid(row=0, column=0, sticky='nsew', columnspan=1)
-        self._scrollbar.grid()
-
     @property
     def scrollbar(self):
         """Gets or sets the scrollbar setting. Must be one of either 'auto', 'hidden' or 'visible'"""
-        return self._scrollbar_visible
+        return self._scrollbars.vertical_setting
 
     @scrollbar.setter
     def scrollbar(self, setting):
         if setting not in ('auto', 'visible', 'hidden'):
             raise ValueError("Invalid scrollbar option - must be set to 'auto', 'hidden' or 'visible'")
-        self._scrollbar_visible = setting
-        self._update_scrollbar()
+        self._scrollbars.vertical_setting = setting
+        self._scrollbars.update()
 
     @property
     def height(self):
@@ -1810,6 +2346,8 @@ class Listbox(Container, GooeyPieWidget):
     @height.setter
     def height(self, lines):
         self._treeview.configure(height=lines)
+        if self._virtual:
+            self._virtual_render()
 
     @property
     def width(self):
@@ -1822,20 +2360,105 @@ class Listbox(Container, GooeyPieWidget):
             raise ValueError('Width must be a positive integer')
         self._treeview.column(0, width=pixels)
 
+    @property
+    def virtual(self):
+        """Gets or sets whether the Listbox is in virtual mode
+
+        In virtual mode, the items are kept in a Python sequence and only the items in view are added to the
+        listbox, so that lists of millions of items can be shown without slowing down. The items can be set to any
+        sequence, including one that works out each item only when it is read. Items are still selected, added and
+        removed using their index.
+        """
+        return self._virtual
+
+    @virtual.setter
+    def virtual(self, value):
+        value = bool(value)
+        if value == self._virtual:
+            return
+
+        # Move the existing items across to the new mode
+        items = self.items
+        self.clear()
+        self._virtual = value
+
+        bindtags = list(self._treeview.bindtags())
+        if value:
+            # The scrollbar scrolls through the items rather than the treeview
+            self._treeview.config(yscrollcommand='')
+            self._scrollbar.config(command=self._virtual_yview)
+            bindtags.insert(bindtags.index('Treeview'), self._virtual_bindtag)
+        else:
+            self._treeview.config(yscrollcommand=self._scrollbars.set_vertical)
+            self._scrollbar.config(command=self._treeview.yview)
+            bindtags.remove(self._virtual_bindtag)
+        self._treeview.bindtags(bindtags)
+
+        self.items = items
+
+    @property
+    def sorted(self):
+        """Gets or sets whether the items are kept in sorted order
+
+        Items are sorted ignoring case, with numbers in natural order, e.g. 'item 2' before 'item 10'. Items added to a
+        sorted listbox are placed in order rather than at the index given, and an item that is changed is moved to its
+        place in the order. Setting sorted to True sorts the existing items.
+        """
+        return self._sorted
+
+    @sorted.setter
+    def sorted(self, value):
+        value = bool(value)
+        if value != self._sorted:
+            self._sorted = value
+            self.items = self.items
+
+    @property
+    def unique(self):
+        """Gets or sets whether each item can only be in the listbox once
+
+        Adding an item that is already in a unique listbox has no effect. Setting unique to True removes any duplicate
+        items, keeping the first of each.
+        """
+        return self._unique
+
+    @unique.setter
+    def unique(self, value):
+        value = bool(value)
+        if value != self._unique:
+            self._unique = value
+            self.items = self.items
+
     @property
     def items(self):
         """Gets or sets all data in the table as a list of lists"""
-        return [self._treeview.item(line)['values'][0] for line in self._treeview.get_children()]
+        if self._virtual:
+            return list(self._virtual_source)
+        return [self._item_values[item_id] for item_id in self._item_ids]
 
     @items.setter
     def items(self, values):
-        if type(values) not in (list, tuple):
+        if self._virtual:
+            # Any sequence can be used in virtual mode, and is only copied if items are added or removed
+            if not isinstance(values, Sequence) or isinstance(values, str):
+                raise ValueError('Listbox items must be a sequence, such as a list or tuple')
+        elif type(values) not in (list, tuple):
             raise ValueError('Listbox items must be lists or tuples')
 
         self.clear()
-        for item in values:
-            self._treeview.insert('', 'end', values=(item,))
-        self._update_scrollbar()
+        if self._virtual:
+            self._virtual_source = values
+            self._virtual_source_copied = False
+            if self._sorted or self._unique:
+                # The items are copied so that they can be sorted or have duplicates removed
+                self._virtual_source = self._new_items(list(values))
+                self._virtual_source_copied = True
+                if self._sorted:
+                    self._sort_keys = [_sort_key(item) for item in self._virtual_source]
+            self._virtual_render()
+            self._refilter()
+            return
+        self.add_items(values)
 
     @property
     def multiple_selection(self):
@@ -1857,18 +2480,26 @@ class Listbox(Container, GooeyPieWidget):
         """Gets or sets the item(s), starting from 0, of the currently selected line. Returns None
         if nothing is selected. Returns a list of items if multiple selections are enabled.
         """
+        if self._virtual:
+            indexes = sorted(self._virtual_selection)
+            if not indexes:
+                return None
+            if self.multiple_selection:
+                return [self._virtual_source[index] for index in indexes]
+            return self._virtual_source[indexes[0]]
+
         selected_ids = self._treeview.selection()
         if not selected_ids:
             return None
         if self.multiple_selection:
-            return [self._treeview.item(row_id)['values'][0] for row_id in selected_ids]
+            return [self._item_values[row_id] for row_id in selected_ids]
         else:
-            return self._treeview.item(selected_ids[0])['values'][0]
+            return self._item_values[selected_ids[0]]
 
     @selected.setter
     def selected(self, value):
         """Sets the value at the current selection. Raises an error if zero or multiple items are selected"""
-        selected_ids = self._treeview.selection()
+        selected_ids = self._virtual_selection if self._virtual else self._treeview.selection()
         if len(selected_ids) > 1:
             raise ValueError('Cannot set value when multiple items in the listbox are selected')
         if len(selected_ids) == 0:
@@ -1880,46 +2511,546 @@ class Listbox(Container, GooeyPieWidget):
         else:
             selected_index = self.selected_index
 
-        # change the selected item
-        updated_items = self.items
-        updated_items[selected_index] = value
-        self.items = updated_items
-        self.selected_index = selected_index
+        self.set_item(selected_index, value)
 
     @property
     def selected_index(self):
         """Gets or sets the index(es), starting from 0, of the selected line. Returns None if nothing
         is selected. Returns a list of indexes if multiple selections are enabled.
         """
+        if self._virtual:
+            indexes = sorted(self._virtual_selection)
+            if not indexes:
+                return None
+            return indexes if self.multiple_selection else indexes[0]
+
         selected_ids = self._treeview.selection()
-        all_ids = self._treeview.get_children()
 
         if not selected_ids:
             return None
         if self.multiple_selection:
-            return [all_ids.index(selected) for selected in selected_ids]
+            return [self._item_position(selected) for selected in selected_ids]
         else:
-            return all_ids.index(selected_ids[0])
+            return self._item_position(selected_ids[0])
 
     @selected_index.setter
     def selected_index(self, index):
         """Adds to the current selection if multiple selection is set"""
-        all_rows = self._treeview.get_children()
-        if len(self._treeview.get_children()) == 0:
+        count = self._item_count()
+        if count == 0:
             raise ValueError(f'No items in Listbox to select')
-        if index not in range(len(all_rows)):
-            raise ValueError(f'The index must be in the range 0 to {len(all_rows) - 1}. '
+        if index not in range(count):
+            raise ValueError(f'The index must be in the range 0 to {count - 1}. '
                              f'The value of the index specified was {index}.')
 
+        if self._virtual:
+            selection = list(self._virtual_selection) if self.multiple_selection else []
+            self._virtual_select(selection + [index])
+            self._virtual_see(index)
+            return
+
         # Clear the current selection if single selection only
         if not self.multiple_selection:
             self.select_none()
 
         # Select the item specified by the index
-        item_id = all_rows[index]
+        item_id = self._item_ids[index]
         self._treeview.selection_add(item_id)
         self._treeview.see(item_id)  # Show the selected row (in case it is not be in view)
 
+    def _treeview_select(self, tk_event):
+        """Processes the select event when the selection in the treeview changes
+
+        In virtual mode, the selection of the visible items is merged into the selection of all items. The select
+        event is only processed if that has changed, and not when the visible items are simply redrawn.
+        """
+        if self._virtual:
+            top = self._virtual_top
+            shown = dict(zip(self._virtual_pool, self._virtual_shown()[top:top + len(self._virtual_pool)]))
+            chosen = {shown[item] for item in self._treeview.selection() if item in shown}
+            if self._virtual_click or (chosen and not self.multiple_selection):
+                selection = chosen
+            else:
+                # Keep any selected items that are scrolled out of view
+                selection = (self._virtual_selection - set(shown.values())) | chosen
+            self._virtual_click = False
+
+            if self._treeview.focus() in shown:
+                self._virtual_focus = shown[self._treeview.focus()]
+            if selection == self._virtual_selection:
+                return
+            self._virtual_selection = selection
+
+        if self._events['select']:
+            self._event('select', tk_event)
+
+    def find_prefix(self, prefix):
+        """Finds the first item in the listbox that starts with the given text, ignoring case. The items starting with
+        the text are looked up in a sorted index, so only they are checked, even in very long lists.
+
+        Args:
+            prefix (str): The text to search for
+
+        Returns:
+            The index of the item, or None if no item starts with the text
+        """
+        item_id = self._find_prefix_id(prefix)
+        if item_id is None or self._virtual:
+            return item_id
+        return self._item_position(item_id)
+
+    def _find_prefix_id(self, prefix):
+        """Returns the id in the prefix index of the first item in the listbox starting with the given text, or None"""
+        prefix = str(prefix).casefold()
+        index = self._prefix_lookup()
+        start = bisect.bisect_left(index, (prefix,))
+        if not prefix:
+            end = len(index)
+        else:
+            # The entries starting with the prefix come before the first entry starting with the text after it
+            end = bisect.bisect_left(index, (prefix[:-1] + chr(ord(prefix[-1]) + 1),), start)
+        if start == end:
+            return None
+
+        # When many items start with the prefix, one is usually near the start of the listbox, so the first few items
+        # are checked before finding the position of every match
+        total = self._item_count()
+        checked = min(end - start, 4 * total // (end - start))
+        if self._virtual:
+            shown = enumerate(itertools.islice(self._virtual_source, checked))
+        else:
+            shown = ((item_id, self._item_values[item_id]) for item_id in itertools.islice(self._item_ids, checked))
+        for item_id, item in shown:
+            if str(item).casefold().startswith(prefix):
+                return item_id
+
+        # The id is the index of the item in a virtual listbox
+        matches = (item_id for _, item_id in itertools.islice(index, start, end))
+        return min(matches, key=None if self._virtual else self._item_position)
+
+    def _item_position(self, item_id):
+        """Returns the index of the item with the given treeview id. The index of every item is found in one step
+        the first time one is needed after items have been inserted, moved or removed anywhere but at the end."""
+        if self._item_positions is None:
+            self._item_positions = dict(zip(self._item_ids, itertools.count()))
+        return self._item_positions[item_id]
+
+    def _type_ahead(self, event):
+        """Selects the first item starting with the text typed while the listbox has focus"""
+        if not event.char or not event.char.isprintable() or event.state & _command_modifiers:
+            return
+        if self._filter_shown is not None:
+            # Hidden items cannot be selected by typing
+            return
+        if event.time - self._typed_time > self.type_ahead_timeout:
+            self._typed_text = ''
+        self._typed_text += event.char
+        self._typed_time = event.time
+
+        # The id is the index of the item in a virtual listbox, and its treeview item id otherwise
+        item_id = self._find_prefix_id(self._typed_text)
+        if item_id is None:
+            return
+        if self._virtual:
+            self._virtual_select([item_id])
+            self._virtual_see(item_id)
+        else:
+            self._treeview.selection_set(item_id)
+            self._treeview.focus(item_id)
+            self._treeview.see(item_id)
+        return 'break'
+
+    def _prefix_lookup(self):
+        """Returns the sorted list of (case-folded item, id) pairs used to find items by prefix, building it first if
+        needed"""
+        if self._prefix_index is None:
+            if self._virtual:
+                pairs = ((str(item).casefold(), index) for index, item in enumerate(self._virtual_source))
+            else:
+                pairs = ((str(self._item_values[item_id]).casefold(), item_id) for item_id in self._item_ids)
+            self._prefix_index = sorted(pairs)
+        return self._prefix_index
+
+    def _index_item(self, item, item_id):
+        """Adds an item to the prefix index, if it has been built. Items are added to the trigram index when they are
+        first scored against a filter."""
+        if self._prefix_index is not None:
+            bisect.insort(self._prefix_index, (str(item).casefold(), item_id))
+
+    def _unindex_item(self, item, item_id):
+        """Removes an item from the prefix and trigram indexes"""
+        if self._prefix_index is not None:
+            entry = (str(item).casefold(), item_id)
+            position = bisect.bisect_left(self._prefix_index, entry)
+            if position < len(self._prefix_index) and self._prefix_index[position] == entry:
+                del self._prefix_index[position]
+        text = self._search_text.pop(item_id, None)
+        if text is not None:
+            for trigram in _trigrams(text):
+                self._trigram_index[trigram].discard(item_id)
+
+    def _drop_indexes(self):
+        """Discards the prefix and trigram indexes, which are built again when needed. Used when the listbox is cleared,
+        and in virtual mode when items are added or removed before the end, which changes the indexes of the items
+        after them."""
+        self._prefix_index = None
+        self._search_text = {}
+        self._trigram_index = {}
+
+    def bind_filter(self, input_widget, mode='substring'):
+        """Filters the items as text is typed into an Input, so that the listbox can be used as a picker or command
+        palette. Only the items that match the text are shown, best match first. See filter() for more details.
+
+        Args:
+            input_widget (Input): The Input containing the text to search for, or None to stop filtering as text is
+                typed into an Input and show all items
+            mode (str): Either 'substring' (the default) or 'fuzzy'
+
+        Raises:
+            TypeError: input_widget is not an Input
+            ValueError: mode is not 'substring' or 'fuzzy'
+        """
+        if input_widget is not None and not isinstance(input_widget, Input):
+            raise TypeError(f'The filter must be bound to an Input widget. The value given was {input_widget}')
+        if mode not in ('substring', 'fuzzy'):
+            raise ValueError(f"The filter mode must be 'substring' or 'fuzzy'. The value given was '{mode}'")
+
+        if self._filter_input:
+            bound_input, observer = self._filter_input
+            bound_input._value.trace_vdelete('w', observer)
+            self._filter_input = None
+
+        if input_widget is None:
+            self.filter(None)
+        else:
+            observer = input_widget._value.trace('w', partial(self._input_changed, input_widget, mode))
+            self._filter_input = (input_widget, observer)
+            self.filter(input_widget.text, mode)
+
+    def _input_changed(self, input_widget, mode, *args):
+        """Filters the items when the text in the Input set with bind_filter() changes"""
+        self.filter(input_widget.text, mode)
+
+    def filter(self, query, mode='substring'):
+        """Shows only the items that match a query, best match first. Hidden items are still part of the listbox and
+        keep their indexes, but any that are selected are deselected.
+
+        The items are scored a batch at a time so that the window stays responsive with long lists, and the matching
+        items are shown once all have been scored. When the query extends the previous query, as it does while the
+        query is typed, only the items that matched the previous query are scored.
+
+        Args:
+            query (str): The text to search for, ignoring case. None or an empty string shows all items.
+            mode (str): Either 'substring' (the default), which matches items containing the query, or 'fuzzy', which
+                matches items containing the characters of the query in order, e.g. 'lbx' matches 'Listbox'.
+
+        Raises:
+            TypeError: query is not a string or None
+            ValueError: mode is not 'substring' or 'fuzzy'
+        """
+        if query is not None and type(query) != str:
+            raise TypeError(f'The filter must be a string. The value given was {query}')
+        if mode not in ('substring', 'fuzzy'):
+            raise ValueError(f"The filter mode must be 'substring' or 'fuzzy'. The value given was '{mode}'")
+
+        self._filter = (query.casefold(), mode) if query else None
+        self._start_filter()
+
+    def _start_filter(self):
+        """Starts scoring the items against the current filter, or shows all items if there is no filter"""
+        self._cancel_filter()
+        if not self._filter:
+            self._show_filter_results(None)
+            return
+
+        # Items that do not match the previous query cannot match a query that extends it
+        query, mode = self._filter
+        candidates = None
+        if self._filter_results:
+            previous_query, previous_mode, matches = self._filter_results
+            extends = previous_query in query if mode == 'substring' else query.startswith(previous_query)
+            if mode == previous_mode and extends:
+                candidates = [(position, item_id) for rank, position, item_id in matches]
+
+        self._filter_job = self._score_items(query, mode, candidates)
+        self._continue_filter()
+
+    def _continue_filter(self):
+        """Scores the next batch of items against the filter, and schedules the following batch for when the window is
+        next idle. The matching items are shown once all items have been scored."""
+        self._filter_id = None
+        deadline = time.perf_counter() + self.filter_time_budget
+        try:
+            while time.perf_counter() < deadline:
+                next(self._filter_job)
+        except StopIteration as finished:
+            self._filter_job = None
+            self._filter_results = self._filter + (finished.value,)
+            self._show_filter_results([item_id for rank, position, item_id in finished.value])
+            return
+        self._filter_id = self.after_idle(self._continue_filter)
+
+    def _cancel_filter(self):
+        """Stops scoring items against the filter"""
+        if self._filter_id:
+            self.after_cancel(self._filter_id)
+            self._filter_id = None
+        self._filter_job = None
+
+    def _refilter(self):
+        """Scores all items against the filter again once the window is idle, after items have been changed"""
+        if self._filter:
+            self._cancel_filter()
+            self._filter_results = None
+            self._filter_id = self.after_idle(self._start_filter)
+
+    def _score_items(self, query, mode, candidates=None):
+        """Generator that scores items against a query, yielding after every few items so that the scoring can be
+        spread out over time. Returns a list of (rank, position, id) of the matching items, best match first.
+
+        Args:
+            query (str): The case-folded query
+            mode (str): Either 'substring' or 'fuzzy'
+            candidates: A list of (position, id) of the items to score, or None to score all items
+        """
+        rank = _substring_rank if mode == 'substring' else _fuzzy_rank
+        containing = None
+        if candidates is None:
+            if mode == 'substring' and len(query) >= 3 and len(self._search_text) == self._item_count():
+                # Every item is in the trigram index, so only the items containing all the trigrams in the query
+                # need to be scored
+                postings = sorted((self._trigram_index.get(trigram, set()) for trigram in _trigrams(query)), key=len)
+                containing = postings[0].intersection(*postings[1:])
+                if self._virtual:
+                    candidates = [(index, index) for index in sorted(containing)]
+                    containing = None
+            if candidates is None:
+                if self._virtual:
+                    candidates = zip(itertools.count(), range(len(self._virtual_source)))
+                else:
+                    candidates = enumerate(self._item_ids)
+
+        matches = []
+        for count, (position, item_id) in enumerate(candidates):
+            if count % 200 == 0:
+                yield
+            if containing is not None and item_id not in containing:
+                continue
+            text = self._search_text.get(item_id)
+            if text is None:
+                text = self._index_search_text(item_id)
+            item_rank = rank(query, text)
+            if item_rank is not None:
+                matches.append((item_rank, position, item_id))
+        matches.sort()
+        return matches
+
+    def _index_search_text(self, item_id):
+        """Adds the case-folded text of an item to the trigram index, and returns the text"""
+        item = self._virtual_source[item_id] if self._virtual else self._item_values[item_id]
+        text = str(item).casefold()
+        self._search_text[item_id] = text
+        for trigram in _trigrams(text):
+            self._trigram_index.setdefault(trigram, set()).add(item_id)
+        return text
+
+    def _show_filter_results(self, shown):
+        """Shows only the given items, in order, or all items if shown is None. In normal mode, the items in the
+        treeview are detached and reattached rather than being added again."""
+        if shown is None and self._filter_shown is None:
+            return
+        self._filter_shown = shown
+
+        if self._virtual:
+            selection = self._virtual_selection if shown is None else self._virtual_selection & set(shown)
+            changed = selection != self._virtual_selection
+            self._virtual_selection = selection
+            self._virtual_top = 0
+            self._virtual_render()
+            if changed and self._events['select']:
+                self._event('select')
+            return
+
+        if shown is None:
+            self._treeview.set_children('', *self._item_ids)
+        else:
+            shown_ids = set(shown)
+            hidden_selection = [item_id for item_id in self._treeview.selection() if item_id not in shown_ids]
+            if hidden_selection:
+                self._treeview.selection_remove(*hidden_selection)
+            self._treeview.set_children('', *shown)
+        self._treeview.yview_moveto(0)
+
+    def _item_count(self):
+        """Returns the number of items in the listbox"""
+        return len(self._virtual_source) if self._virtual else len(self._item_ids)
+
+    def _virtual_items(self):
+        """Returns the items in virtual mode as a list that can be changed. The sequence the items were set to is
+        copied the first time, so that it is not changed."""
+        if not self._virtual_source_copied:
+            self._virtual_source = list(self._virtual_source)
+            self._virtual_source_copied = True
+        return self._virtual_source
+
+    def _virtual_shown(self):
+        """Returns the indexes of the items shown in virtual mode, which are all the items unless they are filtered"""
+        return range(len(self._virtual_source)) if self._filter_shown is None else self._filter_shown
+
+    def _virtual_page_size(self):
+        """Returns the number of items that fit in the visible area of the listbox in virtual mode"""
+        if self._virtual_pool and self._treeview.winfo_ismapped():
+            bbox = self._treeview.bbox(self._virtual_pool[0])
+            if bbox:
+                x, y, width, height = bbox
+                return max(1, (self._treeview.winfo_height() - y) // height)
+
+        # Before the listbox is shown, use the height setting of the listbox
+        return int(self._treeview.cget('height'))
+
+    def _virtual_render(self, _event=None):
+        """Shows the visible items in virtual mode by recycling a small pool of treeview items. The _event parameter
+        is needed so that this can be used as the <Configure> callback when the listbox changes size.
+        """
+        page_size = self._virtual_page_size()
+        shown = self._virtual_shown()
+        self._virtual_top = max(0, min(self._virtual_top, len(shown) - page_size))
+        indexes = shown[self._virtual_top:self._virtual_top + page_size + self.virtual_overscan]
+
+        # Grow or shrink the pool of treeview items to match the number of items being shown
+        while len(self._virtual_pool) < len(indexes):
+            self._virtual_pool.append(self._treeview.insert('', 'end'))
+        if len(self._virtual_pool) > len(indexes):
+            self._treeview.delete(*self._virtual_pool[len(indexes):])
+            del self._virtual_pool[len(indexes):]
+
+        # Show each visible item and whether or not it is selected
+        selected_items = []
+        for tree_item, index in zip(self._virtual_pool, indexes):
+            self._treeview.item(tree_item, values=(self._virtual_source[index],))
+            if index in self._virtual_selection:
+                selected_items.append(tree_item)
+        if set(self._treeview.selection()) != set(selected_items):
+            self._treeview.selection_set(selected_items)
+
+        # The treeview itself never scrolls - the scrollbar shows the position of the visible items in the sequence
+        self._treeview.yview_moveto(0)
+        self._virtual_update_scrollbar(page_size)
+
+    def _virtual_update_scrollbar(self, page_size):
+        """Sets the scrollbar to show the position of the visible items among all items in virtual mode"""
+        total = len(self._virtual_shown())
+        if total:
+            self._scrollbars.set_vertical(self._virtual_top / total, min(1, (self._virtual_top + page_size) / total))
+        else:
+            self._scrollbars.set_vertical(0, 1)
+
+    def _virtual_changed(self, index):
+        """Updates the listbox after items have been added or removed at the given index in virtual mode. The visible
+        items are only redrawn if they could have changed."""
+        if self._filter_shown is not None or index < self._virtual_top + len(self._virtual_pool):
+            self._virtual_render()
+        else:
+            page_size = self._virtual_page_size()
+            if len(self._virtual_pool) < page_size + self.virtual_overscan:
+                self._virtual_render()
+            else:
+                self._virtual_update_scrollbar(page_size)
+
+    def _virtual_scroll_to(self, top):
+        """Scrolls so that the item at the given index is the first visible item in virtual mode"""
+        top = max(0, min(top, len(self._virtual_shown()) - self._virtual_page_size()))
+        if top != self._virtual_top:
+            self._virtual_top = top
+            self._virtual_render()
+
+    def _virtual_see(self, index):
+        """Scrolls the item at the given index into view in virtual mode"""
+        shown = self._virtual_shown()
+        if index not in shown:
+            return
+        position = shown.index(index)
+        page_size = self._virtual_page_size()
+        if position < self._virtual_top:
+            self._virtual_scroll_to(position)
+        elif position >= self._virtual_top + page_size:
+            self._virtual_scroll_to(position - page_size + 1)
+
+    def _virtual_yview(self, *args):
+        """The command for the scrollbar in virtual mode"""
+        if args[0] == 'moveto':
+            top = round(float(args[1]) * len(self._virtual_shown()))
+        else:
+            # Arguments are of the form ('scroll', amount, 'units' or 'pages')
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self._virtual_page_size()
+            top = self._virtual_top + amount
+        self._virtual_scroll_to(top)
+
+    def _virtual_mousewheel(self, event):
+        """Scrolls through the items with the mouse wheel in virtual mode"""
+        self._virtual_scroll_to(self._virtual_top + _mousewheel_rows(event))
+        return 'break'
+
+    def _virtual_mouse_down(self, event):
+        """Notes whether an item has been clicked on without shift or control, which replaces the selection"""
+        if self._treeview.identify_region(event.x, event.y) in ('cell', 'tree'):
+            self._virtual_click = not event.state & (_shift_modifier | _command_modifiers)
+
+    def _virtual_keypress(self, event):
+        """Keyboard navigation in virtual mode, which moves the selection through the items"""
+        shown = self._virtual_shown()
+        total = len(shown)
+        if not total:
+            return 'break'
+
+        page_size = self._virtual_page_size()
+        steps = {'Up': -1, 'Down': 1, 'Prior': -page_size, 'Next': page_size}
+        if event.keysym == 'Home':
+            position = 0
+        elif event.keysym == 'End':
+            position = total - 1
+        elif self._virtual_focus in shown:
+            position = shown.index(self._virtual_focus) + steps[event.keysym]
+        else:
+            position = self._virtual_top
+        index = shown[max(0, min(position, total - 1))]
+
+        self._virtual_see(index)
+        self._virtual_select([index])
+        return 'break'
+
+    def _virtual_select(self, indexes):
+        """Sets the selected items in virtual mode, processing the select event if the selection has changed"""
+        indexes = list(indexes)
+        if indexes:
+            self._virtual_focus = indexes[-1]
+        if set(indexes) != self._virtual_selection:
+            self._virtual_selection = set(indexes)
+            self._virtual_render()
+            if self._events['select']:
+                self._event('select')
+
+    def _virtual_shift(self, index, change):
+        """Moves the selection and focus after items are inserted (change > 0) or removed (change < 0) at the given
+        index in virtual mode"""
+        def moved(position):
+            return position + change if position >= index else position
+        if change < 0:
+            removed = range(index, index - change)
+            self._virtual_selection = {moved(position) for position in self._virtual_selection
+                                       if position not in removed}
+            if self._virtual_focus in removed:
+                self._virtual_focus = None
+        else:
+            removed = ()
+            self._virtual_selection = {moved(position) for position in self._virtual_selection}
+        if self._virtual_focus is not None:
+            self._virtual_focus = moved(self._virtual_focus)
+        if self._filter_shown is not None:
+            self._filter_shown = [moved(position) for position in self._filter_shown if position not in removed]
+
     def add_item(self, item):
         """Adds an item to the end of the listbox
 
@@ -1937,7 +3068,7 @@ class Listbox(Container, GooeyPieWidget):
         self.add_item_at(0, item)
 
     def add_item_at(self, index, item):
-        """Adds an item to the given index
+        """Adds an item to the given index. In a sorted listbox, the item is added in order instead.
 
         Args:
             index (int): The index of the listbox
@@ -1947,13 +3078,169 @@ class Listbox(Container, GooeyPieWidget):
             TypeError: index is not an integer
             ValueError: index is out of bounds
         """
-        if type(index) != int and index != 'end':
+        self.add_items([item], index)
+
+    def add_items(self, items, at='end'):
+        """Adds a number of items to the listbox in one go, which is much quicker than adding them one at a time. In a
+        sorted listbox, each item is added in order instead of at the given index.
+
+        Args:
+            items: A list or other iterable of the items to add
+            at (int): The index at which to add the items, or 'end' (the default) to add them to the end
+
+        Raises:
+            TypeError: at is not an integer
+            ValueError: at is out of bounds
+        """
+        count = self._item_count()
+        if type(at) != int and at != 'end':
+            raise TypeError(f'index must be an integer. The value provided was {at}')
+        if at != 'end' and (at < 0 or at > count):
+            raise ValueError(f'Index out of bounds. Value must be in the range 0 to {count}.')
+        index = count if at == 'end' else at
+        items = list(items)
+
+        if self._sorted or self._unique:
+            items = self._new_items(items)
+        if self._sorted:
+            self._insert_sorted(items)
+        else:
+            self._insert_items(index, items)
+
+    def _new_items(self, items):
+        """Returns the list of items to add in sorted or unique mode. Items already in the listbox, and repeats, are
+        left out in unique mode, and the items are put in order in sorted mode."""
+        if self._unique:
+            items = [item for item in dict.fromkeys(items) if item not in self._item_set]
+            self._item_set.update(items)
+        if self._sorted:
+            items.sort(key=_sort_key)
+        return items
+
+    def _insert_sorted(self, items):
+        """Adds items that have already been sorted at their places in a sorted listbox"""
+        keys = [_sort_key(item) for item in items]
+        if not keys:
+            return
+        if not self._sort_keys or keys[0] >= self._sort_keys[-1]:
+            # All the items go after the existing items, as when the listbox is filled, so are added in one go
+            index = len(self._sort_keys)
+            self._sort_keys.extend(keys)
+            self._insert_items(index, items)
+            return
+        for key, item in zip(keys, items):
+            index = bisect.bisect_right(self._sort_keys, key)
+            self._sort_keys.insert(index, key)
+            self._insert_items(index, [item])
+
+    def _move_sorted(self, index, key):
+        """Moves the item at the given index to its place in a sorted listbox after it has been changed"""
+        keys = self._sort_keys
+        del keys[index]
+        if (index > 0 and key < keys[index - 1]) or (index < len(keys) and keys[index] < key):
+            new_index = bisect.bisect_right(keys, key)
+        else:
+            new_index = index  # The item is still in order
+        keys.insert(new_index, key)
+        if new_index == index:
+            return
+
+        if self._virtual:
+            items = self._virtual_items()
+            items.insert(new_index, items.pop(index))
+            selected = index in self._virtual_selection
+            focused = self._virtual_focus == index
+            self._virtual_shift(index, -1)
+            self._virtual_shift(new_index, 1)
+            if selected:
+                self._virtual_selection.add(new_index)
+            if focused:
+                self._virtual_focus = new_index
+            self._drop_indexes()
+            self._virtual_render()
+        else:
+            item_id = self._item_ids.pop(index)
+            self._item_ids.insert(new_index, item_id)
+            self._item_positions = None
+            if self._filter_shown is None:
+                self._treeview.move(item_id, '', new_index)
+
+    def _insert_items(self, index, items):
+        """Adds items to the listbox at the given index"""
+        count = self._item_count()
+        if self._virtual:
+            self._virtual_items()[index:index] = items
+            if index == count:
+                for position, item in enumerate(items, index):
+                    self._index_item(item, position)
+            else:
+                self._drop_indexes()  # The indexes of the items after the new items have changed
+            self._virtual_shift(index, len(items))
+            self._virtual_changed(index)
+            self._refilter()
+            return
+
+        tk_index = 'end' if index == count or self._filter_shown is not None else index
+        new_ids = []
+        for position, item in enumerate(items):
+            item_id = self._treeview.insert('', tk_index if tk_index == 'end' else tk_index + position, values=(item,))
+            self._item_values[item_id] = item
+            self._index_item(item, item_id)
+            new_ids.append(item_id)
+        if self._filter_shown is not None and new_ids:
+            # New items are hidden until they have been scored against the filter
+            self._treeview.detach(*new_ids)
+        if self._item_positions is not None and index == len(self._item_ids):
+            self._item_positions.update(zip(new_ids, itertools.count(index)))
+        else:
+            self._item_positions = None
+        self._item_ids[index:index] = new_ids
+        self._refilter()
+
+    def set_item(self, index, item):
+        """Changes the item at the given index. In a sorted listbox, the item is moved to its place in the order.
+
+        Args:
+            index (int): The index of the item to change
+            item (str): The new item
+
+        Raises:
+            TypeError: index is not an integer
+            ValueError: index is out of bounds
+            ValueError: the listbox is unique and the item is already in the listbox
+        """
+        count = self._item_count()
+        if type(index) != int:
             raise TypeError(f'index must be an integer. The value provided was {index}')
-        if index != 'end' and (index < 0 or index > len(self.items)):
-            raise ValueError(f'Index out of bounds. Value must be in the range 0 to {len(self.items)}.')
+        if index < 0 or index > count - 1:
+            raise ValueError(f'The index must be in the range 0 to {count - 1}. '
+                             f'The value of index was {index}')
+
+        if self._unique:
+            current = self._virtual_source[index] if self._virtual else self._item_values[self._item_ids[index]]
+            if item != current and item in self._item_set:
+                raise ValueError(f"The item '{item}' is already in the listbox")
+            self._item_set.discard(current)
+            self._item_set.add(item)
+
+        if self._virtual:
+            self._unindex_item(self._virtual_source[index], index)
+            self._index_item(item, index)
+            self._virtual_items()[index] = item
+            if self._filter:
+                self._refilter()
+            elif self._virtual_top <= index < self._virtual_top + len(self._virtual_pool):
+                self._treeview.item(self._virtual_pool[index - self._virtual_top], values=(item,))
+        else:
+            item_id = self._item_ids[index]
+            self._unindex_item(self._item_values[item_id], item_id)
+            self._index_item(item, item_id)
+            self._item_values[item_id] = item
+            self._treeview.item(item_id, values=(item,))
+            self._refilter()
 
-        self._treeview.insert('', index, values=(item,))
-        self._update_scrollbar()
+        if self._sorted:
+            self._move_sorted(index, _sort_key(item))
 
     def remove_item(self, index):
         """Removes and returns the item at the given index
@@ -1969,16 +3256,41 @@ class Listbox(Container, GooeyPieWidget):
             ValueError: Index is negative
             ValueError: Index is larger than the number of items in the listbox
         """
-        row_ids = self._treeview.get_children()
+        count = self._item_count()
         if type(index) != int:
             raise TypeError(f'index must be an integer. The value provided was {index}')
-        if index < 0 or index > len(row_ids) - 1:
-            raise ValueError(f'The index must be in the range 0 to {len(row_ids) - 1}. '
+        if index < 0 or index > count - 1:
+            raise ValueError(f'The index must be in the range 0 to {count - 1}. '
                              f'The value of index was {index}')
-        removed = self._treeview.item(row_ids[index])['values'][0]
-        self._treeview.delete(row_ids[index])
-        self._update_scrollbar()
-        return removed
+
+        if self._sorted:
+            del self._sort_keys[index]
+        if self._unique:
+            current = self._virtual_source[index] if self._virtual else self._item_values[self._item_ids[index]]
+            self._item_set.discard(current)
+
+        if self._virtual:
+            removed = self._virtual_items().pop(index)
+            if index == count - 1:
+                self._unindex_item(removed, index)
+            else:
+                self._drop_indexes()  # The indexes of the items after the removed item have changed
+            self._virtual_shift(index, -1)
+            self._virtual_changed(index)
+            self._refilter()
+            return removed
+
+        item_id = self._item_ids.pop(index)
+        if self._item_positions is not None and index == len(self._item_ids):
+            del self._item_positions[item_id]
+        else:
+            self._item_positions = None
+        self._treeview.delete(item_id)
+        self._unindex_item(self._item_values[item_id], item_id)
+        if self._filter_shown is not None and item_id in self._filter_shown:
+            self._filter_shown.remove(item_id)
+        self._refilter()
+        return self._item_values.pop(item_id)
 
     def remove_selected(self):
         """Removes and returns all items from the selected index(es)
@@ -1987,24 +3299,79 @@ class Listbox(Container, GooeyPieWidget):
             A string or list of strings, depending on whether multiple items is enabled. None if nothing is selected
         """
         row_data = self.selected
-        self._treeview.delete(*self._treeview.selection())
-        self._update_scrollbar()
+        if self._virtual:
+            if self._virtual_selection:
+                kept = [index for index in range(len(self._virtual_source)) if index not in self._virtual_selection]
+                if self._sorted:
+                    self._sort_keys = [self._sort_keys[index] for index in kept]
+                if self._unique:
+                    self._item_set.difference_update(self._virtual_source[index] for index in self._virtual_selection)
+                if self._filter_shown is not None:
+                    new_indexes = {index: new_index for new_index, index in enumerate(kept)}
+                    self._filter_shown = [new_indexes[index] for index in self._filter_shown if index in new_indexes]
+                self._virtual_source = [self._virtual_source[index] for index in kept]
+                self._virtual_source_copied = True
+                self._virtual_selection = set()
+                self._virtual_focus = None
+                self._drop_indexes()
+                self._virtual_render()
+                self._refilter()
+            return row_data
+
+        selected_ids = set(self._treeview.selection())
+        if selected_ids:
+            self._treeview.delete(*selected_ids)
+            if self._sorted:
+                self._sort_keys = [key for item_id, key in zip(self._item_ids, self._sort_keys)
+                                   if item_id not in selected_ids]
+            if self._unique:
+                self._item_set.difference_update(self._item_values[item_id] for item_id in selected_ids)
+            self._item_ids = [item_id for item_id in self._item_ids if item_id not in selected_ids]
+            self._item_positions = None
+            for item_id in selected_ids:
+                self._unindex_item(self._item_values.pop(item_id), item_id)
+            if self._filter_shown is not None:
+                self._filter_shown = [item_id for item_id in self._filter_shown if item_id not in selected_ids]
+            self._refilter()
         return row_data
 
     def select_all(self):
-        """Selects (highlights) all items in the listbox. Multiple selection must be enabled"""
+        """Selects (highlights) all items shown in the listbox. Multiple selection must be enabled"""
         if self.multiple_selection:
-            self._treeview.selection_set(*self._treeview.get_children())
+            if self._virtual:
+                self._virtual_select(self._virtual_shown())
+            else:
+                self._treeview.selection_set(*(self._item_ids if self._filter_shown is None else self._filter_shown))
 
     def select_none(self):
         """Deselects any items that may be selected in the listbox"""
-        self._treeview.selection_remove(*self._treeview.selection())
+        if self._virtual:
+            self._virtual_select([])
+        else:
+            self._treeview.selection_remove(*self._treeview.selection())
 
     def clear(self):
-        """Removes all items from the Listbox"""
-        for row_id in self._treeview.get_children():
-            self._treeview.delete(row_id)
-        self._update_scrollbar()
+        """Removes all items from the Listbox. Any filter still applies to items added afterwards."""
+        self._drop_indexes()
+        self._sort_keys = [] if self._sorted else None
+        self._item_set = set() if self._unique else None
+        self._cancel_filter()
+        self._filter_results = None
+        self._filter_shown = [] if self._filter_shown is not None else None
+        if self._virtual:
+            self._virtual_source = []
+            self._virtual_source_copied = True
+            self._virtual_selection = set()
+            self._virtual_focus = None
+            self._virtual_top = 0
+            self._virtual_render()
+            return
+
+        if self._item_ids:
+            self._treeview.delete(*self._item_ids)
+        self._item_ids = []
+        self._item_values = {}
+        self._item_positions = {}
 
 
 class ImageButton(Button):
@@ -2491,11 +3858,171 @@ class Number(ttk.Spinbox, GooeyPieWidget):
         self.configure(wrap=bool(state))
 
 
+class TableDataProvider:
+    """Base class for a source of data for a Table, so that a table can show more rows than can be held in memory.
+    Set the data_provider property of a Table to show the data. Only the rows in view are fetched, and the table asks
+    the provider to sort and filter the rows, e.g. with a database query.
+
+    Subclasses implement each of the methods below. fetch() may be called from a background thread.
+    """
+
+    def count(self):
+        """Returns the number of rows that match the current filter"""
+        raise NotImplementedError
+
+    def fetch(self, start, count):
+        """Returns a list of up to count rows, each a list of values, starting at the given index in the current
+        sort order"""
+        raise NotImplementedError
+
+    def sort(self, columns):
+        """Sets the order of the rows
+
+        Args:
+            columns: A list of (column, descending) pairs in order of priority, where column is indexed from 0.
+                An empty list sorts the rows in their original order.
+        """
+        raise NotImplementedError
+
+    def filter(self, query, column=None):
+        """Sets which rows are included
+
+        Args:
+            query (str): Only rows containing every word in the query, ignoring case, are included. None includes
+                all rows.
+            column (int): Optional column to search, indexed from 0. By default, all columns are searched.
+        """
+        raise NotImplementedError
+
+
+class SQLiteProvider(TableDataProvider):
+    """Provides the rows of a table in a SQLite database to a Table. Sorting and filtering are done by the database.
+    Rows are fetched a page at a time: when the page after the last page fetched is needed, it is found from the
+    sort values of the last row (keyset pagination) rather than by skipping over all the rows before it.
+    """
+
+    def __init__(self, database, table, columns):
+        """Creates a new SQLiteProvider
+
+        Args:
+            database (str): The path of the SQLite database file
+            table (str): The name of the table or view in the database
+            columns: A list of the names of the columns to show, in order
+
+        Raises:
+            sqlite3.Error: the database cannot be opened
+            ValueError: the table or a column does not exist in the database
+        """
+        self._database = database
+        self._connections = threading.local()  # Each thread has its own connection to the database
+        self._table = self._quote(table)
+        self._columns = [self._quote(column) for column in columns]
+
+        names = {row[1].casefold() for row in self._sql(f'PRAGMA table_info({self._table})')}
+        if not names:
+            raise ValueError(f'There is no table or view named "{table}" in the database')
+        for column in columns:
+            if column.casefold() not in names:
+                raise ValueError(f'There is no column named "{column}" in the table "{table}"')
+
+        # Views and tables without a rowid cannot be paged using the values of the last row
+        schema = self._sql('SELECT type, sql FROM sqlite_master WHERE name = ?', (table,))
+        self._keyset = bool(schema) and schema[0][0] == 'table' and 'WITHOUT ROWID' not in schema[0][1].upper()
+
+        # The WHERE clause and its parameters, the sorted columns and the last row of each page fetched, replaced
+        # together so that a fetch in a background thread sees a consistent query
+        self._query = ('', [], [], {})
+
+    @staticmethod
+    def _quote(name):
+        """Returns a table or column name quoted for use in a query"""
+        return '"' + name.replace('"', '""') + '"'
+
+    def _sql(self, query, parameters=()):
+        """Runs a query on the connection of the current thread and returns all rows"""
+        connection = getattr(self._connections, 'connection', None)
+        if connection is None:
+            connection = self._connections.connection = sqlite3.connect(self._database)
+        return connection.execute(query, parameters).fetchall()
+
+    def count(self):
+        where, parameters, order, last_rows = self._query
+        return self._sql(f'SELECT COUNT(*) FROM {self._table}{where}', parameters)[0][0]
+
+    def fetch(self, start, count):
+        where, parameters, order, last_rows = self._query
+        sort_values = [f'{column} COLLATE NOCASE' for column, descending in order]
+        order_by = [f'{value}{" DESC" if descending else ""}' for value, (column, descending) in zip(sort_values, order)]
+        if self._keyset:
+            order_by.append('rowid')
+        selected = ', '.join(self._columns + sort_values + (['rowid'] if self._keyset else []))
+        query = f'SELECT {selected} FROM {self._table}'
+
+        after = self._after(order, last_rows.get(start)) if self._keyset else None
+        if after:
+            condition, after_parameters = after
+            query += f'{where} AND {condition}' if where else f' WHERE {condition}'
+            parameters = parameters + after_parameters
+            offset = 0
+        else:
+            query += where
+            offset = start
+        if order_by:
+            query += f' ORDER BY {", ".join(order_by)}'
+        rows = self._sql(f'{query} LIMIT ? OFFSET ?', parameters + [count, offset])
+
+        if rows and self._keyset:
+            last_rows[start + len(rows)] = rows[-1][len(self._columns):]
+        return [list(row[:len(self._columns)]) for row in rows]
+
+    @staticmethod
+    def _after(order, last_row):
+        """Returns a condition and its parameters for the rows after the given row in the sort order, or None if
+        this cannot be done with comparisons
+
+        Args:
+            order: A list of (column, descending) pairs that the rows are sorted by
+            last_row: The sort values and rowid of the last row, or None if it is not known
+        """
+        if last_row is None or None in last_row:
+            return None
+        *values, rowid = last_row
+        condition, parameters = 'rowid > ?', [rowid]
+        for (column, descending), value in reversed(list(zip(order, values))):
+            column = f'{column} COLLATE NOCASE'
+            if descending:
+                # Nulls are sorted last when sorting in descending order
+                condition = f'({column} < ? OR {column} IS NULL OR ({column} = ? AND {condition}))'
+            else:
+                condition = f'({column} > ? OR ({column} = ? AND {condition}))'
+            parameters = [value, value] + parameters
+        return condition, parameters
+
+    def sort(self, columns):
+        where, parameters, order, last_rows = self._query
+        self._query = (where, parameters, [(self._columns[column], descending) for column, descending in columns], {})
+
+    def filter(self, query, column=None):
+        where, parameters, order, last_rows = self._query
+        columns = self._columns if column is None else [self._columns[column]]
+        conditions = []
+        parameters = []
+        for word in _tokens(query or ''):
+            # Match the word anywhere in any of the columns, escaping the wildcard characters of LIKE
+            pattern = '%' + word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions.append('(' + ' OR '.join(f"{name} LIKE ? ESCAPE '\\'" for name in columns) + ')')
+            parameters.extend([pattern] * len(columns))
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        self._query = (where, parameters, order, {})
+
+
 class Table(Container, GooeyPieWidget):
     """For displaying tabular data"""
     icon_spacing = '   '
     sort_ascending_icon = f'{icon_spacing}▲'
     sort_descending_icon = f'{icon_spacing}▼'
+    virtual_overscan = 2  # Number of rows shown beyond the visible area in virtual mode
+    load_time_budget = 0.02  # Time in seconds spent adding each batch of rows when loading data
 
     def __init__(self, container, headings):
         """Creates a new Table widget
@@ -2516,6 +4043,7 @@ class Table(Container, GooeyPieWidget):
 
         # Create and configure treeview
         self._num_columns = len(headings)
+        self._headings = list(headings)
         column_ids = tuple(range(self._num_columns))  # tuple of form (0, 1, 2, etc)
         self._treeview = ttk.Treeview(self, columns=column_ids, show='headings', selectmode='browse')
         for index, heading in enumerate(headings):
@@ -2527,6 +4055,9 @@ class Table(Container, GooeyPieWidget):
 
         # Table is sortable by default
         self._sortable = True
+        self._sort_columns = []  # (column, descending) pairs the rows are sorted by, in order of priority
+        self._heading_shift_click = False  # Set when a heading is clicked with shift held down
+        self._sort_keys = {}  # Sort keys of each row for each column that has been sorted, by column and row id
 
         # Create vertical scrollbar configure behaviour
         self._v_scrollbar = ttk.Scrollbar(self, orient='vertical')
@@ -2536,31 +4067,100 @@ class Table(Container, GooeyPieWidget):
         # create horizontal scrollbar and configure behaviour
         self._h_scrollbar = ttk.Scrollbar(self, orient='horizontal')
         self._h_scrollbar.config(command=self._treeview.xview)
-        self._treeview.config(xscroll=self._h_scrollbar.set)
-
-        # Add to parent Container
-        self._treeview.grid(row=0, column=0, sticky='nsew')
-        self._v_scrollbar.grid(row=0, column=1, sticky='nsew')
-        self._h_scrollbar.grid(row=1, column=0, sticky='nsew')
 
-        # Default scrollbar settings and bindings to update visibility of scrollbars
-        self._treeview.bind('<Configure>', self._update_scrollbar)  # Update scrollbar visibility when widget changes size
-        self._treeview.bind('<ButtonRelease-1>', self._update_scrollbar)
+        # The vertical scrollbar is always shown, and the horizontal scrollbar is shown when the columns do not fit.
+        # Both are added to the parent Container with the treeview.
+        self._scrollbars = _Scrollbars(self, self._treeview, vertical=self._v_scrollbar, horizontal=self._h_scrollbar)
+        self._scrollbars.vertical_setting = 'visible'
+        self._treeview.config(xscroll=self._scrollbars.set_horizontal)
+
+        # A copy of the data of each row is kept so that it can be read without querying the treeview. Each row has
+        # a unique integer id, which is also the id of its item in the treeview.
+        self._column_types = [None] * self._num_columns  # Type of the values in each column, None if untyped
+        self._column_formats = [None] * self._num_columns  # Format specification used to show each typed column
+        self._rows = _TableRows(self._column_types)  # Row data for each row id
+        self._order = []  # Row ids in the order they are displayed
+        self._positions = {}  # Cached index in self._order of each row id, plus self._position_base
+        self._position_base = 0  # Increased when rows are removed from the start, instead of changing every position
+        self._positions_valid = 0  # Number of rows at the start of self._order with correct cached positions
+        self._row_counter = itertools.count()  # Used to generate unique row ids
+
+        # Rows can be identified by the value in a key column, looked up using an index built when needed
+        self._key_column = None
+        self._key_index = None  # Row id of each key
+
+        # Filtering. Rows that do not match the filter are detached from the treeview rather than deleted.
+        self._filter = None  # (query, column) of the current filter
+        self._filter_matches = None  # Ids of the rows that match the filter, or None if there is no filter
+        self._visible = None  # Ids of the rows that match the filter in order, built when needed
+        self._visible_positions = {}  # Cached index in self._visible of each row id, checked before it is used
+        self._hidden_selection = set()  # Ids of selected rows that have been hidden by the filter
+        self._token_postings = {}  # Ids of the rows containing each word, by column and word
+        self._token_vocabulary = {}  # Sorted words in each column, rebuilt when needed
+
+        # Virtual mode. Only the visible rows are shown in the treeview, using a pool of items that are recycled
+        self._virtual = False
+        self._virtual_items = []  # Pool of treeview items recycled to show the visible rows
+        self._virtual_top = 0  # Index of the first visible row
+        self._virtual_selection = set()  # Ids of the selected rows
+        self._virtual_focus = None  # Id of the row most recently clicked on or navigated to with the keyboard
+        self._virtual_click = False  # Set when a row is clicked on without shift or control held down
+
+        # Rows waiting to be added to the treeview in batches by load_data()
+        self._pending_index = 0  # Index in self._order of the next row to be added
+        self._load_id = None  # Identifier of the scheduled call to add the next batch of rows
+        self._load_progress = None
+        self._load_complete = None
+
+        # Streaming. Rows from append_rows() are added together when the window is next idle, and the oldest rows
+        # are removed when there are more than max_rows
+        self._max_rows = None
+        self._append_queue = []  # Rows waiting to be added by append_rows()
+        self._append_id = None  # Identifier of the scheduled call to add the queued rows
+
+        # Rows added to a sorted table are put in their place in the sort order when keep_sorted is set, and only the
+        # first top_rows rows in the sort order are kept
+        self._keep_sorted = False
+        self._top_rows = None
+
+        # Once autosize_columns() has been called, columns are widened to fit the rows that are added
+        self._text_widths = None  # Width of the widest text in each column, or None for columns that are not autosized
+        self._cell_font = None  # Font of the cells and the widths of its characters
+        self._autosize_sample_size = None
+
+        # Data provider, which fetches, sorts and filters the rows instead of the table
+        self._provider = None
+
+        # Rows being read from a CSV file in a background thread by load_csv()
+        self._import_chunks = None  # Queue of lists of rows read from the file
+        self._import_stop = None  # Event that is set to stop reading the file
+        self._import_id = None  # Identifier of the scheduled call to add the rows read so far
+
+        # Bindings that are only active in virtual mode, added to the bindtags of the treeview when it is enabled
+        self._virtual_bindtag = f'VirtualTable{id(self)}'
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self._treeview.bind_class(self._virtual_bindtag, sequence, self._virtual_mousewheel)
+        for sequence in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>'):
+            self._treeview.bind_class(self._virtual_bindtag, sequence, self._virtual_keypress)
+        self._treeview.bind_class(self._virtual_bindtag, '<ButtonPress-1>', self._virtual_mouse_down)
+        self._treeview.bind_class(self._virtual_bindtag, '<Configure>', self._virtual_render)
+
+        # Bindings used by the table itself, which do not interfere with any events bound to the treeview
+        self._table_bindtag = f'Table{id(self)}'
+        self._treeview.bind_class(self._table_bindtag, '<ButtonPress-1>', self._heading_press)
+        bindtags = list(self._treeview.bindtags())
+        bindtags.insert(bindtags.index('Treeview'), self._table_bindtag)
+        self._treeview.bindtags(bindtags)
 
         GooeyPieWidget.__init__(self, container)
         self._events['select'] = None
 
+        # The select event is processed by the table so that selections can be tracked in virtual mode
+        self._treeview.bind('<<TreeviewSelect>>', self._treeview_select)
+
     def __str__(self):
         # Identified by column names
-
-        headings = [self._treeview.heading(col_id)['text'] for col_id in range(self._num_columns)]
-
-        # Remove any sort icons from the headings
-        for index, heading in enumerate(headings):
-            if heading.endswith(self.sort_ascending_icon) or heading.endswith(self.sort_descending_icon):
-                headings[index] = heading[:-len(self.sort_descending_icon)]
-
-        return f"<Table {tuple(headings)}>"
+        return f"<Table {tuple(self._headings)}>"
 
     def __repr__(self):
         return self.__str__()
@@ -2573,6 +4173,8 @@ class Table(Container, GooeyPieWidget):
     @height.setter
     def height(self, lines):
         self._treeview.configure(height=lines)
+        if self._virtual:
+            self._virtual_render()
 
     @property
     def sortable(self):
@@ -2585,76 +4187,1158 @@ class Table(Container, GooeyPieWidget):
         if not self._sortable:
             self._clear_sort_icons()
 
-    def _update_scrollbar(self, _event=None):
-        """Adds/removes the horizontal scrollbar as needed"""
-        horizontal_scrollbar_needed = self._treeview.xview() != (0.0, 1.0)
-        row_span = 1 if horizontal_scrollbar_needed else 2
+    @property
+    def max_rows(self):
+        """Gets or sets the maximum number of rows in the table, or None for no limit. When rows are added beyond
+        the maximum, the oldest rows are removed, so that a table showing a live feed of data does not keep growing.
+        """
+        return self._max_rows
 
-        self._treeview.grid_remove()
-        self._v_scrollbar.grid_remove()
-        self._h_scrollbar.grid_remove()
+    @max_rows.setter
+    def max_rows(self, value):
+        if value is not None and (type(value) != int or value < 1):
+            raise ValueError(f'The maximum number of rows must be a positive integer or None. '
+                             f'The value given was {value}')
+        self._max_rows = value
+        self._remove_excess_rows()
 
-        self._treeview.grid(row=0, column=0, rowspan=row_span)
-        self._v_scrollbar.grid(row=0, column=1, rowspan=row_span)
-        if horizontal_scrollbar_needed:
-            self._h_scrollbar.grid()
+    @property
+    def keep_sorted(self):
+        """Gets or sets whether rows added to a sorted table are put in their place in the sort order. If False,
+        adding rows adds them where they are asked to go, and the table is no longer considered sorted.
+        """
+        return self._keep_sorted
 
-    def _sort_data(self, column_id):
-        """When the column heading is clicked on, the data are sorted according to that column"""
+    @keep_sorted.setter
+    def keep_sorted(self, value):
+        self._keep_sorted = bool(value)
+        self._remove_excess_rows()
 
-        # Do not allow sorting if the table is disabled
-        if self._disabled or not self._sortable:
+    @property
+    def top_rows(self):
+        """Gets or sets the number of rows kept when keep_sorted is set and the table is sorted, or None for no
+        limit. Rows that are not in the top rows of the sort order are removed, so that the table can be used as a
+        live leaderboard.
+        """
+        return self._top_rows
+
+    @top_rows.setter
+    def top_rows(self, value):
+        if value is not None and (type(value) != int or value < 1):
+            raise ValueError(f'The number of top rows must be a positive integer or None. '
+                             f'The value given was {value}')
+        self._top_rows = value
+        self._remove_excess_rows()
+
+    @property
+    def key_column(self):
+        """Gets or sets the column, indexed from 0, containing a value that identifies each row, used to find and
+        update rows with find() and upsert(). The values in the key column should be unique. None if there is no
+        key column.
+        """
+        return self._key_column
+
+    @key_column.setter
+    def key_column(self, column):
+        if column is not None and (type(column) != int or column not in range(self._num_columns)):
+            raise ValueError(f'Column number must be an integer between 0 and {self._num_columns - 1}. '
+                             f'The value given was {column}.')
+        self._key_column = column
+        self._key_index = None
+
+    @property
+    def data_provider(self):
+        """Gets or sets the TableDataProvider that the table shows data from, such as a SQLiteProvider, or None.
+        The table is put in virtual mode and only fetches the rows in view. Clicking on a heading or filtering the
+        table sorts or filters the rows of the provider, which clears the selection. Rows cannot be added or removed,
+        and setting the data of the table or clearing it stops using the provider.
+        """
+        return self._provider
+
+    @data_provider.setter
+    def data_provider(self, provider):
+        if provider is not None and not isinstance(provider, TableDataProvider):
+            raise TypeError(f'The data provider must be a TableDataProvider. The value given was {provider}')
+        self.clear()
+        if provider is None:
             return
 
-        # Update heading text with icon
-        sort_descending = False
-        for col_id in range(self._num_columns):
-            heading = self._treeview.heading(col_id)['text']
-            if col_id == column_id:
-                # Set the sort icon according to whatever is already there
-                if heading.endswith(self.sort_ascending_icon):
-                    # Change from ascending icon to descending
-                    heading_descending = f'{heading[:-len(self.sort_descending_icon)]}{self.sort_descending_icon}'
-                    self._treeview.heading(col_id, text=heading_descending)
-                    sort_descending = True
-                elif heading.endswith(self.sort_descending_icon):
-                    # Change from descending icon to ascending
-                    heading_ascending = f'{heading[:-len(self.sort_descending_icon)]}{self.sort_ascending_icon}'
-                    self._treeview.heading(col_id, text=heading_ascending)
-                else:
-                    # No current icon - set to descending by default
-                    heading_ascending = f'{heading}{self.sort_ascending_icon}'
-                    self._treeview.heading(col_id, text=heading_ascending)
+        self.virtual = True
+        self._filter = None
+        self._filter_matches = None
+        self._visible = None
+        provider.sort([])
+        provider.filter(None)
+        self._provider = provider
+        self._rows = _ProviderRows(provider)
+        self._provider_changed()
+        self._virtual_render()
+
+    def _provider_changed(self):
+        """Fetches the rows again after the sort order or filter of the data provider has changed. The selected rows
+        are identified by their positions, so the selection is cleared and the view returns to the first row."""
+        self._rows.refresh()
+        self._order = range(len(self._rows))
+        self._virtual_top = 0
+        self._virtual_focus = None
+        if self._virtual_selection:
+            self._virtual_selection = set()
+            if self._events['select']:
+                self._event('select')
+
+    def _check_no_provider(self, action):
+        """Raises GooeyPieError if the table shows data from a data provider, which cannot be changed by the table"""
+        if self._provider is not None:
+            raise GooeyPieError(f'{action} when the table shows data from a data provider')
+
+    @property
+    def virtual(self):
+        """Gets or sets whether the Table is in virtual mode
+
+        In virtual mode, the data is held in memory and only the rows that are currently visible are added to the
+        table, so that very large amounts of data can be shown without slowing down. Rows are still selected,
+        added and removed using their index in the data.
+        """
+        return self._virtual
+
+    @virtual.setter
+    def virtual(self, value):
+        value = bool(value)
+        if value == self._virtual:
+            return
+        self._check_no_provider('The table must be in virtual mode')
+
+        # Move the existing data across to the new mode
+        data = self.data
+        self.clear()
+        self._virtual = value
+
+        bindtags = list(self._treeview.bindtags())
+        if value:
+            # The vertical scrollbar scrolls through the data rather than the items in the treeview
+            self._treeview.config(yscroll='')
+            self._v_scrollbar.config(command=self._virtual_yview)
+            bindtags.insert(bindtags.index('Treeview'), self._virtual_bindtag)
+        else:
+            self._treeview.config(yscroll=self._v_scrollbar.set)
+            self._v_scrollbar.config(command=self._treeview.yview)
+            bindtags.remove(self._virtual_bindtag)
+        self._treeview.bindtags(bindtags)
+
+        self.data = data
+
+    def _sort_data(self, column_id):
+        """When the column heading is clicked on, the data are sorted according to that column. If shift is held
+        down, the column is added to the columns already being sorted, or its sort direction is reversed.
+        """
+
+        # Do not allow sorting if the table is disabled
+        if self._disabled or not self._sortable:
+            return
+
+        sort_columns = list(self._sort_columns)
+        sort_directions = dict(sort_columns)
+        if self._heading_shift_click and sort_columns:
+            if column_id in sort_directions:
+                position = sort_columns.index((column_id, sort_directions[column_id]))
+                sort_columns[position] = (column_id, not sort_directions[column_id])
             else:
-                # Clear the icon from the heading text if it exists
-                if heading.endswith(self.sort_ascending_icon) or heading.endswith(self.sort_descending_icon):
-                    self._treeview.heading(col_id, text=heading[:-len(self.sort_descending_icon)])
+                sort_columns.append((column_id, False))
+        elif sort_columns == [(column_id, False)]:
+            # Change from ascending to descending
+            sort_columns = [(column_id, True)]
+        else:
+            sort_columns = [(column_id, False)]
 
-        # Sort the data
-        self.data = sorted(self.data, key=lambda l: l[column_id], reverse=sort_descending)
+        self._virtual_top = 0
+        self._sort(sort_columns)
+
+    def _heading_press(self, event):
+        """Notes whether the mouse button is pressed with shift held down, used when a heading is clicked on"""
+        self._heading_shift_click = bool(event.state & _shift_modifier)
+
+    def sort_by(self, *columns):
+        """Sorts the data by one or more columns. Rows with the same value in the first column are sorted by the
+        second column, and so on.
+
+        Args:
+            columns: The columns to sort by in order of priority, indexed from 0. A column can be given as an integer
+                to sort in ascending order, or as a tuple with either 'ascending' or 'descending', e.g.
+                table.sort_by(2, (0, 'descending'))
+
+        Raises:
+            ValueError: A column number is not valid
+            ValueError: A sort direction is not 'ascending' or 'descending'
+        """
+        sort_columns = []
+        for column in columns:
+            column_id, direction = column if type(column) == tuple else (column, 'ascending')
+            if type(column_id) != int or column_id not in range(self._num_columns):
+                raise ValueError(f'Column number must be an integer between 0 and {self._num_columns - 1}. '
+                                 f'The value given was {column_id}.')
+            if direction not in ('ascending', 'descending'):
+                raise ValueError(f'Sort direction must be either "ascending" or "descending". '
+                                 f'The value given was "{direction}".')
+            sort_columns.append((column_id, direction == 'descending'))
+
+        self._virtual_top = 0
+        self._sort(sort_columns)
+
+    def _sort(self, sort_columns):
+        """Sorts the rows by a list of (column, descending) pairs, in order of priority
+
+        Each column is sorted in turn starting from the lowest priority. Since sorting is stable, this leaves the
+        rows in order of the highest priority column, with ties in the order of the next column and so on. The
+        cached sort keys of each column are reused, so adding a column does not recalculate the others.
+        """
+        self._finish_loading()
+
+        if self._provider is not None:
+            # The rows are sorted by the provider, such as with an ORDER BY clause
+            self._provider.sort(sort_columns)
+            self._provider_changed()
+        elif sort_columns and [(column_id, not descending) for column_id, descending in sort_columns] == \
+                self._sort_columns:
+            # Already sorted by these columns in the opposite direction, so the order only needs to be reversed
+            self._order.reverse()
+        else:
+            for column_id, descending in reversed(sort_columns):
+                if not self._argsort(column_id, descending):
+                    self._order.sort(key=self._column_sort_keys(column_id).__getitem__, reverse=descending)
+
+        self._clear_sort_icons()
+        self._sort_columns = sort_columns
+        self._order_changed()
+        self._show_order()
+
+        # Show the sort icons, numbered in order of priority if sorting by more than one column
+        for priority, (column_id, descending) in enumerate(sort_columns, 1):
+            icon = self.sort_descending_icon if descending else self.sort_ascending_icon
+            if len(sort_columns) > 1:
+                icon = f'{icon}{priority}'
+            self._treeview.heading(column_id, text=f'{self._headings[column_id]}{icon}')
+
+    def _typed_row(self, row):
+        """Returns a new list of the values of a row, converted to the types of the columns"""
+        if not any(self._column_types):
+            return list(row)
+        return [_convert_value(value, column_type) for value, column_type in zip(row, self._column_types)]
+
+    def _cell_text(self, column_id, value):
+        """Returns the value of a cell as it is shown in the table. Values in typed columns are formatted as text
+        only when they are shown."""
+        if self._column_types[column_id] is None:
+            return value
+        return format(value, self._column_formats[column_id] or '')
+
+    def _display_values(self, row):
+        """Returns the values of a row as they are shown in the table"""
+        if not any(self._column_types):
+            return row
+        return [self._cell_text(column_id, value) for column_id, value in enumerate(row)]
+
+    def _cell_sort_key(self, column_id, value):
+        """Returns the key used to sort a value in a column. Values in typed columns are sorted by their own order,
+        except that NaN in a float column is sorted after the other numbers."""
+        if self._column_types[column_id] in ('int', 'bool', 'date'):
+            return value
+        return _sort_key(value)
+
+    def _argsort(self, column_id, descending):
+        """Sorts the rows of a table created from a NumPy array or DataFrame by a column of numbers or dates using
+        NumPy, rather than comparing the values in Python
+
+        Returns:
+            True if the rows were sorted, or False if they need to be sorted in Python instead
+        """
+        if not isinstance(self._rows, _ArrayRows) or not self._rows.unchanged:
+            return False
+        column = self._rows.columns[column_id]
+        if column.dtype.kind not in 'iufbmM':
+            return False
+
+        import numpy
+        order = numpy.asarray(self._order)
+        keys = column[order]
+        if descending:
+            # Sort the reversed keys and reverse the result, so that equal values stay in the same order
+            positions = len(keys) - 1 - keys[::-1].argsort(kind='stable')[::-1]
+        else:
+            positions = keys.argsort(kind='stable')
+        self._order = order[positions].tolist()
+        return True
+
+    def _sorts_before(self, row_id, other_id):
+        """Returns True if a row comes before another row in the order the table is currently sorted by"""
+        for column_id, descending in self._sort_columns:
+            keys = self._column_sort_keys(column_id)
+            key, other_key = keys[row_id], keys[other_id]
+            if key != other_key:
+                return key > other_key if descending else key < other_key
+        return False
+
+    def _sorted_index(self, row_id):
+        """Returns the index at which a row that is not in self._order would be inserted to keep the rows sorted,
+        after any rows that are equal to it"""
+        low, high = 0, len(self._order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._sorts_before(row_id, self._order[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _resort_rows(self, row_ids):
+        """Moves rows that have been added or changed to their place in the current sort order, without sorting
+        all rows again"""
+        if len(row_ids) > len(self._order) // 8:
+            # Sorting all rows is quicker when many rows have changed
+            self._sort(self._sort_columns)
+            return
+
+        # Take out all of the rows first, so that the remaining rows are in order when the rows are put back
+        moving = set(row_ids)
+        first = min(self._position(row_id) for row_id in moving)
+        self._order = [row_id for row_id in self._order if row_id not in moving]
+        for row_id in row_ids:
+            index = self._sorted_index(row_id)
+            self._order.insert(index, row_id)
+            first = min(first, index)
+        self._positions_changed(first)
+
+        if not self._virtual:
+            # Detach the items and reattach them in order, so that each is reattached among items in their final places
+            detached = [row_id for row_id in row_ids if self._is_visible(row_id)]
+            selection = moving.intersection(self._selected_ids())
+            self._treeview.detach(*detached)
+            for index, row_id in enumerate(self._visible_order()):
+                if row_id in moving:
+                    self._treeview.move(row_id, '', index)
+            if selection:
+                self._treeview.selection_add(*selection)
+
+    def _column_sort_keys(self, column_id):
+        """Returns a dictionary of the sort key of each row for the given column. The keys are kept until the data
+        changes, so that the values in the column do not need to be compared again each time it is sorted.
+        """
+        keys = self._sort_keys.get(column_id)
+        if keys is None:
+            keys = {row_id: self._cell_sort_key(column_id, value)
+                    for row_id, value in self._rows.column_items(column_id)}
+            self._sort_keys[column_id] = keys
+        return keys
+
+    def _index_row(self, row_id):
+        """Adds a new row to the key index, sort keys and word indexes that have already been built"""
+        row = self._rows[row_id]
+        if self._key_index is not None:
+            self._key_index.setdefault(row[self._key_column], row_id)
+        self._index_cells(row_id, row, range(self._num_columns))
+
+    def _index_cells(self, row_id, row, columns):
+        """Adds the values of a row in the given columns to the sort keys and word indexes that have been built"""
+        for column_id in columns:
+            keys = self._sort_keys.get(column_id)
+            if keys is not None:
+                keys[row_id] = self._cell_sort_key(column_id, row[column_id])
+            postings = self._token_postings.get(column_id)
+            if postings is not None:
+                for token in _tokens(self._cell_text(column_id, row[column_id])):
+                    if token not in postings:
+                        postings[token] = set()
+                        self._token_vocabulary.pop(column_id, None)
+                    postings[token].add(row_id)
+
+    def _unindex_cells(self, row_id, row, columns):
+        """Removes the values of a row in the given columns from the word indexes that have been built"""
+        for column_id in columns:
+            postings = self._token_postings.get(column_id)
+            if postings is not None:
+                for token in _tokens(self._cell_text(column_id, row[column_id])):
+                    postings[token].discard(row_id)
+
+    def _unindex_row(self, row_id):
+        """Removes a row from the key index, sort keys, word indexes, filter and selection before it is deleted"""
+        row = self._rows[row_id]
+        if self._key_index is not None and self._key_index.get(row[self._key_column]) == row_id:
+            del self._key_index[row[self._key_column]]
+        for keys in self._sort_keys.values():
+            del keys[row_id]
+        self._unindex_cells(row_id, row, range(self._num_columns))
+        if self._filter_matches is not None:
+            self._filter_matches.discard(row_id)
+        self._hidden_selection.discard(row_id)
+        self._positions.pop(row_id, None)
+
+    def _show_order(self):
+        """Rearranges the existing items in the treeview to match the order of the rows"""
+        if self._virtual:
+            self._virtual_render()
+        else:
+            # Reordering the items in a single call keeps them (and the selection) rather than recreating them
+            selection = self._treeview.selection()
+            self._treeview.set_children('', *self._visible_order())
+            if set(self._treeview.selection()) != set(selection):
+                self._treeview.selection_set(selection)
 
     def _clear_sort_icons(self):
-        """Clear any icons that have been appended to column headings"""
-        for col_id in range(self._num_columns):
-            heading = self._treeview.heading(col_id)['text']
-            if heading.endswith(self.sort_ascending_icon) or heading.endswith(self.sort_descending_icon):
-                self._treeview.heading(col_id, text=heading[:-len(self.sort_descending_icon)])
+        """Clear any icons that have been appended to column headings. The rows are no longer considered sorted."""
+        for col_id, descending in self._sort_columns:
+            self._treeview.heading(col_id, text=self._headings[col_id])
+        self._sort_columns = []
+
+    def filter(self, query, column=None):
+        """Shows only the rows that match a query, hiding the others. Hidden rows are still part of the data and
+        keep their indexes. The sort order is kept, and any selected rows that are hidden are selected again when
+        they are shown.
+
+        Args:
+            query: Either a string, in which case rows are shown if every word in the query is the start of a word
+                in the row (ignoring case), or a function that is given the data of a row as a list and returns
+                True if the row should be shown. None or an empty string shows all rows.
+            column (int): Optional column to search with a string query, indexed from 0. By default, all columns
+                are searched.
+
+        Raises:
+            TypeError: query is not a string, function or None
+            ValueError: column is not a valid column number
+        """
+        if query is not None and type(query) != str and not callable(query):
+            raise TypeError(f'The filter must be a string or a function. The value given was {query}')
+        if column is not None and (type(column) != int or column not in range(self._num_columns)):
+            raise ValueError(f'Column number must be an integer between 0 and {self._num_columns - 1}. '
+                             f'The value given was {column}.')
+
+        if self._provider is not None:
+            if callable(query):
+                raise TypeError('A table showing data from a data provider can only be filtered with a string')
+            self._filter = (query, column) if query else None
+            self._provider.filter(query or None, column)
+            self._provider_changed()
+            self._virtual_render()
+            return
+
+        # All rows need to be in the treeview before any are hidden
+        self._finish_loading()
+        previous = self._filter
+        self._filter = (query, column) if query else None
+        if self._virtual and (previous or self._filter):
+            # The rows shown change, so the view returns to the first of them
+            self._virtual_top = 0
+        if not self._filter:
+            self._show_matches(None)
+        elif self._filter_matches is not None and self._extends_filter(previous):
+            # Typing more of a query can only hide rows, so only the rows shown by the previous query are searched
+            self._show_matches(self._find_matches(self._filter_matches))
+        else:
+            self._show_matches(self._find_matches())
+
+    def _extends_filter(self, previous):
+        """Returns True if every row matching the current string filter also matches the previous filter, because
+        each word of the previous query is the start of the word in the same place in the current query"""
+        if not previous or callable(previous[0]) or callable(self._filter[0]) or previous[1] != self._filter[1]:
+            return False
+        previous_words, words = _tokens(previous[0]), _tokens(self._filter[0])
+        if not previous_words or len(words) < len(previous_words):
+            return False
+        return all(word.startswith(previous_word) for previous_word, word in zip(previous_words, words))
+
+    def _find_matches(self, candidates=None):
+        """Returns the set of ids of all rows that match the current filter
+
+        Args:
+            candidates (set): Optional ids of the rows to search, which must include every row that matches
+        """
+        query, column = self._filter
+        if callable(query):
+            return {row_id for row_id, row in self._rows.items() if query(row)}
+
+        # Each word in the query is looked up in the word index of each column searched. The matches of the first
+        # word are the rows containing it, and each word after that narrows down the matches.
+        columns = range(self._num_columns) if column is None else [column]
+        matches = candidates
+        for word in _tokens(query):
+            # The words in the index that start with the word, found in each column as a range of its vocabulary
+            ranges = []
+            after = word[:-1] + chr(ord(word[-1]) + 1)
+            for column_id in columns:
+                vocabulary, postings = self._column_word_index(column_id)
+                start = bisect.bisect_left(vocabulary, word)
+                ranges.append((vocabulary, postings, start, bisect.bisect_left(vocabulary, after, start)))
+
+            if matches is not None and len(matches) < sum(end - start for _, _, start, end in ranges):
+                # There are fewer rows left than words to look up, so the words of each row are checked instead
+                matches = {row_id for row_id in matches
+                           if any(token.startswith(word) for token in self._row_tokens(row_id, columns))}
+            else:
+                word_matches = set()
+                for vocabulary, postings, start, end in ranges:
+                    for token in itertools.islice(vocabulary, start, end):
+                        word_matches |= postings[token] if matches is None else matches & postings[token]
+                matches = word_matches
+            if not matches:
+                break
+        return set(self._rows) if matches is None else matches
+
+    def _row_matches(self, row_id):
+        """Returns True if a single row matches the current filter, without using the word index"""
+        query, column = self._filter
+        if callable(query):
+            return bool(query(self._rows[row_id]))
+        columns = range(self._num_columns) if column is None else [column]
+        tokens = self._row_tokens(row_id, columns)
+        return all(any(token.startswith(word) for token in tokens) for word in _tokens(query))
+
+    def _row_tokens(self, row_id, columns):
+        """Returns the words in the given columns of a row, as they are indexed for filtering"""
+        row = self._rows[row_id]
+        return [token for column_id in columns for token in _tokens(self._cell_text(column_id, row[column_id]))]
+
+    def _column_word_index(self, column_id):
+        """Returns the sorted list of words in a column, and a dictionary of the ids of the rows containing each
+        word. The index of a column is built the first time it is searched and then kept up to date as rows are
+        added and removed, so each change to the filter only needs to look up the words in the query.
+        """
+        postings = self._token_postings.get(column_id)
+        if postings is None:
+            postings = {}
+            for row_id, value in self._rows.column_items(column_id):
+                for token in _tokens(self._cell_text(column_id, value)):
+                    postings.setdefault(token, set()).add(row_id)
+            self._token_postings[column_id] = postings
+
+        vocabulary = self._token_vocabulary.get(column_id)
+        if vocabulary is None:
+            vocabulary = sorted(postings)
+            self._token_vocabulary[column_id] = vocabulary
+        return vocabulary, postings
+
+    def _show_matches(self, matches):
+        """Shows only the rows with ids in matches, or all rows if matches is None. Only the rows that have changed
+        from hidden to shown or the other way around are detached from or reattached to the treeview.
+        """
+        previous = self._filter_matches
+        if previous is None and matches is None:
+            return
+        if previous is None:
+            hidden = {row_id for row_id in self._rows if row_id not in matches}
+            shown = set()
+        elif matches is None:
+            hidden = set()
+            shown = {row_id for row_id in self._rows if row_id not in previous}
+        else:
+            hidden = previous - matches
+            shown = matches - previous
+        self._filter_matches = matches
+
+        if hidden and not shown and (previous is None or self._visible is not None):
+            # When rows are only hidden, the rows still shown are already in order
+            visible = self._order if previous is None else self._visible
+            self._visible = [row_id for row_id in visible if row_id in matches]
+        elif shown or previous is None or matches is None:
+            self._visible = None
+
+        # Selected rows that are hidden are remembered so they can be selected again when they are shown
+        selection = self._virtual_selection if self._virtual else set(self._selected_ids())
+        hidden_selection = hidden & selection
+        self._hidden_selection |= hidden_selection
+        reselect = shown & self._hidden_selection
+        self._hidden_selection -= reselect
+        if reselect and not self.multiple_selection and selection - hidden:
+            # In single selection mode, a row selected since the filter was changed takes priority
+            reselect = set()
+
+        if self._virtual:
+            self._virtual_selection = (self._virtual_selection - hidden) | reselect
+            self._virtual_render()
+            if (hidden_selection or reselect) and self._events['select']:
+                self._event('select')
+            return
+
+        if hidden_selection:
+            self._treeview.selection_remove(*hidden_selection)
+        if hidden:
+            self._treeview.detach(*hidden)
+        if shown:
+            visible = self._visible_order()
+            if len(shown) <= 50:
+                # Reattach a few rows individually at their position among the visible rows
+                for index, row_id in enumerate(visible):
+                    if row_id in shown:
+                        self._treeview.move(row_id, '', index)
+            else:
+                self._treeview.set_children('', *visible)
+        if reselect:
+            self._treeview.selection_add(*reselect)
+
+    def _treeview_select(self, tk_event):
+        """Processes the select event when the selection in the treeview changes
+
+        In virtual mode, the selection of the visible rows is merged into the selection of all rows. The select
+        event is only processed if that has changed, and not when the visible rows are simply redrawn.
+        """
+        if self._virtual:
+            visible_ids = self._visible_order()[self._virtual_top:self._virtual_top + len(self._virtual_items)]
+            shown = dict(zip(self._virtual_items, visible_ids))
+            chosen = {shown[item] for item in self._treeview.selection() if item in shown}
+            if self._virtual_click or (chosen and not self.multiple_selection):
+                selection = chosen
+            else:
+                # Keep any selected rows that are scrolled out of view
+                selection = (self._virtual_selection - set(shown.values())) | chosen
+            self._virtual_click = False
+
+            if self._treeview.focus() in shown:
+                self._virtual_focus = shown[self._treeview.focus()]
+            if selection == self._virtual_selection:
+                return
+            self._virtual_selection = selection
+
+        if self._events['select']:
+            self._event('select', tk_event)
+
+    def _new_row_id(self):
+        """Returns a unique id for a new row"""
+        return next(self._row_counter)
+
+    def _selected_ids(self):
+        """Returns the ids of the rows selected in the treeview, which returns the ids of its items as strings"""
+        return [int(item) for item in self._treeview.selection()]
+
+    def _position(self, row_id):
+        """Returns the index of the row with the given id
+
+        The index of each row is cached, so looking up a row is O(1) while rows are only added to the end or removed
+        from the start. Inserting, removing or moving a row anywhere else invalidates the cached indexes after it, and
+        the next lookup of one of those rows recalculates all of them in a single pass, so a mix of such changes and
+        lookups costs O(n) per change rather than O(log n).
+        """
+        if self._provider is not None:
+            return row_id  # The ids of the rows of a provider are their positions
+        position = self._positions.get(row_id)
+        if position is not None:
+            position -= self._position_base
+            if 0 <= position < self._positions_valid and self._order[position] == row_id:
+                return position
+
+        valid = self._positions_valid
+        if valid < len(self._order):
+            self._positions.update(zip(self._order[valid:], itertools.count(valid + self._position_base)))
+            self._positions_valid = len(self._order)
+            position = self._positions.get(row_id)
+            if position is not None and position >= valid + self._position_base:
+                return position - self._position_base
+        raise KeyError(row_id)
+
+    def _positions_changed(self, index, removed=0):
+        """Notes that rows have been inserted or removed at the given index, which changes the positions of the rows
+        after it. Removing rows from the start (such as the oldest rows of a live feed) only shifts the positions.
+
+        Args:
+            index (int): The index of the first row inserted or removed
+            removed (int): The number of rows removed from the start, if index is 0
+        """
+        if index == 0 and removed:
+            self._position_base += removed
+            self._positions_valid = max(self._positions_valid - removed, 0)
+        else:
+            self._positions_valid = min(self._positions_valid, index)
+        self._visible = None
+
+    def _order_changed(self):
+        """Notes that the order of all rows has changed, so that their positions are recalculated when needed"""
+        self._positions_changed(0)
+
+    def _visible_order(self):
+        """Returns the ids of the rows that are not hidden by the filter, in the order they are displayed"""
+        if self._filter_matches is None:
+            return self._order
+        if self._visible is None:
+            self._visible = [row_id for row_id in self._order if row_id in self._filter_matches]
+        return self._visible
+
+    def _visible_position(self, row_id):
+        """Returns the index of a row among the rows that are not hidden by the filter"""
+        if self._filter_matches is None:
+            return self._position(row_id)
+        # The cached indexes are checked against the rows they point to, since the filtered order is rebuilt whenever
+        # rows are inserted, removed or moved. As with _position, rebuilding them is a single O(n) pass.
+        visible = self._visible_order()
+        position = self._visible_positions.get(row_id)
+        if position is None or position >= len(visible) or visible[position] != row_id:
+            self._visible_positions = dict(zip(visible, itertools.count()))
+            position = self._visible_positions.get(row_id)
+            if position is None:
+                raise ValueError(f'{row_id} is not a visible row')
+        return position
+
+    def _is_visible(self, row_id):
+        """Returns True if the row is not hidden by the filter"""
+        return self._filter_matches is None or row_id in self._filter_matches
+
+    def _virtual_page_size(self):
+        """Returns the number of rows that fit in the visible area of the table in virtual mode"""
+        if self._virtual_items and self._treeview.winfo_ismapped():
+            bbox = self._treeview.bbox(self._virtual_items[0])
+            if bbox:
+                x, y, width, height = bbox
+                return max(1, (self._treeview.winfo_height() - y) // height)
+
+        # Before the table is shown, use the height setting of the table
+        return int(self._treeview.cget('height'))
+
+    def _virtual_render(self, _event=None):
+        """Shows the visible rows in virtual mode by recycling a small pool of treeview items. The _event parameter
+        is needed so that this can be used as the <Configure> callback when the table changes size.
+        """
+        page_size = self._virtual_page_size()
+        rows = self._visible_order()
+        total = len(rows)
+        self._virtual_top = max(0, min(self._virtual_top, total - page_size))
+        visible_ids = rows[self._virtual_top:self._virtual_top + page_size + self.virtual_overscan]
+
+        # Grow or shrink the pool of items to match the number of rows being shown
+        while len(self._virtual_items) < len(visible_ids):
+            self._virtual_items.append(self._treeview.insert('', 'end'))
+        if len(self._virtual_items) > len(visible_ids):
+            self._treeview.delete(*self._virtual_items[len(visible_ids):])
+            del self._virtual_items[len(visible_ids):]
+
+        # Show the data of each visible row and whether or not it is selected
+        selected_items = []
+        for item, row_id, row in zip(self._virtual_items, visible_ids, self._rows.get_rows(visible_ids)):
+            self._treeview.item(item, values=self._display_values(row))
+            if row_id in self._virtual_selection:
+                selected_items.append(item)
+        if set(self._treeview.selection()) != set(selected_items):
+            self._treeview.selection_set(selected_items)
+
+        # The treeview itself never scrolls - the scrollbar shows the position of the visible rows in the data
+        self._treeview.yview_moveto(0)
+        if total:
+            self._v_scrollbar.set(self._virtual_top / total, min(1, (self._virtual_top + page_size) / total))
+        else:
+            self._v_scrollbar.set(0, 1)
+
+    def _virtual_scroll_to(self, top):
+        """Scrolls so that the row at the given index is the first visible row in virtual mode"""
+        top = max(0, min(top, len(self._visible_order()) - self._virtual_page_size()))
+        if top != self._virtual_top:
+            self._virtual_top = top
+            self._virtual_render()
+
+    def _virtual_see(self, index):
+        """Scrolls the row at the given index into view in virtual mode"""
+        page_size = self._virtual_page_size()
+        if index < self._virtual_top:
+            self._virtual_scroll_to(index)
+        elif index >= self._virtual_top + page_size:
+            self._virtual_scroll_to(index - page_size + 1)
+
+    def _virtual_yview(self, *args):
+        """The command for the vertical scrollbar in virtual mode"""
+        if args[0] == 'moveto':
+            top = round(float(args[1]) * len(self._visible_order()))
+        else:
+            # Arguments are of the form ('scroll', amount, 'units' or 'pages')
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self._virtual_page_size()
+            top = self._virtual_top + amount
+        self._virtual_scroll_to(top)
+
+    def _virtual_mousewheel(self, event):
+        """Scrolls through the data with the mouse wheel in virtual mode"""
+        self._virtual_scroll_to(self._virtual_top + _mousewheel_rows(event))
+        return 'break'
+
+    def _virtual_mouse_down(self, event):
+        """Notes whether a row has been clicked on without shift or control, which replaces the selection"""
+        if self._treeview.identify_region(event.x, event.y) in ('cell', 'tree'):
+            self._virtual_click = not event.state & (_shift_modifier | _command_modifiers)
+
+    def _virtual_keypress(self, event):
+        """Keyboard navigation in virtual mode, which moves the selection through the data"""
+        rows = self._visible_order()
+        total = len(rows)
+        if not total:
+            return 'break'
+
+        page_size = self._virtual_page_size()
+        steps = {'Up': -1, 'Down': 1, 'Prior': -page_size, 'Next': page_size}
+        if event.keysym == 'Home':
+            index = 0
+        elif event.keysym == 'End':
+            index = total - 1
+        elif self._virtual_focus in self._rows and self._is_visible(self._virtual_focus):
+            index = self._visible_position(self._virtual_focus) + steps[event.keysym]
+        else:
+            index = self._virtual_top
+        index = max(0, min(index, total - 1))
+
+        self._virtual_see(index)
+        self._virtual_select([rows[index]])
+        return 'break'
+
+    def _virtual_select(self, row_ids):
+        """Sets the selected rows in virtual mode, processing the select event if the selection has changed"""
+        row_ids = list(row_ids)
+        if row_ids:
+            self._virtual_focus = row_ids[-1]
+        if set(row_ids) != self._virtual_selection:
+            self._virtual_selection = set(row_ids)
+            self._virtual_render()
+            if self._events['select']:
+                self._event('select')
 
     @property
     def data(self):
         """Gets or sets all data in the table as a list of lists"""
-        return [self._treeview.item(line)['values'] for line in self._treeview.get_children()]
+        return self._rows.get_rows(self._order)
 
     @data.setter
     def data(self, values):
+        self.load_data(values)
+
+    def load_data(self, values, progress=None, complete=None):
+        """Sets all data in the table without freezing the window
+
+        Rows are added to the table in batches while the window continues to respond to the user, so that large
+        amounts of data can be loaded. The data property includes all rows, even those still waiting to be shown.
+
+        Args:
+            values: A list of lists of the data for the table
+            progress: Optional function that is called after each batch of rows is added, with the percentage
+                of rows loaded as an integer between 0 and 100, or a Progressbar to update
+            complete: Optional function, with no arguments, that is called when all rows have been added
+
+        Raises:
+            ValueError: values is not a list of lists
+            ValueError: the number of items in a row does not match the number of columns in the table
+            ValueError: a value cannot be converted to the type of its column
+        """
         if not all(type(row) in (list, tuple) for row in values):
             raise ValueError('Table data must be a list of lists')
         if not all(len(row) == self._num_columns for row in values):
             raise ValueError('Could not set table data - the number of columns of the table does not match')
 
+        if self._max_rows is not None:
+            # Only the most recent rows are kept
+            values = values[max(len(values) - self._max_rows, 0):]
+        # Convert all values before clearing the existing data, in case any are not valid
+        values = [self._typed_row(line) for line in values]
+
         self.clear()
         for line in values:
-            self._treeview.insert('', 'end', values=line)
+            row_id = self._new_row_id()
+            self._rows[row_id] = line
+            self._order.append(row_id)
+        self._widen_columns(self._order)
+        self._start_loading(progress, complete)
+
+    @classmethod
+    def from_array(cls, container, array, headings=None):
+        """Creates a new Table showing the data in a NumPy array. The array is used directly rather than copied, and
+        the Table is in virtual mode so only the rows in view are converted to text. Columns of numbers and dates
+        are sorted by NumPy.
+
+        Args:
+            container: The window or container to which the widget will be added
+            array: A two-dimensional NumPy array, or a structured array with a column for each field
+            headings: Optional list of strings for the headings of the Table, which defaults to the field names of
+                a structured array
+
+        Raises:
+            TypeError: array is not a NumPy array
+            ValueError: array is not a two-dimensional or structured array
+            ValueError: the number of headings does not match the number of columns
+        """
+        import numpy
+        if not isinstance(array, numpy.ndarray):
+            raise TypeError(f'The data must be a NumPy array. The value given was of type {type(array).__name__}')
+        if array.ndim == 1 and array.dtype.names:
+            columns = [array[name] for name in array.dtype.names]
+            default_headings = list(array.dtype.names)
+        elif array.ndim == 2:
+            columns = [array[:, index] for index in range(array.shape[1])]
+            default_headings = [f'Column {index + 1}' for index in range(array.shape[1])]
+        else:
+            raise ValueError('The array must be two-dimensional or a structured array')
+        return cls._from_columns(container, columns, default_headings if headings is None else headings)
+
+    @classmethod
+    def from_dataframe(cls, container, dataframe):
+        """Creates a new Table showing the data in a pandas DataFrame, with its column names as headings. The data
+        of the columns is used directly rather than copied where possible, and the Table is in virtual mode so only
+        the rows in view are converted to text. Columns of numbers and dates are sorted by NumPy.
+
+        Args:
+            container: The window or container to which the widget will be added
+            dataframe: A pandas DataFrame
+
+        Raises:
+            TypeError: dataframe is not a pandas DataFrame
+        """
+        import pandas
+        if not isinstance(dataframe, pandas.DataFrame):
+            raise TypeError(f'The data must be a pandas DataFrame. '
+                            f'The value given was of type {type(dataframe).__name__}')
+        columns = [dataframe.iloc[:, index].to_numpy() for index in range(dataframe.shape[1])]
+        return cls._from_columns(container, columns, [str(name) for name in dataframe.columns])
+
+    @classmethod
+    def _from_columns(cls, container, columns, headings):
+        """Creates a new Table in virtual mode showing a list of NumPy arrays, one for each column"""
+        if len(headings) != len(columns):
+            raise ValueError(f'The number of headings ({len(headings)}) does not match '
+                             f'the number of columns in the data ({len(columns)})')
+        table = cls(container, headings)
+        table.virtual = True
+        table._load_columns(columns)
+        return table
+
+    def _load_columns(self, columns):
+        """Sets the data of the table to a list of NumPy arrays, one for each column, without copying them"""
+        # Dates and times are viewed in microseconds, which are converted to Python datetime objects
+        columns = [column.astype('datetime64[us]') if column.dtype.kind == 'M' else column for column in columns]
+
+        self.clear()
+        column_types = {'i': 'int', 'u': 'int', 'f': 'float', 'b': 'bool'}
+        for column_id, column in enumerate(columns):
+            self._column_types[column_id] = column_types.get(column.dtype.kind)
+        self._rows = _ArrayRows(columns, self._column_types)
+
+        # The ids of the rows of the source are their indexes
+        self._order = list(range(len(self._rows)))
+        self._row_counter = itertools.count(len(self._order))
+        self._start_loading()
+
+    def _start_loading(self, progress=None, complete=None):
+        """Shows the rows after the data of the table has been replaced"""
+        if self._filter:
+            # Any filter remains in place when the data is replaced
+            self._filter_matches = self._find_matches()
+            self._visible = None
+
+        if self._virtual:
+            # Only the visible rows are added to the treeview in virtual mode
+            self._virtual_render()
+            self._report_progress(progress, 100)
+            if complete:
+                complete()
+        else:
+            # Add the first batch straight away and the remainder when the window is idle
+            self._pending_index = 0
+            self._load_progress = progress
+            self._load_complete = complete
+            self._load_batch()
+
+    def _load_batch(self, time_budget=None):
+        """Adds the next batch of rows from load_data() to the treeview, and schedules the following batch for when
+        the window is next idle
+
+        Args:
+            time_budget (float): Time in seconds to spend adding rows, defaults to the load_time_budget setting
+        """
+        self._load_id = None
+        deadline = time.perf_counter() + (time_budget or self.load_time_budget)
+        index = self._pending_index
+        total = len(self._order)
+        hidden = []
+        while index < total:
+            row_id = self._order[index]
+            self._treeview.insert('', 'end', iid=row_id, values=self._display_values(self._rows[row_id]))
+            if not self._is_visible(row_id):
+                hidden.append(row_id)
+            index += 1
+            if time.perf_counter() > deadline:
+                break
+        self._pending_index = index
+
+        # Every row has an item in the treeview, and those that do not match the filter are detached
+        if hidden:
+            self._treeview.detach(*hidden)
+
+        progress, complete = self._load_progress, self._load_complete
+        if index < total:
+            self._load_id = self.after_idle(self._load_batch)
+        else:
+            self._load_progress = self._load_complete = None
+
+        self._report_progress(progress, int(index / total * 100) if total else 100)
+        if complete and not self._load_id:
+            complete()
+
+    @staticmethod
+    def _report_error(error, exception):
+        """Passes an error from loading or saving a CSV file in the background to the error function if there is one,
+        or raises it to be reported by the window otherwise"""
+        if not error:
+            raise exception
+        error(exception)
+
+    @staticmethod
+    def _report_progress(progress, percent):
+        """Reports the progress of loading or saving to either a function or a Progressbar"""
+        if isinstance(progress, Progressbar):
+            progress.value = percent
+        elif progress:
+            progress(percent)
+
+    def _finish_loading(self):
+        """Immediately adds any rows that are still waiting to be added by load_data()"""
+        if self._load_id:
+            self.after_cancel(self._load_id)
+            self._load_batch(float('inf'))
+
+    def load_csv(self, path, header=True, progress=None, complete=None, encoding='utf-8', error=None):
+        """Sets all data in the table from a CSV file without freezing the window
+
+        The file is read in the background and rows are added to the table as they are read, so large files can be
+        loaded while the window continues to respond to the user. Values are converted to the types of any typed
+        columns. The data property includes the rows read so far.
+
+        Args:
+            path (str): The path of the CSV file
+            header (bool): Whether the first line of the file is a line of headings, which is skipped
+            progress: Optional function that is called as the file is loaded, with the percentage loaded as an
+                integer between 0 and 100, or a Progressbar to update
+            complete: Optional function, with no arguments, that is called when all rows have been added
+            encoding (str): The encoding of the file, which defaults to 'utf-8'
+            error: Optional function that is called with the exception if the file cannot be read after loading has
+                started, which is an OSError, a csv.Error, or a ValueError if a line of the file does not have a value
+                for each column or a value cannot be converted to the type of its column. Loading stops at that line,
+                and complete is not called. Without this function, the exception is reported by the window.
+
+        Raises:
+            OSError: the file could not be opened
+        """
+        file = open(path, newline='', encoding=encoding)
+        size = os.fstat(file.fileno()).st_size  # Found before the file is closed by the thread reading it
+        self.clear()
+        self._pending_index = 0
+        self._import_chunks = queue.Queue(maxsize=8)
+        self._import_stop = threading.Event()
+        thread = threading.Thread(target=_read_csv, daemon=True,
+                                  args=(file, header, list(self._column_types), self._import_chunks, self._import_stop))
+        thread.start()
+        self._import_rows(size or 1, 0, progress, complete, error)
+
+    def _import_rows(self, size, position, progress, complete, error):
+        """Adds the rows read so far by load_csv() to the data, leaving them to be added to the treeview in batches,
+        and checks for more rows shortly afterwards
+
+        Args:
+            size (int): The size of the file in bytes
+            position (int): The number of bytes of the file read so far
+        """
+        self._import_id = None
+        deadline = time.perf_counter() + self.load_time_budget
+        finished = False
+        while not finished and time.perf_counter() < deadline:
+            try:
+                rows, read = self._import_chunks.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(rows, Exception):
+                self._stop_import()
+                self._report_error(error, rows)
+                return
+            self._store_rows(rows)
+            finished = read is None
+            position = read or position
+        self._remove_excess_rows()
+
+        if self._virtual:
+            self._virtual_render()
+        elif not self._load_id and self._pending_index < len(self._order):
+            self._load_batch()
+
+        if not finished:
+            # Progress takes into account both the file being read and the rows being added to the treeview
+            shown = self._pending_index / len(self._order) if self._order and not self._virtual else 1
+            self._report_progress(progress, int(min(position / size, 1) * shown * 100))
+            self._import_id = self.after(20, self._import_rows, size, position, progress, complete, error)
+            return
+
+        self._import_chunks = self._import_stop = None
+        if self._load_id:
+            # The last batch added to the treeview reports the progress and completion
+            self._load_progress, self._load_complete = progress, complete
+        else:
+            self._report_progress(progress, 100)
+            if complete:
+                complete()
+
+    def _stop_import(self):
+        """Stops reading a CSV file started by load_csv()"""
+        if self._import_stop:
+            self._import_stop.set()
+        if self._import_id:
+            self.after_cancel(self._import_id)
+        self._import_chunks = self._import_stop = self._import_id = None
+
+    def save_csv(self, path, header=True, progress=None, complete=None, encoding='utf-8', error=None):
+        """Saves all data in the table to a CSV file without freezing the window
+
+        Rows are passed to a background thread to be written to the file a batch at a time, so the contents of the
+        file are never held in memory. Rows removed from the table while it is being saved are not saved.
+
+        Args:
+            path (str): The path of the CSV file
+            header (bool): Whether to write the headings of the table as the first line of the file
+            progress: Optional function that is called as the file is saved, with the percentage saved as an
+                integer between 0 and 100, or a Progressbar to update
+            complete: Optional function, with no arguments, that is called when the file has been saved
+            encoding (str): The encoding of the file, which defaults to 'utf-8'
+            error: Optional function that is called with the exception, an OSError or csv.Error, if the file cannot
+                be written. Saving stops, and complete is not called. Without this function, the exception is
+                reported by the window.
+
+        Raises:
+            OSError: the file could not be opened
+        """
+        file = open(path, 'w', newline='', encoding=encoding)
+        chunks = queue.Queue(maxsize=8)
+        errors = []
+        writer = threading.Thread(target=_write_csv, args=(file, chunks, errors), daemon=True)
+        writer.start()
+        if header:
+            chunks.put([self._headings])
+        self._export_rows(list(self._order), 0, chunks, writer, errors, progress, complete, error)
+
+    def _export_rows(self, row_ids, index, chunks, writer, errors, progress, complete, error, batch_size=1000):
+        """Passes the next batches of rows to be written by save_csv() to the writing thread"""
+        deadline = time.perf_counter() + self.load_time_budget
+        while writer.is_alive() and not chunks.full() and time.perf_counter() < deadline:
+            if index >= len(row_ids):
+                # Mark the end of the rows, then wait for the thread to finish writing them
+                chunks.put(None)
+                self._finish_export(writer, errors, progress, complete, error)
+                return
+            batch = [row_id for row_id in row_ids[index:index + batch_size] if row_id in self._rows]
+            chunks.put(self._rows.get_rows(batch))
+            index += batch_size
+
+        if not writer.is_alive():
+            # Writing has stopped because of an error
+            self._finish_export(writer, errors, progress, complete, error)
+            return
+        self._report_progress(progress, int(index / len(row_ids) * 100))
+        self.after(10, self._export_rows, row_ids, index, chunks, writer, errors, progress, complete, error)
+
+    def _finish_export(self, writer, errors, progress, complete, error):
+        """Waits for the thread writing the file for save_csv() to finish"""
+        if writer.is_alive():
+            self.after(20, self._finish_export, writer, errors, progress, complete, error)
+            return
+        if errors:
+            self._report_error(error, errors[0])
+            return
+        self._report_progress(progress, 100)
+        if complete:
+            complete()
 
     @property
     def multiple_selection(self):
@@ -2678,50 +5362,72 @@ class Table(Container, GooeyPieWidget):
         Returns:
             The selected row as a list, or a list of lists for multiple selection, or None if no row is selected.
         """
-        selected_ids = self._treeview.selection()
+        if self._virtual:
+            selected_ids = sorted(self._virtual_selection, key=self._position)
+        else:
+            selected_ids = list(reversed(self._selected_ids()))
+
         if not selected_ids:
             return None
         if self.multiple_selection:
-            return [self._treeview.item(row_id)['values'] for row_id in reversed(selected_ids)]
+            return [self._rows[row_id] for row_id in selected_ids]
         else:
-            return self._treeview.item(selected_ids)['values']
+            return self._rows[selected_ids[0]]
 
     @property
     def selected_row(self):
         """Gets or sets the index(es), starting from 0, of the selected row. Returns None if nothing
         is selected. Returns a list of indexes if multiple selections are enabled.
         """
-        selected_ids = self._treeview.selection()
-        all_ids = self._treeview.get_children()
+        if self._virtual:
+            indexes = sorted(self._position(row_id) for row_id in self._virtual_selection)
+            if not indexes:
+                return None
+            return indexes if self.multiple_selection else indexes[0]
+
+        # Indexes are positions in the data, which includes any rows hidden by the filter
+        selected_ids = self._selected_ids()
 
         if not selected_ids:
             return None
         if self.multiple_selection:
-            return [all_ids.index(selected) for selected in selected_ids]
+            return [self._position(selected) for selected in selected_ids]
         else:
-            return all_ids.index(selected_ids[0])
+            return self._position(selected_ids[0])
 
     @selected_row.setter
     def selected_row(self, index):
         """Adds to the current selection if multiple selection is set"""
-        all_rows = self._treeview.get_children()
-        if len(self._treeview.get_children()) == 0:
+        self._finish_loading()
+        all_rows = self._order
+        if len(all_rows) == 0:
             raise ValueError(f'No items in Table to select')
         if index not in range(len(all_rows)):
             raise ValueError(f'The index must be in the range 0 to {len(all_rows) - 1}. '
                              f'The value of the index specified was {index}.')
+        item_id = all_rows[index]
+        if not self._is_visible(item_id):
+            raise ValueError(f'The row at index {index} is hidden by the filter and cannot be selected')
+
+        if self._virtual:
+            if not self.multiple_selection:
+                self._hidden_selection.clear()
+            selection = list(self._virtual_selection) if self.multiple_selection else []
+            self._virtual_select(selection + [item_id])
+            self._virtual_see(self._visible_position(item_id))
+            return
 
         # Clear the current selection if single selection only
         if not self.multiple_selection:
             self.select_none()
 
         # Select the item specified by the index
-        item_id = all_rows[index]
         self._treeview.selection_add(item_id)
         self._treeview.see(item_id)  # Show the selected row (in case it is not be in view)
 
     def add_row_at(self, index, data):
-        """Adds a row of data to the table at a given index
+        """Adds a row of data to the table at a given index. If keep_sorted is set and the table is sorted, the row
+        is added at its place in the sort order instead.
 
         Args:
             index (int): The index at which to add the row
@@ -2731,7 +5437,10 @@ class Table(Container, GooeyPieWidget):
             TypeError: index is not an integer
             TypeError: data is not a list type
             ValueError: the length of data does not match the number of columns in the table
+            ValueError: a value cannot be converted to the type of its column
+            GooeyPieError: the table shows data from a data provider
         """
+        self._check_no_provider('Rows cannot be added')
 
         # Check if location is an integer
         if type(index) != int and index != 'end':
@@ -2743,10 +5452,58 @@ class Table(Container, GooeyPieWidget):
             raise ValueError(f'The number of data arguments given ({len(data)}) does not match '
                              f'the number of columns in the table ({self._num_columns})')
 
-        self._treeview.insert('', index, values=data)
+        # Rows added to the end while data is loading are added to the treeview after the rows still to come
+        if self._load_id and index != 'end':
+            self._finish_loading()
+
+        data = self._typed_row(data)
+        row_id = self._new_row_id()
+        self._rows[row_id] = data
+        self._index_row(row_id)
+        visible = not self._filter or self._row_matches(row_id)
+        keep_sorted = self._keep_sorted and self._sort_columns
+        if keep_sorted:
+            index = self._sorted_index(row_id)
+            if index == len(self._order):
+                index = 'end'
+        if self._filter and visible:
+            self._filter_matches.add(row_id)
+
+        if index == 'end':
+            # The positions of the existing rows are unchanged
+            self._order.append(row_id)
+            if self._visible is not None and visible:
+                self._visible.append(row_id)
+        else:
+            # Negative indexes add the row to the top, as they do in the treeview
+            index = max(index, 0)
+            self._order.insert(index, row_id)
+            self._positions_changed(index)
+
+        if self._virtual:
+            self._virtual_render()
+        elif not self._load_id:
+            self._insert_item(row_id, index)
+        self._widen_columns([row_id])
+
+        # Clear any sort icons if new data is added out of order
+        if not keep_sorted:
+            self._clear_sort_icons()
+        self._remove_excess_rows()
 
-        # Clear any sort icons if new data is added
-        self._clear_sort_icons()
+    def _insert_item(self, row_id, index):
+        """Adds the item for a row to the treeview, detaching it if it does not match the filter
+
+        Args:
+            row_id: The id of the row
+            index: The index of the row in the data, or 'end'
+        """
+        if self._filter and index != 'end':
+            # The treeview only contains the rows that match the filter
+            index = sum(1 for other_id in self._order[:index] if other_id in self._filter_matches)
+        self._treeview.insert('', index, iid=row_id, values=self._display_values(self._rows[row_id]))
+        if not self._is_visible(row_id):
+            self._treeview.detach(row_id)
 
     def add_row(self, data):
         """Adds a row of data to the end of the table
@@ -2764,10 +5521,261 @@ class Table(Container, GooeyPieWidget):
         """
         self.add_row_at(0, data)
 
+    def append_rows(self, rows):
+        """Adds rows of data to the end of the table when the window is next idle. All rows appended before then
+        are added in a single update, so rows can be appended many times a second, such as from a live feed. The
+        table scrolls to show the new rows only if it was already scrolled to the bottom.
+
+        Args:
+            rows: A list of lists of data to add to the table
+
+        Raises:
+            ValueError: rows is not a list of lists
+            ValueError: the number of items in a row does not match the number of columns in the table
+            ValueError: a value cannot be converted to the type of its column
+            GooeyPieError: the table shows data from a data provider
+        """
+        self._check_no_provider('Rows cannot be appended')
+        if not all(type(row) in (list, tuple) for row in rows):
+            raise ValueError('Rows must be a list of lists')
+        if not all(len(row) == self._num_columns for row in rows):
+            raise ValueError('Could not append rows - the number of columns of the table does not match')
+
+        self._append_queue.extend([self._typed_row(row) for row in rows])
+        if not self._append_id:
+            self._append_id = self.after_idle(self._flush_appended_rows)
+
+    def _flush_appended_rows(self):
+        """Adds the rows queued by append_rows() to the table in one update"""
+        self._append_id = None
+        rows, self._append_queue = self._append_queue, []
+        if self._max_rows is not None:
+            # Rows that would be removed straight away are never added
+            rows = rows[max(len(rows) - self._max_rows, 0):]
+        if not rows:
+            return
+
+        self._finish_loading()
+        at_bottom = self._at_bottom()
+        new_ids = self._store_rows(rows)
+
+        if not self._virtual:
+            for row_id in new_ids:
+                self._treeview.insert('', 'end', iid=row_id, values=self._display_values(self._rows[row_id]))
+            hidden = [row_id for row_id in new_ids if not self._is_visible(row_id)]
+            if hidden:
+                self._treeview.detach(*hidden)
+        if self._keep_sorted and self._sort_columns:
+            self._resort_rows(new_ids)
+        else:
+            self._clear_sort_icons()
+        if self._virtual and at_bottom:
+            self._virtual_top = len(self._order)  # Limited to the last page when the rows are shown
+
+        if not self._remove_excess_rows() and self._virtual:
+            self._virtual_render()
+        if at_bottom and not self._virtual:
+            self._treeview.yview_moveto(1)
+
+    def _store_rows(self, rows):
+        """Adds rows of data, already converted to the types of the columns, to the end of the data without adding
+        them to the treeview
+
+        Returns:
+            A list of the ids of the new rows
+        """
+        new_ids = []
+        for row in rows:
+            row_id = self._new_row_id()
+            self._rows[row_id] = row
+            self._index_row(row_id)
+            if self._filter and self._row_matches(row_id):
+                self._filter_matches.add(row_id)
+            new_ids.append(row_id)
+        self._order.extend(new_ids)
+        self._visible = None
+        self._widen_columns(new_ids)
+        return new_ids
+
+    def find(self, key):
+        """Finds a row by its value in the key column
+
+        Args:
+            key: The value in the key column of the row to find
+
+        Returns:
+            The index of the row, or None if there is no row with the key
+
+        Raises:
+            GooeyPieError: the key column of the table has not been set
+        """
+        if self._key_column is None:
+            raise GooeyPieError('Rows cannot be found until the key_column of the table has been set')
+        column_type = self._column_types[self._key_column]
+        if column_type:
+            try:
+                key = _convert_value(key, column_type)
+            except ValueError:
+                return None
+        row_id = self._key_lookup().get(key)
+        return None if row_id is None else self._position(row_id)
+
+    def upsert(self, rows, remove_missing=False):
+        """Updates the rows that have the same keys as the given rows, and adds the rows with new keys to the table.
+        Only the cells that have changed are updated, so the selection and scroll position are kept. If the table is
+        sorted, changed and new rows are moved to their place in the sort order.
+
+        Args:
+            rows: A list of lists of data. If more than one row has the same key, the last one is used.
+            remove_missing (bool): If True, rows with keys that are not in the given rows are removed, so that the
+                table is refreshed to show only the given rows
+
+        Raises:
+            GooeyPieError: the key column of the table has not been set
+            ValueError: rows is not a list of lists
+            ValueError: the number of items in a row does not match the number of columns in the table
+            ValueError: a value cannot be converted to the type of its column
+            GooeyPieError: the table shows data from a data provider
+        """
+        if self._key_column is None:
+            raise GooeyPieError('Rows cannot be upserted until the key_column of the table has been set')
+        self._check_no_provider('Rows cannot be upserted')
+        if not all(type(row) in (list, tuple) for row in rows):
+            raise ValueError('Rows must be a list of lists')
+        if not all(len(row) == self._num_columns for row in rows):
+            raise ValueError('Could not upsert rows - the number of columns of the table does not match')
+        latest = {}
+        for row in rows:
+            row = self._typed_row(row)
+            latest[row[self._key_column]] = row
+
+        self._finish_loading()
+        key_index = self._key_lookup()
+        sort_columns = {column_id for column_id, descending in self._sort_columns}
+        new_rows = []
+        changed_ids = []
+        moved_ids = []
+        for key, row in latest.items():
+            row_id = key_index.get(key)
+            if row_id is None:
+                new_rows.append(row)
+                continue
+
+            old_row = self._rows[row_id]
+            changed = [column_id for column_id in range(self._num_columns) if old_row[column_id] != row[column_id]]
+            if not changed:
+                continue
+            self._unindex_cells(row_id, old_row, changed)
+            self._rows[row_id] = row
+            self._index_cells(row_id, row, changed)
+            changed_ids.append(row_id)
+            if sort_columns.intersection(changed):
+                moved_ids.append(row_id)
+            if not self._virtual:
+                for column_id in changed:
+                    self._treeview.set(row_id, column_id, self._cell_text(column_id, row[column_id]))
+
+        if remove_missing:
+            self._delete_rows([row_id for row_id, key in self._rows.column_items(self._key_column)
+                               if key not in latest])
+
+        if new_rows:
+            new_ids = self._store_rows(new_rows)
+            if not self._virtual:
+                for row_id in new_ids:
+                    self._insert_item(row_id, 'end')
+            if self._sort_columns:
+                moved_ids.extend(new_ids)
+        if moved_ids:
+            self._resort_rows(moved_ids)
+        self._widen_columns(changed_ids)
+
+        if self._filter and changed_ids:
+            # Changed rows are shown or hidden if they now match the filter or not
+            matches = set(self._filter_matches)
+            for row_id in changed_ids:
+                if self._row_matches(row_id):
+                    matches.add(row_id)
+                else:
+                    matches.discard(row_id)
+            self._show_matches(matches)
+
+        if self._virtual:
+            self._virtual_render()
+        self._remove_excess_rows()
+
+    def _key_lookup(self):
+        """Returns a dictionary of the row id of each value in the key column, building it if needed"""
+        if self._key_index is None:
+            self._key_index = {}
+            for row_id, key in self._rows.column_items(self._key_column):
+                self._key_index.setdefault(key, row_id)
+        return self._key_index
+
+    def _at_bottom(self):
+        """Returns True if the table is scrolled to the bottom, so that the last row is in view"""
+        if self._virtual:
+            return self._virtual_top + self._virtual_page_size() >= len(self._visible_order())
+        return self._treeview.yview()[1] >= 1
+
+    def _remove_excess_rows(self):
+        """Removes the rows after the top_rows rows in the sort order if keep_sorted is set, and then the rows that
+        were added first if there are more rows than max_rows
+
+        Returns:
+            True if any rows were removed
+        """
+        removed = False
+        if self._keep_sorted and self._sort_columns and self._top_rows is not None and \
+                len(self._order) > self._top_rows:
+            self._delete_rows(self._order[self._top_rows:])
+            removed = True
+
+        excess = len(self._rows) - self._max_rows if self._max_rows is not None else 0
+        if excess > 0:
+            # Row ids are added to self._rows in the order the rows were added, regardless of where they are displayed
+            self._delete_rows(list(itertools.islice(self._rows, excess)))
+            removed = True
+        return removed
+
     def clear(self):
-        """Removes all data from the table"""
-        for row_id in self._treeview.get_children():
-            self._treeview.delete(row_id)
+        """Removes all data from the table, including any rows still waiting to be added by load_data()"""
+        if self._load_id:
+            self.after_cancel(self._load_id)
+            self._load_id = None
+            self._load_progress = self._load_complete = None
+        if self._append_id:
+            self.after_cancel(self._append_id)
+            self._append_id = None
+        self._append_queue.clear()
+        self._stop_import()
+
+        if isinstance(self._rows, (_ArrayRows, _ProviderRows)):
+            # Release the source of the data
+            self._rows = _TableRows(self._column_types)
+            self._provider = None
+        self._rows.clear()
+        self._order = []
+        self._positions.clear()
+        self._position_base = 0
+        self._visible_positions.clear()
+        self._order_changed()
+        self._key_index = None
+        self._sort_keys.clear()
+        self._token_postings.clear()
+        self._token_vocabulary.clear()
+        self._hidden_selection.clear()
+        if self._filter:
+            self._filter_matches = set()
+        self._clear_sort_icons()
+
+        if self._virtual:
+            self._virtual_selection.clear()
+            self._virtual_focus = None
+            self._virtual_top = 0
+            self._virtual_render()
+        else:
+            self._treeview.delete(*self._treeview.get_children())
 
     def remove_row(self, index):
         """Removes the specified row from the table
@@ -2778,16 +5786,25 @@ class Table(Container, GooeyPieWidget):
         Raises:
             TypeError: index is not an integer
             ValueError: index is not in a valid range
+            GooeyPieError: the table shows data from a data provider
         """
-        row_ids = self._treeview.get_children()
+        self._check_no_provider('Rows cannot be removed')
+        self._finish_loading()
         if type(index) != int:
             raise TypeError(f'index must be an integer. The value provided was {index}')
-        if index < 0 or index > len(row_ids) - 1:
-            raise ValueError(f'The index must be between 0 and {len(row_ids) - 1}. '
+        if index < 0 or index > len(self._order) - 1:
+            raise ValueError(f'The index must be between 0 and {len(self._order) - 1}. '
                              f'The value of index was {index}')
-        row_data = self._treeview.item(row_ids[index])['values']
-        self._treeview.delete(row_ids[index])
-        return row_data
+
+        row_id = self._order.pop(index)
+        self._positions_changed(index, removed=1)
+        self._unindex_row(row_id)
+        if self._virtual:
+            self._virtual_selection.discard(row_id)
+            self._virtual_render()
+        else:
+            self._treeview.delete(row_id)
+        return self._rows.pop(row_id)
 
     def remove_selected(self):
         """Removes the currently selected row from the table
@@ -2796,10 +5813,52 @@ class Table(Container, GooeyPieWidget):
             A list of strings of the data from the table, a list of lists if multiple rows are selected or
                 None if no rows are selected
         """
+        self._finish_loading()
         row_data = self.selected
-        self._treeview.delete(*self._treeview.selection())
+        selected_ids = self._virtual_selection if self._virtual else self._selected_ids()
+        self._delete_rows(selected_ids)
         return row_data
 
+    def _delete_rows(self, row_ids):
+        """Removes the rows with the given ids from the data and the treeview. Rows that are still waiting to be added
+        to the treeview by load_data() or load_csv() are only removed from the data."""
+        self._check_no_provider('Rows cannot be removed')
+        row_ids = set(row_ids)
+        if not row_ids:
+            return
+        if self._virtual:
+            inserted = None
+        elif self._load_id or self._import_chunks is not None:
+            # Only the rows before the pending index have been added to the treeview
+            inserted = [row_id for row_id in self._order[:self._pending_index] if row_id in row_ids]
+            self._pending_index -= len(inserted)
+        else:
+            inserted = row_ids
+
+        if self._virtual:
+            # Keep the same rows in view when rows above them are removed
+            removed_above = sum(1 for row_id in self._visible_order()[:self._virtual_top] if row_id in row_ids)
+            self._virtual_top -= removed_above
+
+        # Only the positions of the rows after the first row removed change
+        first = next(index for index, row_id in enumerate(self._order) if row_id in row_ids)
+        leading = len(row_ids) if first == 0 and set(self._order[:len(row_ids)]) == row_ids else 0
+
+        for row_id in row_ids:
+            self._unindex_row(row_id)
+            del self._rows[row_id]
+        if leading:
+            del self._order[:leading]
+        else:
+            self._order = [row_id for row_id in self._order if row_id in self._rows]
+        self._positions_changed(first, removed=leading)
+
+        if self._virtual:
+            self._virtual_selection -= row_ids
+            self._virtual_render()
+        elif inserted:
+            self._treeview.delete(*inserted)
+
     def set_column_width(self, column, width):
         """Sets the width in pixels of the specified column, indexed from 0
 
@@ -2816,6 +5875,74 @@ class Table(Container, GooeyPieWidget):
         if type(width) != int or width <= 0:
             raise TypeError(f'Column width must be a positive integer. The value given was {width}.')
         self._treeview.column(column, width=width)
+        if self._text_widths is not None and column < self._num_columns:
+            # The column is no longer autosized
+            self._text_widths[column] = None
+
+    def autosize_columns(self, sample_size=300):
+        """Sets the width of each column to fit its heading and contents. The widths are estimated from a sample of
+        the rows, including the first and last rows, so that tables with many rows are sized quickly. Afterwards,
+        columns are widened as needed to fit rows that are added or changed.
+
+        Args:
+            sample_size (int): The number of rows measured
+
+        Raises:
+            ValueError: sample_size is not a positive integer
+        """
+        if type(sample_size) != int or sample_size < 1:
+            raise ValueError(f'The sample size must be a positive integer. The value given was {sample_size}')
+        self._autosize_sample_size = sample_size
+        self._cell_font = self._font_widths('Treeview', 'TkDefaultFont')
+
+        # Leave room in the headings for the sort icons
+        heading_font, widths = self._font_widths('Treeview.Heading', 'TkHeadingFont')
+        self._text_widths = [_text_width(heading_font, widths, f'{heading}{self.sort_descending_icon}9')
+                             for heading in self._headings]
+        self._fit_columns(self._order)
+        for column_id, width in enumerate(self._text_widths):
+            self._treeview.column(column_id, width=width + self._cell_padding)
+
+    _cell_padding = 16  # Space in pixels between the text and the edges of a cell
+
+    @staticmethod
+    def _font_widths(style, default_font):
+        """Returns the font used by a ttk style and the widths of the characters measured in it so far"""
+        text_font = font.Font(font=ttk.Style().lookup(style, 'font') or default_font)
+        return text_font, _character_widths.setdefault(tuple(sorted(text_font.actual().items())), {})
+
+    def _fit_columns(self, row_ids):
+        """Widens the autosized columns that are not wide enough for a sample of the given rows
+
+        Returns:
+            A list of the columns that were widened
+        """
+        if self._text_widths is None or not row_ids:
+            return []
+        sample_size = self._autosize_sample_size
+        if len(row_ids) > sample_size:
+            # The first and last rows, and rows chosen at random from between them
+            row_ids = list(row_ids)
+            ends = sample_size // 3
+            row_ids = row_ids[:ends] + row_ids[len(row_ids) - ends:] + \
+                random.sample(row_ids[ends:len(row_ids) - ends], sample_size - 2 * ends)
+
+        text_font, widths = self._cell_font
+        widened = set()
+        for row in self._rows.get_rows(row_ids):
+            for column_id, value in enumerate(row):
+                if self._text_widths[column_id] is None:
+                    continue
+                width = _text_width(text_font, widths, str(self._cell_text(column_id, value)))
+                if width > self._text_widths[column_id]:
+                    self._text_widths[column_id] = width
+                    widened.add(column_id)
+        return sorted(widened)
+
+    def _widen_columns(self, row_ids):
+        """Widens the autosized columns to fit rows that have been added or changed"""
+        for column_id in self._fit_columns(row_ids):
+            self._treeview.column(column_id, width=self._text_widths[column_id] + self._cell_padding)
 
     def set_column_widths(self, *widths):
         """Sets the width in pixels of all columns of the table
@@ -2867,6 +5994,78 @@ class Table(Container, GooeyPieWidget):
         for column, align in enumerate(aligns):
             self.set_column_alignment(column, align)
 
+    def set_column_type(self, column, column_type, format=None):
+        """Sets the type of the values in the specified column, indexed from 0. Values in a typed column are
+        converted to the type when they are added, sorted in the order of the type (e.g. numerically rather than
+        alphabetically), and only converted to text when they are shown in the table.
+
+        Args:
+            column (int): The column to set the type of, indexed from 0
+            column_type (str): One of 'int', 'float', 'bool', 'date' or 'str', or None for values to be stored
+                as they are given
+            format (str): Optional format specification used to show the values, e.g. ',.2f' for numbers with
+                two decimal places or '%d/%m/%Y' for dates
+
+        Raises:
+            TypeError: The column number is invalid
+            ValueError: The column type was not one of the possible options
+            ValueError: An existing value in the column cannot be converted to the type
+            GooeyPieError: the table shows data from a data provider
+        """
+        if type(column) != int or column not in range(self._num_columns):
+            raise TypeError(f'Column number must be an integer between 0 and {self._num_columns - 1}. '
+                            f'The value given was {column}.')
+        if column_type not in (None, 'int', 'float', 'bool', 'date', 'str'):
+            raise ValueError(f'Column type must be one of "int", "float", "bool", "date", "str" or None. '
+                             f'The value provided was "{column_type}"')
+
+        self._check_no_provider('Column types cannot be set')
+
+        # Convert the existing values before making any changes, in case any are not valid
+        self._finish_loading()
+        values = {row_id: _convert_value(value, column_type) for row_id, value in self._rows.column_items(column)}
+
+        # Store the rows again with the new type of column
+        rows = list(self._rows.items())
+        self._column_types[column] = column_type
+        self._column_formats[column] = format
+        self._rows = _TableRows(self._column_types)
+        for row_id, row in rows:
+            row[column] = values[row_id]
+            self._rows[row_id] = row
+
+        # The keys, sort keys and words in the column depend on its type and format
+        if column == self._key_column:
+            self._key_index = None
+        self._sort_keys.pop(column, None)
+        self._token_postings.pop(column, None)
+        self._token_vocabulary.pop(column, None)
+        self._clear_sort_icons()
+        if self._filter:
+            self._show_matches(self._find_matches())
+
+        if self._virtual:
+            self._virtual_render()
+        else:
+            for row_id, value in values.items():
+                self._treeview.set(row_id, column, self._cell_text(column, value))
+        self._widen_columns(self._order)
+
+    def set_column_types(self, *column_types):
+        """Sets the type of the values in all columns
+
+        Args:
+            column_types: The type of each column, one of 'int', 'float', 'bool', 'date', 'str' or None
+
+        Raises:
+            ValueError: The number of arguments does not match the number of columns
+        """
+        if len(column_types) != self._num_columns:
+            raise ValueError(f'The number of arguments supplied ({len(column_types)}) does not match '
+                             f'the number of columns in the table ({self._num_columns})')
+        for column, column_type in enumerate(column_types):
+            self.set_column_type(column, column_type)
+
     def select_row(self, index):
         """Selects a given row in the table
 
@@ -2877,13 +6076,22 @@ class Table(Container, GooeyPieWidget):
             ValueError: there are no rows in the table to select
             ValueError: the index is invalid
         """
-        all_rows = self._treeview.get_children()
-        if len(self._treeview.get_children()) == 0:
+        self._finish_loading()
+        all_rows = self._order
+        if len(all_rows) == 0:
             raise ValueError(f'Table has no rows to select')
         if index not in range(len(all_rows)):
             raise ValueError(f'The index must be between 0 and {len(all_rows) - 1}. '
                              f'The value of the index specified was {index}.')
         row_id = all_rows[index]
+        if not self._is_visible(row_id):
+            raise ValueError(f'The row at index {index} is hidden by the filter and cannot be selected')
+        self._hidden_selection.clear()
+        if self._virtual:
+            self._virtual_select([row_id])
+            self._virtual_see(self._visible_position(row_id))
+            return
+
         self._treeview.selection_set(row_id)
         self._treeview.see(row_id)  # Show the selected row (in case it is not be in view)
 
@@ -2891,11 +6099,19 @@ class Table(Container, GooeyPieWidget):
         """Selects all rows of the table if multiple selection is enabled. Has no effect if multiple selection
         is not enabled"""
         if self.multiple_selection:
-            self._treeview.selection_set(*self._treeview.get_children())
+            self._finish_loading()
+            if self._virtual:
+                self._virtual_select(self._visible_order())
+            else:
+                self._treeview.selection_set(*self._treeview.get_children())
 
     def select_none(self):
         """Clears any selected rows in the table"""
-        self._treeview.selection_remove(*self._treeview.selection())
+        self._hidden_selection.clear()
+        if self._virtual:
+            self._virtual_select([])
+        else:
+            self._treeview.selection_remove(*self._treeview.selection())
 
 
 class Separator(ttk.Separator, GooeyPieWidget):
@@ -3417,8 +6633,112 @@ class Date(Container, GooeyPieWidget):
         self._update_day_select()
 
 
+class _LineIndex:
+    """Memory-maps a text file and finds where each line starts on a background thread, so that any line can be read
+    without reading the lines before it. The file is checked regularly for lines added to the end, and indexed again
+    from the start if it gets shorter, as when a log file is rotated.
+
+    Reading a map past the end of its file crashes the process, so the size of the file is checked before each read
+    from the map, and a file that has become shorter is treated as empty until it has been indexed again.
+    """
+    chunk_size = 4 * 1024 * 1024  # Number of bytes indexed at a time
+    poll_interval = 0.25  # Time in seconds between checking whether the file has grown, once it has been indexed
+
+    def __init__(self, path, encoding):
+        """
+        Args:
+            path (str): The path of the file
+            encoding (str): The encoding of the file, which must use a single byte for the newline character
+        """
+        self._file = open(path, 'rb')
+        self._encoding = encoding
+
+        # The map of the file, the positions of the start of each line, the number of bytes indexed and the number of
+        # line starts found in those bytes are replaced together so that they can be read by the tk thread
+        self._state = (None, array.array('Q', [0]), 0, 1)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._index, daemon=True)
+        self._thread.start()
+
+    def _index(self):
+        """Finds the start of each line a chunk at a time, then waits for the file to grow"""
+        mapping, starts, indexed, found = self._state
+        while not self._stop.is_set():
+            size = os.fstat(self._file.fileno()).st_size
+            if size < indexed:
+                mapping, starts, indexed = None, array.array('Q', [0]), 0
+                self._state = (mapping, starts, indexed, 1)
+            if size <= indexed:
+                self._stop.wait(self.poll_interval)
+                continue
+
+            if mapping is None or len(mapping) < size:
+                mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            end = min(size, indexed + self.chunk_size)
+            chunk = self._read_map(mapping, indexed, end)
+            if chunk is None:
+                # The file has become shorter, and is indexed again from the start
+                continue
+
+            # Each newline in the chunk starts a new line, one byte after the end of the line before it
+            lengths = map(len, chunk.split(b'\n')[:-1])
+            starts.extend(itertools.islice(itertools.accumulate(map((1).__add__, lengths), initial=indexed), 1, None))
+            indexed = end
+            found = len(starts)
+            self._state = (mapping, starts, indexed, found)
+
+    def line_count(self):
+        """Returns the number of lines indexed so far"""
+        mapping, starts, indexed, found = self._state
+        # A newline at the end of the indexed part of the file starts a line that has no text yet
+        return found - 1 if starts[found - 1] == indexed else found
+
+    def read(self, first, last):
+        """Returns the text of the lines from first up to but not including last, counting from 0"""
+        mapping, starts, indexed, found = self._state
+        last = min(last, found - 1 if starts[found - 1] == indexed else found)
+        if first >= last:
+            return ''
+        end = starts[last] - 1 if last < found else indexed
+        data = self._read_map(mapping, starts[first], end)
+        if data is None:
+            # The file has become shorter, so no lines are shown until it has been indexed again
+            self._state = (None, array.array('Q', [0]), 0, 1)
+            return ''
+        text = data.decode(self._encoding, errors='replace')
+        return text.replace('\r\n', '\n').rstrip('\r')
+
+    def _read_map(self, mapping, start, end):
+        """Returns the bytes from start up to end in the map of the file, or None if the file is now shorter than end"""
+        if os.fstat(self._file.fileno()).st_size < end:
+            return None
+        return mapping[start:end]
+
+    def close(self):
+        """Stops indexing and closes the file"""
+        self._stop.set()
+        self._thread.join()
+        self._file.close()
+
+
+class _TextboxLogHandler(logging.Handler):
+    """Logging handler that writes each log message on a new line of a Textbox in log mode"""
+    def __init__(self, textbox, level):
+        super().__init__(level)
+        self._textbox = textbox
+
+    def emit(self, record):
+        try:
+            self._textbox.write(f'{self.format(record)}\n')
+        except Exception:
+            self.handleError(record)
+
+
 class Textbox(Container, GooeyPieWidget):
     """Textbox widget"""
+    log_interval = 16  # Time in milliseconds between adding the text written to a Textbox in log mode
+    file_overscan = 2  # Number of lines shown beyond the visible area when viewing a file
+    file_update_interval = 100  # Time in milliseconds between checking for new lines in a file being viewed
 
     def __init__(self, container, width=20, height=5):
         """Create a new Textbox widget
@@ -3458,26 +6778,45 @@ class Textbox(Container, GooeyPieWidget):
         # Create and configure vertical scrollbar
         self._scrollbar_vertical = tk.Scrollbar(self, orient='vertical')
         self._scrollbar_vertical.config(command=self._tk_text_widget.yview)
-        self._tk_text_widget.config(yscrollcommand=self._scrollbar_vertical.set)
-        self._scrollbar_visibility = 'auto'
-        self._scrollbar_is_hidden = True
-
-        # Add to parent Container
-        self._tk_text_widget.grid(row=0, column=0, sticky='nsew')
-        self._scrollbar_vertical.grid(row=0, column=1, sticky='nsew')
 
-        # If the textbox changes size, update the scrollbar
-        self._tk_text_widget.bind('<Configure>', self._configure)
+        # The text widget reports changes to its view, including when text is added or it changes size, and is
+        # added to the parent Container with the scrollbar when it is needed
+        self._scrollbars = _Scrollbars(self, self._tk_text_widget, vertical=self._scrollbar_vertical)
+        self._tk_text_widget.config(yscrollcommand=self._scrollbars.set_vertical)
 
         # Initialise event handling
         GooeyPieWidget.__init__(self, container)
         self._events['change'] = None
 
-        # Variable used in the change event on the textbox
-        self._sentinel = ''
-
-        # Set an event to always fire to update the scrollbar when new text is added
-        self._tk_text_widget.bind('<KeyRelease>', self._newtextbox_change_event)
+        # The text widget sets its modified flag and sends the <<Modified>> event whenever its text changes, whether
+        # typed or changed in code. The flag is cleared each time so that the next change sends the event again.
+        self._change_delay = 0
+        self._change_id = None  # Identifier of the scheduled call to process a delayed change event
+        self._tk_text_widget.bind('<<Modified>>', self._text_modified)
+
+        # Log mode. Text can be written from any thread and is queued, then added to the end of the textbox by the tk
+        # thread in one go at regular intervals
+        self._log_mode = False
+        self._max_lines = None  # Maximum number of lines kept in log mode
+        self._log_queue = queue.SimpleQueue()
+        self._log_id = None  # Identifier of the scheduled call to add the queued text
+
+        # Viewing a file. The lines of the file are indexed on a background thread, and only the visible lines are
+        # loaded into the text widget. The scrollbar shows the position of the visible lines in the whole file.
+        self._file_lines = None  # Line index of the file being viewed
+        self._file_top = 0  # Index of the first visible line
+        self._file_line_count = 0  # Number of lines in the file when the visible lines were last loaded
+        self._file_follow = False
+        self._file_id = None  # Identifier of the scheduled call to check for new lines
+        self._file_wrap = None  # Wrap setting of the text widget before the file was viewed
+
+        # Bindings that are only active while viewing a file, added to the bindtags of the text widget
+        self._file_bindtag = f'FileTextbox{id(self)}'
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self._tk_text_widget.bind_class(self._file_bindtag, sequence, self._file_mousewheel)
+        for sequence in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>', '<Control-Home>', '<Control-End>'):
+            self._tk_text_widget.bind_class(self._file_bindtag, sequence, self._file_keypress)
+        self._tk_text_widget.bind_class(self._file_bindtag, '<Configure>', self._file_render)
 
     def __str__(self):
         return f"""<Textbox widget>"""
@@ -3485,64 +6824,17 @@ class Textbox(Container, GooeyPieWidget):
     def __repr__(self):
         return self.__str__()
 
-    def _configure(self, _event):
-        """Called when the <Configure> event fires on the textbox"""
-        if self._scrollbar_visibility == 'auto':
-            self._update_scrollbar()
-
-    def _update_scrollbar(self):
-        """Updates the visibility of the scrollbar in response to resize events, changes to the contents
-        of the textbox and changes to the scrollbar setting using the scrollbar property.
-        """
-        self._set_scrollbar()
-
-        # Additional calls are made here as the scrollbar does not reliably update immediately,
-        # meaning that it may not appear or disappear as needed when scrollbar visibility set to 'auto'
-        self.after(200, self._set_scrollbar)
-        self.after(500, self._set_scrollbar)
-
-    def _set_scrollbar(self):
-        """Sets the scrollbar visibility based on the contents of the textbox"""
-        scrollbar_value = self._scrollbar_vertical.get()
-        if scrollbar_value == (0.0, 1.0) or scrollbar_value == (0.0, 0.0, 0.0, 0.0):
-            if not self._scrollbar_is_hidden:
-                self._hide_scrollbar()
-        else:
-            if self._scrollbar_is_hidden:
-                self._show_scrollbar()
-
-    def _hide_scrollbar(self):
-        """Hides the scrollbar from the Textbox"""
-        self._scrollbar_vertical.grid_remove()
-        self._tk_text_widget.grid_remove()
-        self._tk_text_widget.grid(row=0, column=0, sticky='nsew', columnspan=2)
-        self._scrollbar_is_hidden = True
-
-    def _show_scrollbar(self):
-        """Shows the scrollbar on the side of the Textbox"""
-        self._tk_text_widget.grid_remove()
-        self._tk_text_widget.grid(row=0, column=0, sticky='nsew', columnspan=1)
-        self._scrollbar_vertical.grid()
-        self._scrollbar_is_hidden = False
-
     @property
     def scrollbar(self):
         """Gets or sets the scrollbar setting. Must be one of either 'auto', 'hidden' or 'visible'"""
-        return self._scrollbar_visibility
+        return self._scrollbars.vertical_setting
 
     @scrollbar.setter
     def scrollbar(self, setting):
         if setting not in ('auto', 'visible', 'hidden'):
             raise ValueError("Invalid scrollbar option - must be set to 'auto', 'hidden' or 'visible'")
-
-        self._scrollbar_visibility = setting
-        if setting == 'visible':
-            self._show_scrollbar()
-        elif setting == 'hidden':
-            self._hide_scrollbar()
-        else:
-            # Auto scrollbar - call the update method to determine if it should be shown or hidden
-            self._update_scrollbar()
+        self._scrollbars.vertical_setting = setting
+        self._scrollbars.update()
 
     @staticmethod
     def focus_next_widget(event):
@@ -3588,6 +6880,45 @@ class Textbox(Container, GooeyPieWidget):
             raise ValueError('Height must be a positive integer')
         self._tk_text_widget.configure(height=rows)
 
+    @property
+    def change_delay(self):
+        """Gets or sets the time in milliseconds to wait after the text stops changing before processing the change
+        event, so that the event is processed once after a burst of typing rather than after every key press. The
+        default of 0 processes the event after every change."""
+        return self._change_delay
+
+    @change_delay.setter
+    def change_delay(self, milliseconds):
+        if type(milliseconds) != int or milliseconds < 0:
+            raise ValueError(f'The change delay must be a whole number of milliseconds. The value given was '
+                             f'{milliseconds}')
+        self._change_delay = milliseconds
+
+    def _text_modified(self, event):
+        """Processes the change event when the text widget reports that its text has changed"""
+        if not self._tk_text_widget.edit_modified():
+            # Clearing the modified flag also sends the <<Modified>> event
+            return
+        self._tk_text_widget.edit_modified(False)
+        if self._file_lines:
+            # The visible lines of a file being viewed have been loaded, which is not a change to the text
+            return
+
+        if self._change_id:
+            self.after_cancel(self._change_id)
+            self._change_id = None
+        if self._events['change']:
+            if self._change_delay:
+                self._change_id = self.after(self._change_delay, self._delayed_change)
+            else:
+                self._event('change')
+
+    def _delayed_change(self):
+        """Processes the change event once the text has stopped changing for the change delay"""
+        self._change_id = None
+        if self._events['change']:
+            self._event('change')
+
     @property
     def selected(self):
         """Gets any selected text"""
@@ -3606,25 +6937,22 @@ class Textbox(Container, GooeyPieWidget):
 
     @text.setter
     def text(self, text):
+        self._check_no_file('The text cannot be set')
         self._tk_text_widget.delete('1.0', 'end')
         self._tk_text_widget.insert('1.0', text)
 
-        self._newtextbox_change_event(None)
-
     def clear(self):
         """Clear the contents of the Textbox"""
+        self._check_no_file('The Textbox cannot be cleared')
         self._tk_text_widget.delete('1.0', 'end')
 
-        # Process the change event
-        self._newtextbox_change_event(None)
-
     def prepend(self, text):
         """Adds text to the beginning of the Textbox
 
         Args:
             text (str): The text to add to the Textbox
         """
-        self.text = f'{text}{self.text}'
+        self._insert_text('1.0', str(text))
         self.scroll_to_start()
 
     def prepend_line(self, text):
@@ -3634,7 +6962,6 @@ class Textbox(Container, GooeyPieWidget):
             text (str): The text to add to the Textbox
         """
         self.prepend(f'{text}\n')
-        self.scroll_to_start()
 
     def append(self, text):
         """Adds text to the end of the Textbox
@@ -3642,7 +6969,7 @@ class Textbox(Container, GooeyPieWidget):
         Args:
             text (str): The text to add to the Textbox
         """
-        self.text = f'{self.text}{text}'
+        self._insert_text('end', str(text))
         self.scroll_to_end()
 
     def append_line(self, text):
@@ -3653,11 +6980,310 @@ class Textbox(Container, GooeyPieWidget):
         """
 
         # Only add a newline if there is already text there
-        if self.text:
-            self.append('\n')
-
+        if self._tk_text_widget.compare('end-1c', '!=', '1.0'):
+            text = f'\n{text}'
         self.append(text)
-        self.scroll_to_end()
+
+    def _insert_text(self, index, text):
+        """Inserts text at the start ('1.0') or end ('end') of the Textbox. Only the new text is passed to tk, so
+        adding to a long Textbox takes the same time as adding to an empty one, and the undo history and the position
+        of the insertion cursor are kept.
+        """
+        self._check_no_file('Text cannot be added')
+        if text:
+            self._tk_text_widget.insert(index, text)
+
+    @property
+    def log_mode(self):
+        """Gets or sets whether the Textbox is used as a log console
+
+        In log mode, text is added with write(), which can be called from any thread, including from a logging handler
+        created with log_handler(). The text written is added to the end of the Textbox at regular intervals, and the
+        Textbox only scrolls to show the new text if it is already scrolled to the end. The oldest lines are removed
+        when there are more than max_lines. Undo is turned off in log mode, so that the undo history does not keep
+        every piece of text written and removed.
+        """
+        return self._log_mode
+
+    @log_mode.setter
+    def log_mode(self, value):
+        value = bool(value)
+        if value == self._log_mode:
+            return
+        if value:
+            self._check_no_file('Log mode cannot be enabled')
+        self._log_mode = value
+        if value:
+            self._tk_text_widget.config(undo=False)
+            self._tk_text_widget.edit_reset()
+            self._log_id = self.after(self.log_interval, self._write_queued)
+        else:
+            if self._log_id:
+                self.after_cancel(self._log_id)
+                self._log_id = None
+            self._add_log_text()
+            self._tk_text_widget.config(undo=True)
+
+    @property
+    def max_lines(self):
+        """Gets or sets the maximum number of lines kept in log mode, or None (the default) for no limit. When text is
+        written and there are more lines than this, the lines at the start of the Textbox are removed."""
+        return self._max_lines
+
+    @max_lines.setter
+    def max_lines(self, lines):
+        if lines is not None and (type(lines) != int or lines < 1):
+            raise ValueError(f'The maximum number of lines must be a positive integer or None. The value given was '
+                             f'{lines}')
+        self._max_lines = lines
+        if self._log_mode:
+            self._trim_lines()
+
+    def write(self, text):
+        """Writes text to the end of the Textbox in log mode. This can be called from any thread. The text is added the
+        next time the Textbox is updated, along with any other text written since, so writing many small pieces of
+        text is quick.
+
+        Args:
+            text (str): The text to write, which should end with a newline to write a complete line
+
+        Raises:
+            GooeyPieError: The Textbox is not in log mode
+        """
+        if not self._log_mode:
+            raise GooeyPieError('Log mode must be enabled to write to a Textbox')
+        self._log_queue.put(str(text))
+
+    def log_handler(self, level=logging.NOTSET, log_format=None):
+        """Creates a handler for Python's logging module that writes log messages to the Textbox in log mode, e.g.
+        logging.getLogger().addHandler(textbox.log_handler()). Messages can be logged from any thread.
+
+        Args:
+            level: Optional, the lowest level of message to write, e.g. logging.INFO. By default, all messages
+                passed to the handler are written.
+            log_format (str): Optional, the format of each message, e.g. '%(asctime)s %(levelname)s %(message)s'.
+                By default, only the message is written.
+
+        Returns:
+            logging.Handler: The handler, which can be added to any logger
+        """
+        handler = _TextboxLogHandler(self, level)
+        if log_format:
+            handler.setFormatter(logging.Formatter(log_format))
+        return handler
+
+    def _write_queued(self):
+        """Adds the text written since the last update, and schedules the next update"""
+        self._add_log_text()
+        self._log_id = self.after(self.log_interval, self._write_queued)
+
+    def _add_log_text(self):
+        """Adds all queued text to the end of the Textbox in a single insert, removes the oldest lines if there are
+        too many, and scrolls to the end if the Textbox was already scrolled to the end"""
+        written = [self._log_queue.get() for _ in range(self._log_queue.qsize())]
+        if not written:
+            return
+        scrolled_to_end = self._tk_text_widget.yview()[1] >= 1.0
+        self._insert_text('end', ''.join(written))
+        self._trim_lines()
+        if scrolled_to_end:
+            self._tk_text_widget.yview_moveto(1.0)
+
+    def _trim_lines(self):
+        """Removes the lines at the start of the Textbox that are over the maximum number of lines in log mode"""
+        if self._max_lines is None:
+            return
+
+        # The last line does not count if it is empty, which it is after writing a complete line
+        line, column = map(int, self._tk_text_widget.index('end-1c').split('.'))
+        lines = line if column else line - 1
+        excess = lines - self._max_lines
+        if excess > 0:
+            self._tk_text_widget.delete('1.0', f'{excess + 1}.0')
+
+    def view_file(self, path, encoding='utf-8'):
+        """Shows a text file in the Textbox without reading it all into memory, so that files of any size, such as
+        large log files, can be viewed. The file is read-only while it is viewed. The lines of the file are found in
+        the background, and only the lines in view are read from the file. Lines added to the end of the file while it
+        is being viewed are shown, and the Textbox keeps showing the end of the file if follow is set. While a file is
+        viewed, the text of the Textbox is the lines in view.
+
+        Args:
+            path (str): The path of the file
+            encoding (str): Optional, the encoding of the file. Must be UTF-8 (the default) or another encoding that
+                uses a single byte for newlines, such as 'latin-1'.
+
+        Raises:
+            FileNotFoundError: The file does not exist
+            GooeyPieError: The Textbox is in log mode
+        """
+        if self._log_mode:
+            raise GooeyPieError('A file cannot be viewed in a Textbox in log mode')
+        lines = _LineIndex(path, encoding)
+        if self._file_lines:
+            self._file_lines.close()
+        else:
+            # The scrollbar scrolls through the lines of the file rather than the text widget. Lines are not wrapped,
+            # so that each line of the file takes up one line of the Textbox and the last page fits.
+            widget = self._tk_text_widget
+            self._file_wrap = widget.cget('wrap')
+            widget.config(yscrollcommand='', undo=False, state='disabled', wrap='none')
+            self._scrollbar_vertical.config(command=self._file_yview)
+            bindtags = list(widget.bindtags())
+            bindtags.insert(bindtags.index('Text'), self._file_bindtag)
+            widget.bindtags(bindtags)
+            self._file_id = self.after(self.file_update_interval, self._file_update)
+
+        self._file_lines = lines
+        self._file_top = 0
+        self._file_render()
+
+    def close_file(self):
+        """Stops viewing a file, leaving the Textbox empty and able to be edited. Has no effect if no file is being
+        viewed."""
+        if not self._file_lines:
+            return
+        self._file_lines.close()
+        self._file_lines = None
+        if self._file_id:
+            self.after_cancel(self._file_id)
+            self._file_id = None
+
+        widget = self._tk_text_widget
+        bindtags = list(widget.bindtags())
+        bindtags.remove(self._file_bindtag)
+        widget.bindtags(bindtags)
+        self._scrollbar_vertical.config(command=widget.yview)
+        widget.config(yscrollcommand=self._scrollbars.set_vertical, undo=True, state='normal', wrap=self._file_wrap)
+        widget.delete('1.0', 'end')
+        widget.edit_reset()
+        if self._disabled:
+            widget.config(state='disabled')
+
+    @property
+    def line_count(self):
+        """Gets the number of lines in the file being viewed that have been found so far, or None if no file is being
+        viewed"""
+        return self._file_lines.line_count() if self._file_lines else None
+
+    @property
+    def follow(self):
+        """Gets or sets whether a file being viewed keeps showing its last lines as lines are added to it. Scrolling
+        up stops following the file until it is scrolled back to the end."""
+        return self._file_follow
+
+    @follow.setter
+    def follow(self, value):
+        self._file_follow = bool(value)
+        if self._file_follow and self._file_lines:
+            self._file_scroll_to(self._file_lines.line_count())
+
+    def go_to_line(self, line):
+        """Scrolls a file being viewed so that the given line is at the top of the Textbox
+
+        Args:
+            line (int): The line number, counting from 1
+
+        Raises:
+            TypeError: line is not an integer
+            GooeyPieError: No file is being viewed
+        """
+        if not self._file_lines:
+            raise GooeyPieError('No file is being viewed in the Textbox')
+        if type(line) != int:
+            raise TypeError(f'The line number must be an integer. The value given was {line}')
+        self._file_scroll_to(line - 1)
+
+    def _check_no_file(self, action):
+        """Raises an error if a file is being viewed, since the text cannot be changed"""
+        if self._file_lines:
+            raise GooeyPieError(f'{action} while a file is being viewed in the Textbox')
+
+    def _file_page_size(self):
+        """Returns the number of lines that fit in the Textbox"""
+        widget = self._tk_text_widget
+        if widget.winfo_ismapped():
+            line_height = int(widget.tk.call('font', 'metrics', widget.cget('font'), '-linespace'))
+            return max(1, widget.winfo_height() // line_height)
+
+        # Before the Textbox is shown, use its height setting
+        return int(widget.cget('height'))
+
+    def _file_render(self, _event=None):
+        """Loads the visible lines of the file being viewed into the text widget. The _event parameter is needed so
+        that this can be used as the <Configure> callback when the Textbox changes size."""
+        page_size = self._file_page_size()
+        lines = self._file_lines.line_count()
+        self._file_top = max(0, min(self._file_top, lines - page_size))
+        self._file_line_count = lines
+
+        widget = self._tk_text_widget
+        widget.config(state='normal')
+        widget.delete('1.0', 'end')
+        widget.insert('1.0', self._file_lines.read(self._file_top, self._file_top + page_size + self.file_overscan))
+        widget.config(state='disabled')
+        widget.yview_moveto(0)
+
+        if lines:
+            self._scrollbars.set_vertical(self._file_top / lines, min(1, (self._file_top + page_size) / lines))
+        else:
+            self._scrollbars.set_vertical(0, 1)
+
+    def _file_update(self):
+        """Shows new lines found in the file being viewed, if they are in view or the file is being followed"""
+        self._file_id = self.after(self.file_update_interval, self._file_update)
+        lines = self._file_lines.line_count()
+        previous = self._file_line_count
+        if lines == previous:
+            return
+
+        page_size = self._file_page_size()
+        showing_end = self._file_top + page_size >= previous
+        if self._file_follow and showing_end:
+            self._file_top = lines
+        if showing_end or lines < previous:
+            self._file_render()
+        else:
+            # Only the scrollbar needs to change
+            self._file_line_count = lines
+            self._scrollbars.set_vertical(self._file_top / lines, min(1, (self._file_top + page_size) / lines))
+
+    def _file_scroll_to(self, top):
+        """Scrolls so that the line with the given index is the first visible line of the file being viewed"""
+        top = max(0, min(top, self._file_lines.line_count() - self._file_page_size()))
+        if top != self._file_top:
+            self._file_top = top
+            self._file_render()
+
+    def _file_yview(self, *args):
+        """The command for the scrollbar while viewing a file"""
+        if args[0] == 'moveto':
+            top = round(float(args[1]) * self._file_lines.line_count())
+        else:
+            # Arguments are of the form ('scroll', amount, 'units' or 'pages')
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self._file_page_size()
+            top = self._file_top + amount
+        self._file_scroll_to(top)
+
+    def _file_mousewheel(self, event):
+        """Scrolls through the lines of the file being viewed with the mouse wheel"""
+        self._file_scroll_to(self._file_top + _mousewheel_rows(event))
+        return 'break'
+
+    def _file_keypress(self, event):
+        """Scrolls through the lines of the file being viewed with the keyboard"""
+        page_size = self._file_page_size()
+        steps = {'Up': -1, 'Down': 1, 'Prior': -page_size, 'Next': page_size}
+        if event.keysym == 'Home':
+            top = 0
+        elif event.keysym == 'End':
+            top = self._file_lines.line_count()
+        else:
+            top = self._file_top + steps[event.keysym]
+        self._file_scroll_to(top)
+        return 'break'
 
     def scroll_to_start(self):
         """Scrolls to the top of the Textbox"""
@@ -0,0 +1,17 @@
+import tkinter as tk
+
+import pytest
+
+import gooeypie as gp
+
+
+@pytest.fixture
+def app():
+    """A hidden app window to create widgets in, for tests that need a display"""
+    try:
+        app = gp.GooeyPieApp('Tests')
+    except tk.TclError:
+        pytest.skip('No display')
+    app._root.withdraw()
+    yield app
+    app._root.destroy()
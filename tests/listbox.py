@@ -1,7 +1,9 @@
 import gooeypie as gp
+import random
 from random import randint
 
 NUM_RANDOM_ITEMS = 15
+NUM_MANY_ITEMS = 100_000
 
 app = gp.GooeyPieApp('New Listbox Tests')
 
@@ -110,6 +112,30 @@ def event_test(event):
     output.prepend_line(f'Select event triggered item(s): {listbox.selected}')
 
 
+def set_mode(event):
+    """Changes the virtual, sorted or unique setting of the listbox"""
+    listbox.virtual = virtual.checked
+    listbox.sorted = keep_sorted.checked
+    listbox.unique = unique.checked
+    output.prepend_line(f'Virtual: {listbox.virtual}, sorted: {listbox.sorted}, unique: {listbox.unique}')
+
+
+def add_many_items(event):
+    """Adds many random words, so that virtual mode, filtering and type-ahead can be tried with a long list"""
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = [''.join(random.choice(letters) for _ in range(randint(3, 10))) for _ in range(NUM_MANY_ITEMS)]
+    listbox.add_items(words)
+    output.prepend_line(f'Added {NUM_MANY_ITEMS:,} random words. Type while the listbox has focus to jump to an item.')
+
+
+def set_filter_mode(event):
+    listbox.bind_filter(filter_input, filter_mode.selected)
+
+
+def find(event):
+    output.prepend_line(f'First item starting with {find_what.text!r} is at index {listbox.find_prefix(find_what.text)}')
+
+
 # Listbox Container
 listbox_container = gp.LabelContainer(app, 'New Listbox')
 listbox = gp.Listbox(listbox_container)
@@ -118,12 +144,36 @@ multiple = gp.Checkbox(listbox_container, 'Allow multiple selection')
 multiple.add_event_listener('change', set_multiple)
 scrollbar_option = gp.Dropdown(listbox_container, ['auto', 'visible', 'hidden'])
 scrollbar_option.add_event_listener('select', set_scrollbar)
-
-listbox_container.set_grid(3, 1)
-listbox_container.set_row_weights(1, 0, 0)
+virtual = gp.Checkbox(listbox_container, 'Virtual')
+keep_sorted = gp.Checkbox(listbox_container, 'Sorted')
+unique = gp.Checkbox(listbox_container, 'Unique')
+for mode_checkbox in (virtual, keep_sorted, unique):
+    mode_checkbox.add_event_listener('change', set_mode)
+
+# Items are filtered as text is typed into the filter input
+filter_container = gp.Container(listbox_container)
+filter_label = gp.Label(filter_container, 'Filter:')
+filter_input = gp.Input(filter_container)
+filter_mode = gp.Dropdown(filter_container, ['substring', 'fuzzy'])
+filter_mode.selected = 'substring'
+filter_mode.add_event_listener('select', set_filter_mode)
+listbox.bind_filter(filter_input)
+
+filter_container.set_grid(1, 3)
+filter_container.set_column_weights(0, 1, 0)
+filter_container.add(filter_label, 1, 1, valign='middle')
+filter_container.add(filter_input, 1, 2, valign='middle', fill=True)
+filter_container.add(filter_mode, 1, 3, valign='middle')
+
+listbox_container.set_grid(7, 1)
+listbox_container.set_row_weights(1, 0, 0, 0, 0, 0, 0)
 listbox_container.add(listbox, 1, 1, fill=True, stretch=True)
 listbox_container.add(multiple, 2, 1)
 listbox_container.add(scrollbar_option, 3, 1)
+listbox_container.add(virtual, 4, 1)
+listbox_container.add(keep_sorted, 5, 1)
+listbox_container.add(unique, 6, 1)
+listbox_container.add(filter_container, 7, 1, fill=True)
 
 listbox.add_event_listener('select', event_test)
 
@@ -149,8 +199,11 @@ remove_selection = gp.Button(test_container, 'Remove selected', remove_selected)
 disable = gp.Button(test_container, 'Enable/disable listboxes', enable_disable_listboxes)
 set_select = gp.Button(test_container, 'Set selected to random', set_selected)
 clear = gp.Button(test_container, 'Clear all', clear)
+add_many_button = gp.Button(test_container, f'Add {NUM_MANY_ITEMS:,} words', add_many_items)
+find_button = gp.Button(test_container, 'Find first starting with', find)
+find_what = gp.Input(test_container)
 
-test_container.set_grid(10, 2)
+test_container.set_grid(12, 2)
 test_container.set_column_weights(1, 1)
 test_container.add(setter_button, 1, 1, fill=True)
 test_container.add(items_button, 1, 2, fill=True)
@@ -172,6 +225,9 @@ test_container.add(remove_selection, 9, 1, fill=True)
 test_container.add(disable, 9, 2, fill=True)
 test_container.add(set_select, 10, 1, fill=True)
 test_container.add(clear, 10, 2, fill=True)
+test_container.add(add_many_button, 11, 1, fill=True)
+test_container.add(find_button, 12, 1, fill=True)
+test_container.add(find_what, 12, 2, valign="middle", fill=True)
 
 # Output container
 output_container = gp.LabelContainer(app, 'Output')
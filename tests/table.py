@@ -1,4 +1,12 @@
 import gooeypie as gp
+import os
+import random
+import sqlite3
+import tempfile
+
+CSV_PATH = os.path.join(tempfile.gettempdir(), 'gooeypie-table-test.csv')
+DATABASE_PATH = os.path.join(tempfile.gettempdir(), 'gooeypie-table-test.db')
+NUM_MANY_ROWS = 100_000
 
 table_data = [{"first_name": "Yanaton", "last_name": "Turfes", "salary": 45408},
               {"first_name": "Nariko", "last_name": "Bloomfield", "salary": 498901},
@@ -142,6 +150,62 @@ def sortable(event):
     table.sortable = sortable_chk.checked
 
 
+def filter_rows(event):
+    column = filter_column_dd.selected_index
+    table.filter(filter_inp.text, column - 1 if column else None)
+
+
+def toggle_virtual(event):
+    table.virtual = virtual_chk.checked
+    log.prepend_line(f'Virtual mode set to {table.virtual}')
+
+
+def random_rows(count):
+    names = [(row['first_name'], row['last_name']) for row in table_backup]
+    return [[*random.choice(names), random.randrange(40000, 600000)] for _ in range(count)]
+
+
+def stop_showing_database():
+    table.data_provider = None
+    virtual_chk.disabled = False
+
+
+def load_many_rows(event):
+    stop_showing_database()
+    table.load_data(random_rows(NUM_MANY_ROWS), progress=progress,
+                    complete=lambda: log.prepend_line(f'Loaded {NUM_MANY_ROWS:,} rows'))
+
+
+def save_csv(event):
+    table.save_csv(CSV_PATH, progress=progress, complete=lambda: log.prepend_line(f'Saved {CSV_PATH}'),
+                   error=csv_error)
+
+
+def load_csv(event):
+    stop_showing_database()
+    table.load_csv(CSV_PATH, progress=progress, complete=lambda: log.prepend_line(f'Loaded {CSV_PATH}'),
+                   error=csv_error)
+
+
+def csv_error(error):
+    log.prepend_line(f'CSV error: {error}')
+
+
+def show_database(event):
+    """Shows a table in a SQLite database, which is created the first time"""
+    if not os.path.exists(DATABASE_PATH):
+        connection = sqlite3.connect(DATABASE_PATH)
+        connection.execute('CREATE TABLE people (first_name TEXT, last_name TEXT, salary INTEGER)')
+        connection.executemany('INSERT INTO people VALUES (?, ?, ?)', random_rows(NUM_MANY_ROWS * 10))
+        connection.commit()
+        connection.close()
+    table.data_provider = gp.SQLiteProvider(DATABASE_PATH, 'people', ['first_name', 'last_name', 'salary'])
+    # A table showing data from a provider is always in virtual mode
+    virtual_chk.checked = True
+    virtual_chk.disabled = True
+    log.prepend_line(f'Showing {DATABASE_PATH}')
+
+
 app = gp.GooeyPieApp('Table testing')
 
 widget_cont = gp.LabelContainer(app, 'Table widget')
@@ -166,6 +230,7 @@ disable_chk.add_event_listener('change', disable)
 sortable_chk = gp.Checkbox(widget_cont, 'Sortable')
 sortable_chk.checked = True
 sortable_chk.add_event_listener('change', sortable)
+table.set_column_type(2, 'int', ',')
 
 # Add operations
 set_all_btn = gp.Button(operations_add, 'Set data', set_data)
@@ -228,12 +293,41 @@ operations_get.add(get_row_inp, 1, 4, valign='middle')
 operations_get.add(get_all_btn, 1, 5)
 
 
+# Large data operations
+operations_large = gp.Container(operations_cont)
+filter_lbl = gp.Label(operations_large, 'Filter:')
+filter_inp = gp.Input(operations_large)
+filter_inp.add_event_listener('change', filter_rows)
+filter_column_dd = gp.Dropdown(operations_large, ['All columns', 'First name', 'Last name', 'Salary'])
+filter_column_dd.selected_index = 0
+filter_column_dd.add_event_listener('select', filter_rows)
+virtual_chk = gp.Checkbox(operations_large, 'Virtual')
+virtual_chk.add_event_listener('change', toggle_virtual)
+load_many_btn = gp.Button(operations_large, f'Load {NUM_MANY_ROWS:,} rows', load_many_rows)
+save_csv_btn = gp.Button(operations_large, 'Save CSV', save_csv)
+load_csv_btn = gp.Button(operations_large, 'Load CSV', load_csv)
+database_btn = gp.Button(operations_large, 'Show SQLite table', show_database)
+progress = gp.Progressbar(operations_large)
+
+operations_large.set_grid(2, 5)
+operations_large.add(filter_lbl, 1, 1, valign='middle')
+operations_large.add(filter_inp, 1, 2, valign='middle')
+operations_large.add(filter_column_dd, 1, 3, valign='middle')
+operations_large.add(virtual_chk, 1, 4, valign='middle')
+operations_large.add(progress, 1, 5, valign='middle')
+operations_large.add(load_many_btn, 2, 1, column_span=2)
+operations_large.add(save_csv_btn, 2, 3)
+operations_large.add(load_csv_btn, 2, 4)
+operations_large.add(database_btn, 2, 5)
+
+
 # Add all operations
-operations_cont.set_grid(4, 1)
+operations_cont.set_grid(5, 1)
 operations_cont.add(operations_add, 1, 1)
 operations_cont.add(operations_remove, 2, 1)
 operations_cont.add(operations_select, 3, 1)
 operations_cont.add(operations_get, 4, 1)
+operations_cont.add(operations_large, 5, 1)
 
 
 # Log container
@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from gooeypie.widgets import _LineIndex
+
+
+def wait_for(condition, timeout=10):
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            raise AssertionError('timed out')
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    indexes = []
+
+    def open_index(data, encoding='utf-8'):
+        path = tmp_path / 'lines.txt'
+        path.write_bytes(data)
+        index = _LineIndex(str(path), encoding)
+        indexes.append(index)
+        return path, index
+
+    yield open_index
+    for index in indexes:
+        index.close()
+
+
+def test_reads_lines(index_file):
+    path, index = index_file(b'one\r\ntwo\nthree')
+    wait_for(lambda: index.line_count() == 3)
+    assert index.read(0, 3) == 'one\ntwo\nthree'
+    assert index.read(1, 2) == 'two'
+    assert index.read(2, 10) == 'three'
+    assert index.read(3, 4) == ''
+
+
+def test_lines_across_chunks(index_file, monkeypatch):
+    monkeypatch.setattr(_LineIndex, 'chunk_size', 7)
+    lines = [f'line {n}' for n in range(100)]
+    path, index = index_file('\n'.join(lines).encode() + b'\n')
+    wait_for(lambda: index.line_count() == 100)
+    assert index.read(42, 45) == '\n'.join(lines[42:45])
+    assert index.read(99, 100) == 'line 99'
+
+
+def test_follows_appended_lines(index_file, monkeypatch):
+    monkeypatch.setattr(_LineIndex, 'poll_interval', 0.01)
+    path, index = index_file(b'first\n')
+    wait_for(lambda: index.line_count() == 1)
+    with open(path, 'ab') as file:
+        file.write(b'second\nthi')
+    wait_for(lambda: index.line_count() == 3)
+    assert index.read(1, 3) == 'second\nthi'
+
+
+def test_reindexes_truncated_file(index_file, monkeypatch):
+    monkeypatch.setattr(_LineIndex, 'poll_interval', 0.01)
+    path, index = index_file(b''.join(b'line %d\n' % n for n in range(1000)))
+    wait_for(lambda: index.line_count() == 1000)
+    os.truncate(path, 0)
+    with open(path, 'ab') as file:
+        file.write(b'new\n')
+    assert index.read(500, 502) in ('', 'new')
+    wait_for(lambda: index.line_count() == 1 and index.read(0, 1) == 'new')
+
+
+def test_read_after_truncate_does_not_crash(tmp_path):
+    # Reading a map past the end of its file raises SIGBUS, so this runs in a separate process
+    path = tmp_path / 'lines.txt'
+    path.write_bytes(b''.join(b'line %d\n' % n for n in range(300000)))
+    script = textwrap.dedent(f'''
+        import os, time
+        from gooeypie.widgets import _LineIndex
+        index = _LineIndex({str(path)!r}, 'utf-8')
+        while index.line_count() < 300000:
+            time.sleep(0.01)
+        os.truncate({str(path)!r}, 10)
+        print(repr(index.read(200000, 200002)))
+        index.close()
+    ''')
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', script], cwd=root, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "''"
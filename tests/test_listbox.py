@@ -0,0 +1,26 @@
+import gooeypie as gp
+
+
+def test_find_prefix_finds_first_item_shown(app):
+    listbox = gp.Listbox(app, ['item2', 'Item10', 'apple', 'item1'])
+    assert listbox.find_prefix('ITEM') == 0
+    assert listbox.find_prefix('item1') == 1
+    assert listbox.find_prefix('a') == 2
+    assert listbox.find_prefix('b') is None
+
+    listbox.add_item_at(0, 'item9')
+    assert listbox.find_prefix('item') == 0
+    assert listbox.find_prefix('item1') == 2
+
+    listbox.sorted = True
+    assert listbox.items == ['apple', 'item1', 'item2', 'item9', 'Item10']
+    assert listbox.find_prefix('item1') == 1
+
+
+def test_find_prefix_in_virtual_mode(app):
+    listbox = gp.Listbox(app, [f'item {n}' for n in range(1000)])
+    listbox.virtual = True
+    assert listbox.find_prefix('item 99') == 99
+    assert listbox.find_prefix('item') == 0
+    listbox.add_item_at(0, 'item 999')
+    assert listbox.find_prefix('item 99') == 0
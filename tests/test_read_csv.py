@@ -0,0 +1,77 @@
+import datetime
+import queue
+import threading
+
+from gooeypie.widgets import _read_csv
+
+
+def read_all(path, header=True, column_types=(None, None), chunk_size=2000):
+    """Reads a CSV file with _read_csv, returning the rows and any error put on the queue"""
+    chunks = queue.Queue()
+    _read_csv(open(path, newline='', encoding='utf-8'), header, list(column_types), chunks, threading.Event(),
+              chunk_size)
+    rows, error = [], None
+    while True:
+        item, position = chunks.get_nowait()
+        if isinstance(item, Exception):
+            error = item
+            break
+        rows.extend(item)
+        if position is None:
+            break
+    return rows, error
+
+
+def test_reads_rows_in_chunks(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('name,size\n' + ''.join(f'item {n},{n}\n' for n in range(25)))
+    chunks = queue.Queue()
+    _read_csv(open(path, newline=''), True, [None, None], chunks, threading.Event(), chunk_size=10)
+    items = [chunks.get_nowait() for _ in range(chunks.qsize())]
+    assert [len(rows) for rows, position in items] == [10, 10, 5]
+    assert [position is None for rows, position in items] == [False, False, True]
+    assert items[0][1] <= items[1][1] <= path.stat().st_size
+    assert items[0][0][0] == ['item 0', '0']
+
+
+def test_header_blank_lines_and_quoting(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('a,b\n\n"x, y","line\nbreak"\n1,2\n')
+    assert read_all(path) == ([['x, y', 'line\nbreak'], ['1', '2']], None)
+    assert read_all(path, header=False)[0][0] == ['a', 'b']
+
+
+def test_converts_typed_columns(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('3,2024-02-29,1.5\n-1,2000-01-01,2\n')
+    rows, error = read_all(path, header=False, column_types=('int', 'date', 'float'))
+    assert error is None
+    assert rows == [[3, datetime.date(2024, 2, 29), 1.5], [-1, datetime.date(2000, 1, 1), 2.0]]
+
+
+def test_wrong_number_of_values(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('a,b\n1,2\n3\n4,5\n')
+    rows, error = read_all(path)
+    assert rows == [['1', '2']]
+    assert isinstance(error, ValueError) and 'Line 3' in str(error)
+
+
+def test_value_that_cannot_be_converted(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('1,a\n2,b\nthree,c\n')
+    rows, error = read_all(path, header=False, column_types=('int', None))
+    assert rows == [[1, 'a'], [2, 'b']]
+    assert isinstance(error, ValueError) and str(error).startswith('Line 3 of the file')
+
+
+def test_stops_when_cancelled(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text(''.join(f'{n},{n}\n' for n in range(100)))
+    chunks = queue.Queue()
+    stop = threading.Event()
+    stop.set()
+    file = open(path, newline='')
+    _read_csv(file, False, [None, None], chunks, stop, chunk_size=10)
+    assert chunks.empty()
+    assert file.closed
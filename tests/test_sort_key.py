@@ -0,0 +1,31 @@
+import datetime
+import math
+
+from gooeypie.widgets import _sort_key
+
+
+def test_numbers_sort_numerically():
+    assert sorted(['10', '9', '-1.5', '.5', '1e2'], key=_sort_key) == ['-1.5', '.5', '9', '10', '1e2']
+    assert sorted([10, 9.5, '9', 2], key=_sort_key) == [2, '9', 9.5, 10]
+
+
+def test_text_sorts_naturally_ignoring_case():
+    assert sorted(['file10', 'File2', 'file1'], key=_sort_key) == ['file1', 'File2', 'file10']
+
+
+def test_only_plain_numbers_in_text_are_numbers():
+    values = ['3', 'nan', '1', 'inf', '1_000', '2']
+    assert sorted(values, key=_sort_key) == ['1', '2', '3', '1_000', 'inf', 'nan']
+
+
+def test_nan_sorts_after_numbers():
+    values = [3, math.nan, 1, math.inf, 2, math.nan, 0]
+    result = sorted(values, key=_sort_key)
+    assert result[:5] == [0, 1, 2, 3, math.inf]
+    assert all(math.isnan(value) for value in result[5:])
+
+
+def test_types_are_grouped():
+    date = datetime.date(2024, 1, 1)
+    values = [None, 'b', date, 2, ('a',), '1']
+    assert sorted(values, key=_sort_key) == ['1', 2, 'b', date, ('a',), None]
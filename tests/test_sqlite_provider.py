@@ -0,0 +1,105 @@
+import sqlite3
+
+import pytest
+
+from gooeypie.widgets import SQLiteProvider, _ProviderRows
+
+NAMES = ['apple', 'Banana', 'cherry', None, 'apple', 'date', 'Apple', None, 'banana', 'elder%berry', 'fig_tree']
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / 'data.db')
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE fruit (name TEXT, size INTEGER, "odd ""column""" TEXT)')
+    rows = [(NAMES[n % len(NAMES)], n % 7, f'row {n}') for n in range(500)]
+    connection.executemany('INSERT INTO fruit VALUES (?, ?, ?)', rows)
+    connection.execute('CREATE VIEW fruit_view AS SELECT * FROM fruit')
+    connection.commit()
+    connection.close()
+    return path
+
+
+def fetch_pages(provider, page_size):
+    """Fetches every row a page at a time, in order, which lets the provider page using the last row of each page"""
+    rows = []
+    for start in range(0, provider.count(), page_size):
+        rows.extend(provider.fetch(start, page_size))
+    return rows
+
+
+def test_checks_table_and_columns(database):
+    with pytest.raises(ValueError):
+        SQLiteProvider(database, 'missing', ['name'])
+    with pytest.raises(ValueError):
+        SQLiteProvider(database, 'fruit', ['name', 'colour'])
+    SQLiteProvider(database, 'fruit', ['name', 'odd "column"'])
+
+
+def test_fetches_rows_in_original_order(database):
+    provider = SQLiteProvider(database, 'fruit', ['name', 'size'])
+    assert provider.count() == 500
+    assert provider.fetch(0, 3) == [['apple', 0], ['Banana', 1], ['cherry', 2]]
+    assert provider.fetch(498, 10) == [[NAMES[498 % len(NAMES)], 498 % 7], [NAMES[499 % len(NAMES)], 499 % 7]]
+
+
+@pytest.mark.parametrize('columns', [[(0, False)], [(0, True)], [(1, True), (0, False)], [(0, True), (2, False)]])
+def test_keyset_pages_match_offset_pages(database, columns):
+    provider = SQLiteProvider(database, 'fruit', ['name', 'size', 'odd "column"'])
+    provider.sort(columns)
+    everything = provider.fetch(0, 1000)
+    assert len(everything) == 500
+
+    provider.sort(columns)
+    assert fetch_pages(provider, 37) == everything
+    # The last row of each page was kept, so each page after the first was found from the one before it
+    assert sorted(provider._query[3]) == list(range(37, 500, 37)) + [500]
+
+
+def test_sort_ignores_case_and_puts_nulls_first(database):
+    provider = SQLiteProvider(database, 'fruit', ['name'])
+    provider.sort([(0, False)])
+    names = [row[0] for row in fetch_pages(provider, 50)]
+    assert names[:names.count(None)] == [None] * names.count(None)
+    present = [name for name in names if name is not None]
+    assert present == sorted(present, key=str.casefold)
+
+    provider.sort([(0, True)])
+    names = [row[0] for row in fetch_pages(provider, 50)]
+    assert names[len(names) - names.count(None):] == [None] * names.count(None)
+
+
+def test_filter(database):
+    provider = SQLiteProvider(database, 'fruit', ['name', 'odd "column"'])
+    provider.filter('APPLE')
+    assert provider.count() == 3 * 46 - 1
+    assert all(row[0].casefold() == 'apple' for row in provider.fetch(0, 1000))
+
+    provider.filter('apple row 1', 1)
+    assert provider.count() == 0
+    provider.filter('row 1', 1)
+    assert provider.count() == sum('1' in str(n) for n in range(500))
+
+    # The wildcards of LIKE are matched as plain characters
+    provider.filter('fig_tree')
+    assert provider.count() == 45
+    provider.filter('r_y')
+    assert provider.count() == 0
+    provider.filter(None)
+    assert provider.count() == 500
+
+
+def test_view_is_paged_with_offsets(database):
+    provider = SQLiteProvider(database, 'fruit_view', ['name', 'size'])
+    provider.sort([(0, False)])
+    everything = provider.fetch(0, 1000)
+    assert fetch_pages(provider, 30) == everything
+    assert provider._query[3] == {}
+
+
+def test_provider_rows(database):
+    provider = SQLiteProvider(database, 'fruit', ['name', 'size'])
+    rows = _ProviderRows(provider)
+    assert len(rows) == 500
+    assert rows[0] == ['apple', 0]
+    assert rows.get_rows([1, 2]) == [['Banana', 1], ['cherry', 2]]
@@ -0,0 +1,109 @@
+import sqlite3
+import time
+
+import pytest
+
+import gooeypie as gp
+
+
+def run_until(app, condition, timeout=10):
+    """Processes events, including calls scheduled with after(), until the condition is true"""
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            raise AssertionError('timed out')
+        app._root.update()
+        time.sleep(0.005)
+
+
+def shown_rows(table):
+    """Returns the rows shown in the treeview, or the rows that can be scrolled through in virtual mode"""
+    if table.virtual:
+        return [table._rows[row_id] for row_id in table._visible_order()]
+    return [table._rows[int(item)] for item in table._treeview.get_children()]
+
+
+@pytest.mark.parametrize('virtual', [False, True])
+def test_load_csv_larger_than_max_rows(app, tmp_path, virtual):
+    path = tmp_path / 'data.csv'
+    path.write_text('number,name\n' + ''.join(f'{n},row {n}\n' for n in range(5000)))
+    table = gp.Table(app, ['Number', 'Name'])
+    table.virtual = virtual
+    table.max_rows = 100
+    finished = []
+    table.load_csv(str(path), complete=lambda: finished.append(None), error=finished.append)
+    run_until(app, lambda: finished and not table._load_id)
+
+    assert finished == [None]
+    assert [row[0] for row in table.data] == [str(n) for n in range(4900, 5000)]
+    assert shown_rows(table) == table.data
+
+
+@pytest.mark.parametrize('virtual', [False, True])
+def test_filter_kept_when_data_replaced(app, virtual):
+    table = gp.Table(app, ['Name', 'Colour'])
+    table.virtual = virtual
+    table.data = [['apple', 'red'], ['banana', 'yellow']]
+    table.filter('yellow')
+    table.data = [['lemon', 'yellow'], ['cherry', 'red'], ['corn', 'yellow']]
+    run_until(app, lambda: not table._load_id)
+    assert shown_rows(table) == [['lemon', 'yellow'], ['corn', 'yellow']]
+    table.select_row(2)
+    assert table.selected == ['corn', 'yellow']
+
+
+def test_filter_kept_when_virtual_mode_changes(app):
+    table = gp.Table(app, ['Name', 'Colour'])
+    table.data = [['lemon', 'yellow'], ['cherry', 'red'], ['corn', 'yellow']]
+    table.filter('yellow')
+    table.virtual = True
+    assert shown_rows(table) == [['lemon', 'yellow'], ['corn', 'yellow']]
+    table.virtual = False
+    run_until(app, lambda: not table._load_id)
+    assert shown_rows(table) == [['lemon', 'yellow'], ['corn', 'yellow']]
+
+
+@pytest.mark.parametrize('filtered', [False, True])
+def test_positions_after_changes_in_the_middle(app, filtered):
+    table = gp.Table(app, ['Name'])
+    table.data = [[f'row {n}'] for n in range(10)]
+    if filtered:
+        table.filter('row')
+    table.max_rows = 9  # Removes the first row, which shifts the positions of the rest
+    table.add_row_at(3, ['row 100'])
+    table.remove_row(6)
+    table.add_row_to_top(['row 200'])
+    assert [table._rows[row_id][0] for row_id in table._order] == [
+        'row 200', 'row 2', 'row 3', 'row 100', 'row 4', 'row 5', 'row 6', 'row 8', 'row 9']
+    assert [table._position(row_id) for row_id in table._order] == list(range(9))
+    assert [table._visible_position(row_id) for row_id in table._order] == list(range(9))
+
+
+def first_row_shown(table):
+    """Returns the value in the first column of the first row drawn in virtual mode"""
+    return table._treeview.item(table._virtual_items[0], 'values')[0]
+
+
+@pytest.mark.parametrize('provider', [False, True])
+def test_filter_and_sort_show_first_row(app, tmp_path, provider):
+    table = gp.Table(app, ['Name'])
+    if provider:
+        path = str(tmp_path / 'data.db')
+        connection = sqlite3.connect(path)
+        connection.execute('CREATE TABLE items (name TEXT)')
+        connection.executemany('INSERT INTO items VALUES (?)', [(f'item {n}',) for n in range(1000)])
+        connection.commit()
+        connection.close()
+        table.data_provider = gp.SQLiteProvider(path, 'items', ['name'])
+    else:
+        table.virtual = True
+        table.data = [[f'item {n}'] for n in range(1000)]
+
+    table._virtual_scroll_to(500)
+    table.filter('item 99')  # 11 rows, which is more than a page
+    assert first_row_shown(table) == 'item 99'
+
+    table.filter(None)
+    table._virtual_scroll_to(500)
+    table.sort_by((0, 'descending'))
+    assert first_row_shown(table) == 'item 999'
@@ -1,5 +1,8 @@
 import gooeypie as gp
+import logging
 import random
+import threading
+import time
 
 lorem_text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum".lower()
 
@@ -67,6 +70,55 @@ def toggle_state(event):
         log.prepend_line('Textbox disabled')
 
 
+def toggle_log_mode(event):
+    textbox.log_mode = log_mode_chk.checked
+    log.prepend_line(f'Log mode set to {textbox.log_mode}')
+
+
+def set_max_lines(event):
+    textbox.max_lines = int(max_lines_inp.text) if max_lines_inp.text else None
+    log.prepend_line(f'Maximum lines set to {textbox.max_lines}')
+
+
+def log_from_threads(event):
+    """Logs messages from several threads at once, through a logging handler that writes to the textbox"""
+    def log_messages():
+        for number in range(1000):
+            logger.info(f'Message {number}')
+            time.sleep(0.001)
+
+    log_mode_chk.checked = True
+    textbox.log_mode = True
+    for _ in range(4):
+        threading.Thread(target=log_messages, daemon=True).start()
+
+
+def view_file(event):
+    try:
+        textbox.view_file(file_path_inp.text)
+    except (OSError, gp.GooeyPieError) as error:
+        log.prepend_line(f'Could not view file: {error}')
+        return
+    log.prepend_line(f'Viewing {file_path_inp.text}')
+
+
+def close_file(event):
+    textbox.close_file()
+    log.prepend_line('Closed file')
+
+
+def toggle_follow(event):
+    textbox.follow = follow_chk.checked
+
+
+def go_to_line(event):
+    textbox.go_to_line(int(go_to_line_inp.text))
+
+
+def get_line_count(event):
+    log.prepend_line(f'Lines found so far: {textbox.line_count}')
+
+
 app = gp.GooeyPieApp('Textbox Tests')
 
 test_cont = gp.LabelContainer(app, 'Tests')
@@ -122,15 +174,59 @@ misc_buttons_cont.add(clear_btn, 1, 4)
 misc_buttons_cont.add(scroll_start_btn, 1, 5)
 misc_buttons_cont.add(scroll_end_btn, 1, 6)
 
+# Log mode
+log_mode_cont = gp.Container(test_cont)
+
+log_mode_chk = gp.Checkbox(log_mode_cont, 'Log mode')
+log_mode_chk.add_event_listener('change', toggle_log_mode)
+max_lines_btn = gp.Button(log_mode_cont, 'Set max lines', set_max_lines)
+max_lines_inp = gp.Input(log_mode_cont)
+max_lines_inp.width = 8
+max_lines_inp.text = 500
+log_threads_btn = gp.Button(log_mode_cont, 'Log from threads', log_from_threads)
+
+log_mode_cont.set_grid(1, 4)
+log_mode_cont.add(log_mode_chk, 1, 1, valign='middle')
+log_mode_cont.add(max_lines_btn, 1, 2)
+log_mode_cont.add(max_lines_inp, 1, 3, valign='middle')
+log_mode_cont.add(log_threads_btn, 1, 4)
+
+# File viewer
+file_cont = gp.Container(test_cont)
+
+file_path_inp = gp.Input(file_cont)
+file_path_inp.text = __file__
+view_file_btn = gp.Button(file_cont, 'View file', view_file)
+close_file_btn = gp.Button(file_cont, 'Close file', close_file)
+follow_chk = gp.Checkbox(file_cont, 'Follow')
+follow_chk.add_event_listener('change', toggle_follow)
+go_to_line_btn = gp.Button(file_cont, 'Go to line', go_to_line)
+go_to_line_inp = gp.Input(file_cont)
+go_to_line_inp.width = 8
+go_to_line_inp.text = 1
+line_count_btn = gp.Button(file_cont, 'Line count', get_line_count)
+
+file_cont.set_grid(2, 4)
+file_cont.set_column_weights(1, 0, 0, 0)
+file_cont.add(file_path_inp, 1, 1, valign='middle', fill=True)
+file_cont.add(view_file_btn, 1, 2)
+file_cont.add(close_file_btn, 1, 3)
+file_cont.add(follow_chk, 1, 4, valign='middle')
+file_cont.add(go_to_line_btn, 2, 2)
+file_cont.add(go_to_line_inp, 2, 3, valign='middle')
+file_cont.add(line_count_btn, 2, 4)
+
 # Log
 log = gp.Textbox(test_cont)
 
 # Test container
-test_cont.set_grid(4, 1)
+test_cont.set_grid(6, 1)
 test_cont.add(insert_text_cont, 1, 1, fill=True)
 test_cont.add(insert_buttons_cont, 2, 1, fill=True)
 test_cont.add(misc_buttons_cont, 3, 1)
-test_cont.add(log, 4, 1, fill=True)
+test_cont.add(log_mode_cont, 4, 1, fill=True)
+test_cont.add(file_cont, 5, 1, fill=True)
+test_cont.add(log, 6, 1, fill=True)
 
 # New textbox
 textbox = gp.Textbox(textbox_cont)
@@ -144,6 +240,10 @@ for event_name in standard_events:
 
 textbox.add_event_listener('change', events_testing)
 
+logger = logging.getLogger('textbox-test')
+logger.setLevel(logging.INFO)
+logger.addHandler(textbox.log_handler(log_format='%(asctime)s %(threadName)s %(message)s'))
+
 scrollbar_visibility_dd = gp.Dropdown(textbox_cont, ['auto', 'visible', 'hidden'])
 scrollbar_visibility_dd.selected_index = 0
 scrollbar_visibility_dd.add_event_listener('select', set_visibility)